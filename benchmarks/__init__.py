@@ -0,0 +1,8 @@
+"""
+Created on 2026-10-19
+
+Offline benchmark suite for pyMogwai
+
+run with:
+    python -m benchmarks --help
+"""
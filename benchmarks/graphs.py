@@ -0,0 +1,83 @@
+"""
+Created on 2026-10-19
+
+Graph fixtures for the benchmark suite - all of them are available offline
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from mogwai.core import MogwaiGraph, MogwaiGraphConfig
+from mogwai.examples.generators import GraphGenerator, PropertySpec
+from mogwai.parser.graphml_converter import graphml_to_mogwaigraph
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(__file__), "..", "mogwai_examples")
+
+
+@dataclass
+class GraphFixture:
+    """
+    a named benchmark graph
+
+    Attributes:
+        name: the name used on the command line and in the results
+        load: loads the graph, synthetic graphs get the requested size and seed
+        label: a vertex label to filter on
+        key: a numeric vertex property to aggregate, None if there is none
+    """
+
+    name: str
+    load: Callable[[int, int], MogwaiGraph]
+    label: str
+    key: Optional[str] = None
+
+
+def load_air_routes_small(
+    size: int = None, seed: int = None, config: MogwaiGraphConfig = None
+) -> MogwaiGraph:
+    """load the bundled small air routes graph"""
+    return graphml_to_mogwaigraph(
+        os.path.join(EXAMPLES_PATH, "air-routes-small-latest.graphml"),
+        node_label_key="labelV",
+        edge_label_key="labelE",
+        node_name_key=lambda x: (
+            x.pop("code") if x["type"] == "airport" else x.pop("desc")
+        ),
+        config=config,
+    )
+
+
+def scale_free(
+    size: int = 1000, seed: int = 42, config: MogwaiGraphConfig = None
+) -> MogwaiGraph:
+    """
+    create a power-law graph with the given number of vertices and
+    three times as many edges
+
+    Vertices are spread over three labels and carry a numeric 'weight',
+    edges are labelled 'link'.
+    """
+    generator = GraphGenerator(
+        size,
+        3 * size,
+        degree_distribution="power-law",
+        vertex_labels=["Person", "Software", "Place"],
+        edge_labels=["link"],
+        vertex_properties=[PropertySpec("weight", low=0, high=1000)],
+        seed=seed,
+    )
+    return generator.generate(config)
+
+
+FIXTURES: Dict[str, GraphFixture] = {
+    fixture.name: fixture
+    for fixture in [
+        GraphFixture(
+            "modern", lambda size, seed: MogwaiGraph.modern(), "Person", "age"
+        ),
+        GraphFixture("crew", lambda size, seed: MogwaiGraph.crew(), "Person"),
+        GraphFixture("air-routes-small", load_air_routes_small, "airport", "runways"),
+        GraphFixture("scale-free", scale_free, "Person", "weight"),
+    ]
+}
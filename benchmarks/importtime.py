@@ -0,0 +1,150 @@
+"""
+Created on 2026-10-19
+
+Import time regression benchmark based on `python -X importtime`.
+
+run with:
+    python -m benchmarks.importtime
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+# the statements to measure, the time budget of their imports in seconds
+# and the modules they must not import
+IMPORT_BUDGETS = {
+    "import mogwai.core": (0.05, ["networkx", "asyncio"]),
+    "from mogwai.core import MogwaiGraph, Traversal": (
+        0.5,
+        [
+            "asyncio",
+            "numpy",
+            "pandas",
+            "rdflib",
+            "mogwai.core.computer",
+            "mogwai.core.steps.map_steps",
+            "mogwai.parser",
+            "mogwai.schema",
+        ],
+    ),
+    "from mogwai.core.steps.statics import out": (
+        0.5,
+        [
+            "asyncio",
+            "numpy",
+            "mogwai.core.steps.map_steps",
+            "mogwai.core.steps.path_steps",
+        ],
+    ),
+    "import mogwai.parser, mogwai.schema": (
+        0.05,
+        ["networkx", "rdflib", "pandas", "openpyxl", "pypdf"],
+    ),
+}
+
+
+@dataclass
+class ImportTime:
+    """
+    the import time of a statement
+
+    Attributes:
+        statement: the measured import statement
+        seconds: the cumulative import time of the imported modules, the minimum of the runs
+        modules: the modules imported by the statement
+    """
+
+    statement: str
+    seconds: float
+    modules: List[str] = field(default_factory=list)
+
+
+def measure(statement: str, repeat: int = 3) -> ImportTime:
+    """
+    run the statement `repeat` times in a fresh interpreter with `-X importtime`
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    # the modules imported at interpreter startup are not counted
+    startup = set(
+        subprocess.run(
+            [sys.executable, "-c", "import sys; print(*sys.modules)"],
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout.split()
+    )
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"`{statement}` failed:\n{process.stderr}")
+        seconds, modules = 0.0, []
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            module = name.strip()
+            if module in startup:
+                continue
+            modules.append(module)
+            if len(name) - len(name.lstrip()) == 1:
+                # a top level import of the statement
+                seconds += int(cumulative) / 1e6
+        if best is None or seconds < best.seconds:
+            best = ImportTime(statement, seconds, modules)
+    return best
+
+
+def check(result: ImportTime, budget: float, forbidden: List[str]) -> List[str]:
+    """
+    the violations of the budget and the forbidden modules
+    """
+    violations = []
+    if result.seconds > budget:
+        violations.append(
+            f"`{result.statement}` took {result.seconds * 1000:.1f} ms (budget {budget * 1000:.1f} ms)"
+        )
+    for module in forbidden:
+        if module in result.modules:
+            violations.append(f"`{result.statement}` imported {module}")
+    return violations
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="pyMogwai import time benchmark")
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=3, help="number of repetitions"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="list the imported modules"
+    )
+    args = parser.parse_args(argv)
+    report: Dict[str, Dict] = {}
+    violations = []
+    for statement, (budget, forbidden) in IMPORT_BUDGETS.items():
+        result = measure(statement, args.repeat)
+        violations += check(result, budget, forbidden)
+        report[statement] = (
+            asdict(result) if args.verbose else {"seconds": result.seconds}
+        )
+        report[statement]["budget"] = budget
+    print(json.dumps(report, indent=2))
+    for violation in violations:
+        print(f"regression: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
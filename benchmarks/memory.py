@@ -0,0 +1,143 @@
+"""
+Created on 2026-10-19
+
+Memory benchmark: the bytes per vertex and per edge of the benchmark graphs
+for different graph configurations.
+
+run with:
+    python -m benchmarks.memory
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Set
+
+from benchmarks.graphs import load_air_routes_small, scale_free
+from mogwai.core import MogwaiGraph, MogwaiGraphConfig
+
+
+def scale_free_generated_ids(
+    size: int = 1000, seed: int = 42, config: MogwaiGraphConfig = None
+) -> MogwaiGraph:
+    """
+    the scale-free graph inserted node by node, so that the graph generates
+    the vertex ids (the generator uses integer ids)
+    """
+    generated = scale_free(size, seed)
+    graph = MogwaiGraph(config=config)
+    ids = {
+        node_id: graph.add_labeled_node(
+            data["labels"],
+            data["name"],
+            properties={k: v for k, v in data.items() if k not in ("labels", "name")},
+        )
+        for node_id, data in generated.nodes(data=True)
+    }
+    for src, dst, data in generated.edges(data=True):
+        graph.add_labeled_edge(ids[src], ids[dst], data["labels"])
+    return graph
+
+
+# the graphs that can be loaded with a given configuration
+GRAPHS = {
+    "air-routes-small": load_air_routes_small,
+    "scale-free": scale_free,
+    "scale-free-generated-ids": scale_free_generated_ids,
+}
+
+CONFIGS = {
+    "default": dict(intern_strings=False),
+    "interned": dict(),
+    "int-ids": dict(int_ids=True),
+}
+
+
+@dataclass
+class MemoryResult:
+    """
+    the memory used by a graph
+
+    Attributes:
+        graph: the name of the graph
+        config: the name of the graph configuration
+        vertices: the number of vertices
+        edges: the number of edges
+        bytes_per_vertex: the bytes of the vertex ids, the vertex data and their keys
+        bytes_per_edge: the bytes of the adjacency dicts and the edge data
+    """
+
+    graph: str
+    config: str
+    vertices: int
+    edges: int
+    bytes_per_vertex: float
+    bytes_per_edge: float
+
+
+def deep_size(obj: Any, seen: Set[int]) -> int:
+    """
+    the size of obj and the dicts, collections and strings it holds;
+    objects in `seen` (e.g. shared strings) are counted once
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_size(key, seen) + deep_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_size(item, seen)
+    return size
+
+
+def measure(name: str, graph: MogwaiGraph, config: str) -> MemoryResult:
+    seen: Set[int] = set()
+    vertex_bytes = deep_size(graph._node, seen)
+    edge_bytes = deep_size(graph._succ, seen) + deep_size(graph._pred, seen)
+    n, m = graph.number_of_nodes(), graph.number_of_edges()
+    return MemoryResult(
+        name, config, n, m, vertex_bytes / max(n, 1), edge_bytes / max(m, 1)
+    )
+
+
+def run(graphs: List[str], size: int = 10_000, seed: int = 42) -> List[MemoryResult]:
+    results = []
+    for name in graphs:
+        for config_name, settings in CONFIGS.items():
+            graph = GRAPHS[name](size, seed, MogwaiGraphConfig(**settings))
+            results.append(measure(name, graph, config_name))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="pyMogwai memory benchmark")
+    parser.add_argument(
+        "-g",
+        "--graphs",
+        nargs="+",
+        choices=list(GRAPHS),
+        default=list(GRAPHS),
+        help="graphs to measure [default: %(default)s]",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=10_000,
+        help="number of vertices of synthetic graphs [default: %(default)s]",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args(argv)
+    report: Dict[str, Any] = {
+        "results": [asdict(result) for result in run(args.graphs, args.size, args.seed)]
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Created on 2026-10-19
+
+Benchmark definitions and runner, results are emitted as JSON so that
+they can be compared across commits.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.graphs import FIXTURES, GraphFixture
+from mogwai.core.steps.statics import out
+from mogwai.core.traversal import MogwaiGraphTraversalSource, Traversal
+from mogwai.version import Version
+
+
+@dataclass
+class Benchmark:
+    """
+    a single benchmark
+
+    Attributes:
+        name: the name of the benchmark
+        group: what is measured e.g. 'scan' or 'k-hop'
+        query: creates a fresh traversal for the given source and fixture,
+            None for the load time benchmark
+    """
+
+    name: str
+    group: str
+    query: Optional[Callable[[MogwaiGraphTraversalSource, GraphFixture], Traversal]]
+    needs_key: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    timings of a benchmark in seconds
+    """
+
+    name: str
+    group: str
+    graph: str
+    repeat: int
+    min: float
+    mean: float
+    max: float
+    stdev: float
+    result_size: int
+    times: List[float] = field(default_factory=list)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("load", "load", None),
+    Benchmark("scan_vertices", "scan", lambda g, f: g.V().count().next()),
+    Benchmark("scan_edges", "scan", lambda g, f: g.E().count().next()),
+    Benchmark(
+        "scan_label", "scan", lambda g, f: g.V().has_label(f.label).count().next()
+    ),
+    Benchmark("two_hop", "k-hop", lambda g, f: g.V().out().out().count().next()),
+    Benchmark(
+        "three_hop",
+        "k-hop",
+        lambda g, f: g.V().limit(3).out().out().out().count().next(),
+    ),
+    Benchmark(
+        "repeat_simple_path",
+        "repeat",
+        lambda g, f: g.V()
+        .limit(5)
+        .repeat(out().simple_path(), times=2)
+        .path()
+        .to_list(),
+    ),
+    Benchmark(
+        "order_limit",
+        "order",
+        lambda g, f: g.V()
+        .order(by="name", desc=True)
+        .limit(10)
+        .values("name")
+        .to_list(),
+    ),
+    Benchmark("dedup", "dedup", lambda g, f: g.V().out().dedup().to_list()),
+    Benchmark(
+        "mean",
+        "aggregation",
+        lambda g, f: g.V().has_label(f.label).values(f.key).mean().next(),
+        needs_key=True,
+    ),
+    Benchmark(
+        "max",
+        "aggregation",
+        lambda g, f: g.V().has_label(f.label).values(f.key).max_().next(),
+        needs_key=True,
+    ),
+]
+
+
+def result_size(result: Any) -> int:
+    """the number of results - 1 for scalars"""
+    if isinstance(result, (list, tuple, set, dict)):
+        return len(result)
+    return 1
+
+
+class BenchmarkRunner:
+    """
+    run the benchmarks on the selected graphs
+    """
+
+    def __init__(
+        self,
+        graphs: List[str] = None,
+        size: int = 1000,
+        seed: int = 42,
+        repeat: int = 5,
+        select: str = None,
+        verbose: bool = False,
+        batch_size: int = None,
+    ):
+        self.fixtures = [FIXTURES[name] for name in graphs or FIXTURES]
+        self.size = size
+        self.seed = seed
+        self.repeat = repeat
+        self.select = select
+        self.verbose = verbose
+        self.batch_size = batch_size
+
+    def benchmarks(self, fixture: GraphFixture) -> List[Benchmark]:
+        return [
+            benchmark
+            for benchmark in BENCHMARKS
+            if (not benchmark.needs_key or fixture.key is not None)
+            and (self.select is None or self.select in benchmark.name)
+        ]
+
+    def measure(self, func: Callable[[], Any]) -> tuple:
+        """time func repeat times after a single warm up run"""
+        result = func()
+        times = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return times, result
+
+    def run_benchmark(
+        self, benchmark: Benchmark, fixture: GraphFixture, g: MogwaiGraphTraversalSource
+    ) -> BenchmarkResult:
+        if benchmark.query is None:
+            times, graph = self.measure(lambda: fixture.load(self.size, self.seed))
+            size = len(graph.nodes) + len(graph.edges)
+        else:
+            times, result = self.measure(lambda: benchmark.query(g, fixture).run())
+            size = result_size(result)
+        bench_result = BenchmarkResult(
+            name=benchmark.name,
+            group=benchmark.group,
+            graph=fixture.name,
+            repeat=self.repeat,
+            min=min(times),
+            mean=statistics.mean(times),
+            max=max(times),
+            stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+            result_size=size,
+            times=times,
+        )
+        if self.verbose:
+            print(
+                f"{fixture.name:<18} {benchmark.name:<20} "
+                f"{bench_result.mean*1000:10.3f} ms ({size} results)",
+                file=sys.stderr,
+            )
+        return bench_result
+
+    def run(self) -> List[BenchmarkResult]:
+        results = []
+        for fixture in self.fixtures:
+            g = MogwaiGraphTraversalSource(
+                fixture.load(self.size, self.seed), batch_size=self.batch_size
+            )
+            for benchmark in self.benchmarks(fixture):
+                results.append(self.run_benchmark(benchmark, fixture, g))
+        return results
+
+    def meta(self) -> Dict[str, Any]:
+        """describe the environment the benchmarks ran in"""
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "commit": commit,
+            "version": Version.version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "size": self.size,
+            "seed": self.seed,
+            "repeat": self.repeat,
+            "batch_size": self.batch_size,
+        }
+
+    def to_json(self, results: List[BenchmarkResult]) -> Dict[str, Any]:
+        return {"meta": self.meta(), "results": [asdict(r) for r in results]}
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 1.25
+) -> List[str]:
+    """
+    compare two JSON results and return the benchmarks whose mean time
+    grew by more than the given factor
+    """
+    before = {(r["graph"], r["name"]): r["mean"] for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        key = (r["graph"], r["name"])
+        if key in before and before[key] > 0:
+            ratio = r["mean"] / before[key]
+            if ratio > threshold:
+                regressions.append(f"{key[0]}/{key[1]}: {ratio:.2f}x slower")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="pyMogwai benchmarks")
+    parser.add_argument(
+        "-g",
+        "--graphs",
+        nargs="+",
+        choices=list(FIXTURES),
+        default=list(FIXTURES),
+        help="graphs to benchmark [default: %(default)s]",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=1000,
+        help="number of vertices of synthetic graphs [default: %(default)s]",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="number of repetitions"
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        help="run the traversals in batch mode with this batch size",
+    )
+    parser.add_argument("-k", "--select", help="only run benchmarks containing this")
+    parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    parser.add_argument(
+        "-c", "--compare", help="JSON file of an earlier run to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slow down factor reported as regression [default: %(default)s]",
+    )
+    args = parser.parse_args(argv)
+    runner = BenchmarkRunner(
+        graphs=args.graphs,
+        size=args.size,
+        seed=args.seed,
+        repeat=args.repeat,
+        select=args.select,
+        verbose=True,
+        batch_size=args.batch_size,
+    )
+    report = runner.to_json(runner.run())
+    if args.output:
+        with open(args.output, "w") as json_file:
+            json.dump(report, json_file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        with open(args.compare) as json_file:
+            regressions = compare(json.load(json_file), report, args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
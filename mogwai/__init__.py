@@ -1 +1,9 @@
 __version__ = "0.1.1"
+
+from mogwai.utils.lazy_import import lazy_attributes
+
+# the subpackages are imported on first access, e.g. mogwai.core after `import mogwai`
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {"core": None, "parser": None, "schema": None, "utils": None, "web": None},
+)
@@ -1,2 +1,13 @@
 USE_MULTIPROCESSING = True
 DEFAULT_ITERATION_DEPTH = 1000
+# number of results computed between two returns to the event loop in Traversal.iter_async
+ASYNC_CHUNK_SIZE = 1024
+# default number of results kept by a ResultCache
+RESULT_CACHE_SIZE = 128
+# number of events kept by the ring buffer of a traced traversal, see Traversal.with_trace
+TRACE_BUFFER_SIZE = 10_000
+# longest string property value interned by a MogwaiGraph, see MogwaiGraphConfig.intern_strings
+INTERN_MAX_LENGTH = 32
+# resource limits for queries entered in the web ui
+WEB_QUERY_TIMEOUT = 30.0
+WEB_QUERY_MAX_TRAVERSERS = 1_000_000
@@ -1,3 +1,20 @@
-from .mogwaigraph import MogwaiGraph, MogwaiGraphConfig
-from .traversal import AnonymousTraversal, Traversal
-from .traverser import Traverser
+from typing import TYPE_CHECKING
+
+from mogwai.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .mogwaigraph import MogwaiGraph, MogwaiGraphConfig
+    from .traversal import AnonymousTraversal, Traversal
+    from .traverser import Traverser
+
+# imported on first access, so that e.g. `import mogwai.core.exceptions` does not import networkx
+_LAZY_ATTRIBUTES = {
+    "MogwaiGraph": ".mogwaigraph",
+    "MogwaiGraphConfig": ".mogwaigraph",
+    "AnonymousTraversal": ".traversal",
+    "Traversal": ".traversal",
+    "Traverser": ".traverser",
+}
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+# `from package import *` imports the lazy attributes
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -0,0 +1,168 @@
+"""
+Created on 2026-10-19
+
+Resource budgets for traversals: a wall-clock timeout, a maximum number of
+traversers and a maximum path length, plus cooperative cancellation.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from mogwai.core.exceptions import (
+    TraversalBudgetExceeded,
+    TraversalCancelled,
+    TraversalTimeout,
+)
+
+if TYPE_CHECKING:
+    from mogwai.core.steps.base_steps import Step
+
+
+class CancellationToken:
+    """
+    A token that can be used to cancel a running traversal from another thread.
+    The traversal checks the token cooperatively while traversers flow through its steps.
+    A token with a parent is also cancelled when its parent is cancelled.
+    """
+
+    def __init__(self, parent: Optional["CancellationToken"] = None):
+        self._event = threading.Event()
+        self.parent = parent
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+
+@dataclass
+class TraversalBudget:
+    """
+    Limits for a single run of a traversal. `None` means unlimited.
+
+    Attributes:
+        timeout (float): maximum wall-clock time in seconds
+        max_traversers (int): maximum number of traversers produced by all steps together
+            (including the steps of anonymous traversals)
+        max_path_length (int): maximum length of the path of a traverser, only checked if paths are tracked
+        token (CancellationToken): token to cancel the traversal cooperatively
+        check_interval (int): number of traversers between two checks of the clock and the token
+    """
+
+    timeout: Optional[float] = None
+    max_traversers: Optional[int] = None
+    max_path_length: Optional[int] = None
+    token: Optional[CancellationToken] = None
+    check_interval: int = 64
+
+    def monitor(self) -> "BudgetMonitor":
+        """create a monitor enforcing this budget for one run"""
+        return BudgetMonitor(self)
+
+
+class BudgetMonitor:
+    """
+    Enforces a TraversalBudget during a single run of a traversal.
+    The monitor wraps the output of every step, so the checks run
+    while the traversers are pulled through the (lazy) step pipeline.
+    """
+
+    def __init__(self, budget: TraversalBudget):
+        self.budget = budget
+        self.start_time = time.monotonic()
+        self.traversers = 0
+        self.longest_path = 0
+        self.step: "Step" = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def stats(self) -> dict:
+        """the statistics gathered so far"""
+        return {
+            "elapsed": self.elapsed,
+            "traversers": self.traversers,
+            "longest_path": self.longest_path,
+            "step": self.step.print_query() if self.step is not None else None,
+        }
+
+    def check(self):
+        """check the cancellation token and the timeout"""
+        budget = self.budget
+        if budget.token is not None and budget.token.cancelled:
+            raise TraversalCancelled(stats=self.stats())
+        if budget.timeout is not None and self.elapsed > budget.timeout:
+            raise TraversalTimeout(
+                f"Traversal timed out after {budget.timeout}s", stats=self.stats()
+            )
+
+    def _count_many(self, n: int):
+        budget = self.budget
+        self.traversers += n
+        if (
+            budget.max_traversers is not None
+            and self.traversers > budget.max_traversers
+        ):
+            raise TraversalBudgetExceeded(
+                f"Traversal produced more than {budget.max_traversers} traversers",
+                stats=self.stats(),
+            )
+
+    def _count(self, t):
+        budget = self.budget
+        self._count_many(1)
+        if budget.max_path_length is not None:
+            path = getattr(t, "path", None)
+            if path is not None:
+                length = len(path)
+                if length > self.longest_path:
+                    self.longest_path = length
+                if length > budget.max_path_length:
+                    raise TraversalBudgetExceeded(
+                        f"Traverser path is longer than {budget.max_path_length}",
+                        stats=self.stats(),
+                    )
+
+    def guard(self, traversers: Iterable, step: "Step") -> Iterable:
+        """
+        Wrap the output of `step`. Collections are checked at once,
+        generators are checked lazily while they are consumed.
+        """
+        self.step = step
+        self.check()
+        if isinstance(traversers, (list, set, tuple)):
+            for t in traversers:
+                self._count(t)
+            return traversers
+        return self._guard_generator(traversers, step)
+
+    def guard_batches(self, batches: Iterable, step: "Step") -> Iterator:
+        """
+        Wrap the output of `step` in batch mode, the checks run once per batch.
+        """
+        for batch in batches:
+            self.step = step
+            self.check()
+            if isinstance(batch, list):
+                for t in batch:
+                    self._count(t)
+            else:
+                # a TraverserBatch does not track paths
+                self._count_many(len(batch))
+            yield batch
+
+    def _guard_generator(self, traversers: Iterable, step: "Step"):
+        interval = self.budget.check_interval
+        for i, t in enumerate(traversers):
+            self._count(t)
+            if i % interval == 0:
+                self.step = step
+                self.check()
+            yield t
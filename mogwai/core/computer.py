@@ -0,0 +1,491 @@
+"""
+Created on 2026-10-19
+
+Bulk synchronous (OLAP) execution of vertex programs over a whole MogwaiGraph,
+see MogwaiGraphTraversalSource.compute
+
+Requires numpy (pip install pyMogwai[olap]).
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from mogwai.core.exceptions import QueryError
+from mogwai.core.mogwaigraph import MogwaiGraph
+
+DIRECTIONS = ("in", "out", "both")
+
+
+@dataclass
+class Adjacency:
+    """
+    the neighbors of every vertex in compressed sparse row form:
+    the neighbors of vertex i are indices[indptr[i]:indptr[i+1]]
+    and weights holds the weight of the corresponding edges (if requested)
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: Optional[np.ndarray] = None
+
+    @property
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+
+class CSRGraph:
+    """
+    An array backed snapshot of the structure of a MogwaiGraph.
+
+    Vertex i is ids[i], the adjacency of each direction is built on first use:
+    "in" holds the sources of the edges ending in a vertex,
+    "out" the targets of the edges starting in it and "both" the union.
+    """
+
+    def __init__(
+        self,
+        graph: MogwaiGraph,
+        label: str | List[str] | None = None,
+        weight: str | None = None,
+    ):
+        """
+        Args:
+            graph: the graph to take the snapshot of
+            label: only keep the edges with one of these labels
+            weight: the edge property holding the edge weights (default 1)
+        """
+        self.graph = graph
+        self.version = graph.version
+        self.ids: List[Hashable] = list(graph.nodes)
+        self.index: Dict[Hashable, int] = {v: i for i, v in enumerate(self.ids)}
+        self.labels = (
+            None if label is None else {label} if isinstance(label, str) else set(label)
+        )
+        self.weight = weight
+        self._adjacency: Dict[str, Adjacency] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _edge_ok(self, data: dict) -> bool:
+        if self.labels is None:
+            return True
+        return data.get(self.graph.config.edge_label_field) in self.labels
+
+    def _build(self, adj: dict) -> Adjacency:
+        index = self.index
+        indptr = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        indices, weights = [], []
+        for i, v in enumerate(self.ids):
+            for u, data in adj[v].items():
+                if self._edge_ok(data):
+                    indices.append(index[u])
+                    if self.weight is not None:
+                        weights.append(data.get(self.weight, 1))
+            indptr[i + 1] = len(indices)
+        return Adjacency(
+            indptr,
+            np.array(indices, dtype=np.int64),
+            None if self.weight is None else np.array(weights, dtype=np.float64),
+        )
+
+    def adjacency(self, direction: str) -> Adjacency:
+        """the (cached) adjacency of the given direction"""
+        if direction not in DIRECTIONS:
+            raise QueryError(
+                f"Invalid direction `{direction}`, expected one of {DIRECTIONS}"
+            )
+        if direction not in self._adjacency:
+            if direction == "both":
+                inward, outward = self.adjacency("in"), self.adjacency("out")
+                self._adjacency[direction] = _union(inward, outward)
+            else:
+                adj = self.graph._pred if direction == "in" else self.graph._succ
+                self._adjacency[direction] = self._build(adj)
+        return self._adjacency[direction]
+
+    def out_weights(self) -> np.ndarray:
+        """the number (or total weight) of the outgoing edges of every vertex"""
+        outward = self.adjacency("out")
+        if outward.weights is None:
+            return outward.degrees.astype(np.float64)
+        rows = np.repeat(np.arange(len(self.ids)), outward.degrees)
+        return np.bincount(rows, weights=outward.weights, minlength=len(self.ids))
+
+
+def _union(a: Adjacency, b: Adjacency) -> Adjacency:
+    """merge the neighbor lists of two adjacencies row by row"""
+    n = len(a.indptr) - 1
+    rows = np.concatenate(
+        [np.repeat(np.arange(n), a.degrees), np.repeat(np.arange(n), b.degrees)]
+    )
+    order = np.argsort(rows, kind="stable")
+    indptr = np.concatenate([[0], np.cumsum(a.degrees + b.degrees)])
+    weights = None
+    if a.weights is not None:
+        weights = np.concatenate([a.weights, b.weights])[order]
+    return Adjacency(indptr, np.concatenate([a.indices, b.indices])[order], weights)
+
+
+class VertexProgram(ABC):
+    """
+    A vertex program in the gather-apply form of bulk synchronous message passing.
+
+    In every superstep each vertex sends `message(state)` to its neighbors,
+    the messages a vertex receives from the vertices of its `direction` adjacency
+    (e.g. "in": the sources of its incoming edges) are combined by `gather`
+    and `apply` computes the new state of all vertices.
+    The state is a numpy array with one entry per vertex of the CSRGraph.
+
+    Only `gather` touches the edges, it works on a range of vertices so that
+    the supersteps can be split over the processes of a pool; the program is
+    pickled to the worker processes and must not hold a reference to the graph.
+    """
+
+    direction: str = "in"
+    # the ufunc reducing the messages of a vertex and the result for vertices without messages
+    combiner: np.ufunc = np.add
+    identity: Any = 0
+    max_iterations: int = 30
+    # the edge property weighting the messages, None for unweighted
+    weight: Optional[str] = None
+
+    @abstractmethod
+    def initial(self, graph: CSRGraph) -> np.ndarray:
+        """the state before the first superstep"""
+
+    def message(self, graph: CSRGraph, state: np.ndarray) -> np.ndarray:
+        """the message every vertex sends to its neighbors"""
+        return state
+
+    def gather(
+        self, adjacency: Adjacency, messages: np.ndarray, lo: int, hi: int
+    ) -> np.ndarray:
+        """combine the messages received by the vertices lo..hi-1"""
+        start, end = adjacency.indptr[lo], adjacency.indptr[hi]
+        values = messages[adjacency.indices[start:end]]
+        if adjacency.weights is not None:
+            values = values * adjacency.weights[start:end]
+        result = np.full(hi - lo, self.identity, dtype=values.dtype)
+        nonempty = adjacency.indptr[lo + 1 : hi + 1] > adjacency.indptr[lo:hi]
+        if values.size:
+            offsets = adjacency.indptr[lo:hi][nonempty] - start
+            result[nonempty] = self.combiner.reduceat(values, offsets)
+        return result
+
+    def apply(
+        self,
+        graph: CSRGraph,
+        state: np.ndarray,
+        gathered: np.ndarray,
+        superstep: int,
+    ) -> np.ndarray:
+        """the state after the superstep"""
+        return gathered
+
+    def converged(self, old: np.ndarray, new: np.ndarray, superstep: int) -> bool:
+        """whether the computation is done"""
+        return np.array_equal(old, new)
+
+    def result(self, graph: CSRGraph, state: np.ndarray) -> np.ndarray:
+        """the values reported for every vertex"""
+        return state
+
+
+class PageRank(VertexProgram):
+    """
+    PageRank by power iteration, equivalent to networkx.pagerank:
+    the rank of dangling vertices is spread over all vertices
+    """
+
+    direction = "in"
+
+    def __init__(
+        self,
+        alpha: float = 0.85,
+        max_iterations: int = 100,
+        tol: float = 1.0e-6,
+        weight: str | None = None,
+    ):
+        self.alpha = alpha
+        self.max_iterations = max_iterations
+        self.tol = tol
+        self.weight = weight
+        self._out = None
+
+    def initial(self, graph: CSRGraph) -> np.ndarray:
+        self._out = graph.out_weights()
+        return np.full(len(graph), 1.0 / max(len(graph), 1))
+
+    def message(self, graph: CSRGraph, state: np.ndarray) -> np.ndarray:
+        out = self._out
+        return np.divide(state, out, out=np.zeros_like(state), where=out != 0)
+
+    def apply(self, graph, state, gathered, superstep):
+        n = len(graph)
+        dangling = state[self._out == 0].sum()
+        return self.alpha * (gathered + dangling / n) + (1 - self.alpha) / n
+
+    def converged(self, old, new, superstep):
+        return np.abs(new - old).sum() < len(new) * self.tol
+
+
+class ConnectedComponents(VertexProgram):
+    """
+    weakly connected components by minimum label propagation,
+    the components are numbered in the order of their first vertex
+    """
+
+    direction = "both"
+    combiner = np.minimum
+
+    def __init__(self, max_iterations: int = 1000):
+        self.max_iterations = max_iterations
+
+    def initial(self, graph: CSRGraph) -> np.ndarray:
+        self.identity = len(graph)
+        return np.arange(len(graph))
+
+    def apply(self, graph, state, gathered, superstep):
+        return np.minimum(state, gathered)
+
+    def result(self, graph, state):
+        return _renumber(state)
+
+
+class LabelPropagation(VertexProgram):
+    """
+    community detection: every vertex adopts the label that is most frequent
+    among its neighbors and itself (ties go to the smallest label) until the
+    labels are stable; the communities are numbered in the order of their first vertex
+    """
+
+    direction = "both"
+
+    def __init__(self, max_iterations: int = 30):
+        self.max_iterations = max_iterations
+
+    def initial(self, graph: CSRGraph) -> np.ndarray:
+        return np.arange(len(graph))
+
+    def gather(self, adjacency, messages, lo, hi):
+        start, end = adjacency.indptr[lo], adjacency.indptr[hi]
+        # (vertex, label) pairs of the neighbors and the vertex itself
+        rows = np.concatenate(
+            [
+                np.repeat(np.arange(lo, hi), np.diff(adjacency.indptr[lo : hi + 1])),
+                np.arange(lo, hi),
+            ]
+        )
+        labels = np.concatenate(
+            [messages[adjacency.indices[start:end]], messages[lo:hi]]
+        )
+        n = len(messages)
+        pairs, counts = np.unique(rows * n + labels, return_counts=True)
+        rows, labels = pairs // n, pairs % n
+        # per vertex: highest count first, then smallest label
+        order = np.lexsort((labels, -counts, rows))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = rows[order][1:] != rows[order][:-1]
+        return labels[order][first]
+
+    def result(self, graph, state):
+        return _renumber(state)
+
+
+class DegreeCentrality(VertexProgram):
+    """
+    the degree of every vertex divided by the number of other vertices,
+    equivalent to networkx.degree_centrality (direction both),
+    in_degree_centrality (in) and out_degree_centrality (out)
+    """
+
+    max_iterations = 1
+
+    def __init__(self, direction: str = "both"):
+        self.direction = direction
+
+    def initial(self, graph: CSRGraph) -> np.ndarray:
+        return np.ones(len(graph))
+
+    def apply(self, graph, state, gathered, superstep):
+        return gathered / max(len(graph) - 1, 1)
+
+
+def _renumber(labels: np.ndarray) -> np.ndarray:
+    """number the distinct labels 0,1,... in the order of their first occurrence"""
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(len(first))
+    return rank[inverse]
+
+
+@dataclass
+class ComputerResult:
+    """
+    the values of a vertex program, values[i] belongs to the vertex ids[i]
+    """
+
+    ids: List[Hashable]
+    values: np.ndarray
+    iterations: int
+    converged: bool
+    _index: Dict[Hashable, int] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, vertex_id: Hashable) -> Any:
+        if self._index is None:
+            self._index = {v: i for i, v in enumerate(self.ids)}
+        return self.values[self._index[vertex_id]].item()
+
+    def to_dict(self) -> Dict[Hashable, Any]:
+        return dict(zip(self.ids, self.values.tolist()))
+
+    def top(self, k: int = 10) -> List[Tuple[Hashable, Any]]:
+        """the k vertices with the highest values"""
+        order = np.argsort(-self.values, kind="stable")[:k]
+        return [(self.ids[i], self.values[i].item()) for i in order]
+
+
+# the adjacency and program of a worker process, see _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(adjacency: Adjacency, program: VertexProgram):
+    _worker_state["adjacency"] = adjacency
+    _worker_state["program"] = program
+
+
+def _gather_partition(messages: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    return _worker_state["program"].gather(_worker_state["adjacency"], messages, lo, hi)
+
+
+class GraphComputer:
+    """
+    Runs vertex programs on a MogwaiGraph, see MogwaiGraphTraversalSource.compute.
+
+    The supersteps are executed in this process, or split by vertex ranges of
+    about the same number of edges over a process pool if workers > 1.
+    """
+
+    def __init__(
+        self,
+        graph: MogwaiGraph,
+        workers: int | None = None,
+        label: str | List[str] | None = None,
+    ):
+        """
+        Args:
+            graph: the graph to run the programs on
+            workers: the number of processes, None or 1 to run in this process
+            label: only use the edges with (one of) these labels
+        """
+        self.graph = graph
+        self.workers = workers
+        self.label = label
+        self._csr: Dict[Optional[str], CSRGraph] = {}
+
+    def csr(self, weight: str | None = None) -> CSRGraph:
+        """the array snapshot of the graph, rebuilt when the graph has changed"""
+        csr = self._csr.get(weight)
+        if csr is None or csr.version != self.graph.version:
+            csr = self._csr[weight] = CSRGraph(self.graph, self.label, weight)
+        return csr
+
+    def _partitions(self, adjacency: Adjacency, parts: int) -> List[Tuple[int, int]]:
+        n = len(adjacency.indptr) - 1
+        splits = np.searchsorted(
+            adjacency.indptr, np.linspace(0, adjacency.indptr[-1], parts + 1)
+        )
+        bounds = sorted(set(np.clip(splits, 0, n).tolist()) | {0, n})
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def run(self, program: VertexProgram, write: str | None = None) -> ComputerResult:
+        """
+        run the program until it converges or reaches its max_iterations
+
+        Args:
+            program: the vertex program
+            write: store the values as this vertex property, not the label or name field
+
+        Returns:
+            ComputerResult: the value of every vertex
+        """
+        config = self.graph.config
+        if write in (config.label_field, config.name_field):
+            raise QueryError(
+                f"Cannot write the results to the reserved field `{write}`"
+            )
+        graph = self.csr(program.weight)
+        adjacency = graph.adjacency(program.direction)
+        state = program.initial(graph)
+        executor: Executor | None = None
+        if self.workers and self.workers > 1 and len(graph) > 0:
+            executor = ProcessPoolExecutor(
+                self.workers, initializer=_init_worker, initargs=(adjacency, program)
+            )
+            partitions = self._partitions(adjacency, self.workers)
+        converged = False
+        superstep = 0
+        try:
+            while superstep < program.max_iterations and not converged:
+                superstep += 1
+                messages = program.message(graph, state)
+                if executor is None:
+                    gathered = program.gather(adjacency, messages, 0, len(graph))
+                else:
+                    futures = [
+                        executor.submit(_gather_partition, messages, lo, hi)
+                        for lo, hi in partitions
+                    ]
+                    gathered = np.concatenate([f.result() for f in futures])
+                new_state = program.apply(graph, state, gathered, superstep)
+                converged = program.converged(state, new_state, superstep)
+                state = new_state
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        values = program.result(graph, state)
+        if write is not None:
+            nodes = self.graph._node
+            for v, value in zip(graph.ids, values.tolist()):
+                nodes[v][write] = value
+            self.graph.bump_version()
+            self._csr[program.weight] = graph
+            graph.version = self.graph.version
+        return ComputerResult(graph.ids, values, superstep, converged)
+
+    def page_rank(
+        self,
+        alpha: float = 0.85,
+        max_iterations: int = 100,
+        tol: float = 1.0e-6,
+        weight: str | None = None,
+        write: str | None = None,
+    ) -> ComputerResult:
+        """PageRank of every vertex, see PageRank"""
+        return self.run(PageRank(alpha, max_iterations, tol, weight), write)
+
+    def connected_components(
+        self, max_iterations: int = 1000, write: str | None = None
+    ) -> ComputerResult:
+        """the weakly connected component of every vertex, see ConnectedComponents"""
+        return self.run(ConnectedComponents(max_iterations), write)
+
+    def label_propagation(
+        self, max_iterations: int = 30, write: str | None = None
+    ) -> ComputerResult:
+        """the community of every vertex, see LabelPropagation"""
+        return self.run(LabelPropagation(max_iterations), write)
+
+    def degree_centrality(
+        self, direction: str = "both", write: str | None = None
+    ) -> ComputerResult:
+        """the degree centrality of every vertex, see DegreeCentrality"""
+        return self.run(DegreeCentrality(direction), write)
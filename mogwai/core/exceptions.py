@@ -20,3 +20,24 @@ class IOError(Exception):
     def __init__(self, message="IO failed"):
         self.message = message
         super().__init__(self.message)
+
+
+class TraversalBudgetExceeded(GraphTraversalError):
+    """
+    raised when a traversal exceeds one of the limits of its TraversalBudget.
+    `stats` holds the partial statistics gathered until the traversal was stopped.
+    """
+
+    def __init__(self, message="Traversal exceeded its budget", stats: dict = None):
+        self.stats = stats or {}
+        super().__init__(message)
+
+
+class TraversalTimeout(TraversalBudgetExceeded):
+    def __init__(self, message="Traversal timed out", stats: dict = None):
+        super().__init__(message, stats)
+
+
+class TraversalCancelled(TraversalBudgetExceeded):
+    def __init__(self, message="Traversal was cancelled", stats: dict = None):
+        super().__init__(message, stats)
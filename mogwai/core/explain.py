@@ -0,0 +1,135 @@
+"""
+Created on 2026-10-19
+
+The plan of a traversal as returned by `Traversal.explain()`.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from mogwai.core.steps.base_steps import Step
+    from mogwai.core.traversal import Traversal
+
+
+@dataclass
+class StepPlan:
+    """
+    The plan of a single step
+
+    Attributes:
+        name (str): the step as printed by `print_query`
+        barrier (bool): True if the step materializes all incoming traversers, False if it streams
+        needs_path (bool): True if the step (or one of its anonymous traversals) needs the traverser paths
+        batch_native (bool): True if the step implements the batch protocol (see `Traversal.with_batch_size`)
+        indexes (List[str]): the graph indexes used by the step
+        children (List[StepPlan]): the plans of the steps of nested anonymous traversals
+    """
+
+    name: str
+    barrier: bool
+    needs_path: bool
+    batch_native: bool = False
+    indexes: List[str] = field(default_factory=list)
+    children: List["StepPlan"] = field(default_factory=list)
+
+    @classmethod
+    def of(cls, step: "Step") -> "StepPlan":
+        return cls(
+            name=step.print_query(),
+            barrier=step.isbarrier,
+            needs_path=step.needs_path,
+            batch_native=step.batch_native,
+            indexes=step.used_indexes(),
+            children=[
+                cls.of(child)
+                for anon_traversal in (step.anon_traversals or [])
+                for child in anon_traversal.query_steps
+            ],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "barrier": self.barrier,
+            "needs_path": self.needs_path,
+            "batch_native": self.batch_native,
+            "indexes": self.indexes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class TraversalExplanation:
+    """
+    The plan of a traversal after it has been built and optimized
+
+    Attributes:
+        original (str): the query before optimization
+        optimized (str): the query after optimization
+        needs_path (bool): True if the traversers track their paths
+        rewrites (List[str]): the rewrite rules that fired (including those in anonymous traversals)
+        steps (List[StepPlan]): the plans of the steps
+    """
+
+    original: str
+    optimized: str
+    needs_path: bool
+    rewrites: List[str]
+    steps: List[StepPlan]
+
+    @classmethod
+    def of(cls, traversal: "Traversal", original: str) -> "TraversalExplanation":
+        def collect_rewrites(steps: List["Step"]) -> List[str]:
+            rewrites = []
+            for step in steps:
+                for anon_traversal in step.anon_traversals or []:
+                    rewrites.extend(anon_traversal.rewrites)
+                    rewrites.extend(collect_rewrites(anon_traversal.query_steps))
+            return rewrites
+
+        return cls(
+            original=original,
+            optimized=traversal.print_query(),
+            needs_path=traversal.needs_path,
+            rewrites=traversal.rewrites + collect_rewrites(traversal.query_steps),
+            steps=[StepPlan.of(step) for step in traversal.query_steps],
+        )
+
+    def flatten(self) -> Iterator[Tuple[int, StepPlan]]:
+        """iterate over (depth, plan) of all steps, depth first"""
+
+        def walk(steps: List[StepPlan], depth: int):
+            for step in steps:
+                yield depth, step
+                yield from walk(step.children, depth + 1)
+
+        return walk(self.steps, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "original": self.original,
+            "optimized": self.optimized,
+            "needs_path": self.needs_path,
+            "rewrites": self.rewrites,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            f"Original:  {self.original}",
+            f"Optimized: {self.optimized}",
+            f"Rewrites:  {', '.join(self.rewrites) if self.rewrites else '-'}",
+            f"Paths:     {'tracked' if self.needs_path else 'not tracked'}",
+            "",
+        ]
+        for depth, step in self.flatten():
+            info = ["barrier" if step.barrier else "streaming"]
+            if step.needs_path:
+                info.append("needs path")
+            if step.batch_native:
+                info.append("batch")
+            if step.indexes:
+                info.append(f"index: {', '.join(step.indexes)}")
+            lines.append(f"{'  ' * depth}{step.name} [{', '.join(info)}]")
+        return "\n".join(lines)
@@ -10,7 +10,7 @@ keywords: {Resource description framework;Data models;Semantic Web;Indexes;Java;
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Hashable, Set
+from typing import Hashable, Iterable, Set
 
 
 @dataclass
@@ -102,6 +102,17 @@ class Index:
             self.lookup[from_val] = set()
         self.lookup[from_val].add(to_val)
 
+    def add_quads(self, quads: Iterable[Quad]) -> None:
+        """Add quads in bulk, the positions are resolved once"""
+        from_attr, to_attr = self.from_pos.lower(), self.to_pos.lower()
+        lookup = self.lookup
+        for quad in quads:
+            from_val = getattr(quad, from_attr)
+            values = lookup.get(from_val)
+            if values is None:
+                values = lookup[from_val] = set()
+            values.add(getattr(quad, to_attr))
+
 
 class SPOGIndex:
     """
@@ -140,3 +151,11 @@ class SPOGIndex:
         """Add quad only to configured active indices"""
         for index_name in self.config.active_indices:
             self.indices[index_name].add_quad(quad)
+
+    def add_quads(self, quads: Iterable[Quad]) -> None:
+        """Add quads in bulk to the configured active indices"""
+        if not self.config.active_indices:
+            return
+        quads = quads if isinstance(quads, list) else list(quads)
+        for index_name in self.config.active_indices:
+            self.indices[index_name].add_quads(quads)
@@ -0,0 +1,138 @@
+"""
+Created on 2026-10-19
+
+Bitmap index of the vertex labels, see `MogwaiGraph.label_index`.
+"""
+
+import re
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+# the positions of the set bits of every byte value
+_BITS = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+def label_set(labels: Any) -> Iterable[Hashable]:
+    """the labels held by the label field of a vertex: a single label or a collection of labels"""
+    if labels is None:
+        return ()
+    if isinstance(labels, (set, frozenset, list, tuple)):
+        return labels
+    return (labels,)
+
+
+class LabelIndex:
+    """
+    Maps every label onto a bitmap over dense vertex positions.
+
+    Vertices get consecutive positions in insertion order, so the vertices of a query
+    are returned in the order in which the graph holds them. The bitmaps are bytearrays
+    (setting a bit is O(1)) that are turned into ints for the set operations of
+    multi-label queries, which then run at C speed.
+    Positions of removed vertices are not reused, `holes` counts them.
+    """
+
+    def __init__(self):
+        self.positions: Dict[Hashable, int] = {}
+        self.ids: List[Hashable] = []
+        self.bitmaps: Dict[Hashable, bytearray] = {}
+        self.live = bytearray()
+        self.holes = 0
+
+    @classmethod
+    def of(cls, nodes: Iterable, label_field: str) -> "LabelIndex":
+        """the index of the (node id, node data) pairs"""
+        index = cls()
+        for node_id, data in nodes:
+            index.add(node_id, data.get(label_field))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @staticmethod
+    def _set(bitmap: bytearray, position: int, value: bool = True):
+        byte = position >> 3
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte - len(bitmap) + 1))
+        if value:
+            bitmap[byte] |= 1 << (position & 7)
+        else:
+            bitmap[byte] &= ~(1 << (position & 7)) & 0xFF
+
+    def add(self, node_id: Hashable, labels: Any, old_labels: Any = None):
+        """add a vertex or replace the `old_labels` of an indexed vertex"""
+        position = self.positions.get(node_id)
+        if position is None:
+            position = self.positions[node_id] = len(self.ids)
+            self.ids.append(node_id)
+            self._set(self.live, position)
+        else:
+            self._clear(position, old_labels)
+        for label in label_set(labels):
+            bitmap = self.bitmaps.get(label)
+            if bitmap is None:
+                bitmap = self.bitmaps[label] = bytearray()
+            self._set(bitmap, position)
+
+    def remove(self, node_id: Hashable, labels: Any):
+        """remove a vertex with the given labels, unknown vertices are ignored"""
+        position = self.positions.pop(node_id, None)
+        if position is None:
+            return
+        self._set(self.live, position, False)
+        self._clear(position, labels)
+        self.holes += 1
+
+    def _clear(self, position: int, labels: Any):
+        for label in label_set(labels):
+            bitmap = self.bitmaps.get(label)
+            if bitmap is not None:
+                self._set(bitmap, position, False)
+
+    def bitmap(self, label: Hashable) -> int:
+        """the bitmap of the vertices with the label as int"""
+        bitmap = self.bitmaps.get(label)
+        return int.from_bytes(bitmap, "little") if bitmap is not None else 0
+
+    def query(
+        self,
+        all_of: Optional[Iterable[Hashable]] = None,
+        any_of: Optional[Iterable[Hashable]] = None,
+        none_of: Optional[Iterable[Hashable]] = None,
+    ) -> int:
+        """
+        the bitmap of the vertices having all labels of `all_of`,
+        at least one label of `any_of` and no label of `none_of`
+        """
+        bits = int.from_bytes(self.live, "little")
+        for label in all_of or ():
+            bits &= self.bitmap(label)
+            if not bits:
+                return 0
+        if any_of is not None:
+            union = 0
+            for label in any_of:
+                union |= self.bitmap(label)
+            bits &= union
+        for label in none_of or ():
+            bits &= ~self.bitmap(label)
+        return bits
+
+    def ids_of(self, bits: int) -> Iterator[Hashable]:
+        """the ids of the vertices in the bitmap, in insertion order"""
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        ids = self.ids
+        for match in _NONZERO.finditer(data):
+            offset = match.start() << 3
+            for bit in _BITS[data[match.start()]]:
+                yield ids[offset + bit]
+
+    def nodes(
+        self,
+        all_of: Optional[Iterable[Hashable]] = None,
+        any_of: Optional[Iterable[Hashable]] = None,
+        none_of: Optional[Iterable[Hashable]] = None,
+    ) -> List[Hashable]:
+        """the ids of the vertices matching the query, see `query`"""
+        return list(self.ids_of(self.query(all_of, any_of, none_of)))
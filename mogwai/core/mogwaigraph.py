@@ -1,17 +1,77 @@
+import gc
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Hashable, Optional
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 import networkx
 
+from mogwai.config import INTERN_MAX_LENGTH
 from mogwai.core.hd_index import IndexConfigs, Quad, SPOGIndex
+from mogwai.core.label_index import LabelIndex
 
 from .exceptions import MogwaiGraphError
 
 
+@contextmanager
+def _gc_paused():
+    """
+    pause the cyclic garbage collector during bulk inserts,
+    the dicts they create can't form reference cycles
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _join_keys(
+    nodes: Dict[Hashable, dict], node_ids: Iterable[Hashable], field: str
+) -> list:
+    """the (node id, field value) pairs of the nodes having the field"""
+    return [
+        (node_id, key)
+        for node_id in node_ids
+        if (key := nodes[node_id].get(field)) is not None
+    ]
+
+
+def _probe(table: Dict[Hashable, list], probe: list) -> list:
+    """the (probing node id, matching node id) pairs of a hash join"""
+    get = table.get
+    return [
+        (node_id, match)
+        for node_id, key in probe
+        if (bucket := get(key)) is not None
+        for match in bucket
+    ]
+
+
 @dataclass
 class MogwaiGraphConfig:
     """
     configuration of a MogwaiGraph
+
+    int_ids: generate integer instead of string node ids; an int takes less memory than
+        its string but dicts with non-string keys (e.g. the adjacency dicts) use larger
+        entries, see `python -m benchmarks.memory`
+    intern_strings: share labels, property keys and short string values between
+        the elements instead of storing a copy per element, collections of labels
+        are stored as shared frozensets
     """
 
     name_field: str = "name"
@@ -21,6 +81,8 @@ class MogwaiGraphConfig:
     default_edge_label: str = "Edge"
     index_config: str = "off"
     single_label: bool = True
+    int_ids: bool = False
+    intern_strings: bool = True
 
 
 class MogwaiGraph(networkx.DiGraph):
@@ -39,21 +101,142 @@ class MogwaiGraph(networkx.DiGraph):
             config (MogwaiGraphConfig): Configuration for field names and defaults
             **attr: Graph attributes as key=value pairs
         """
+        # incremented by every mutation, see bump_version
+        self.version = 0
+        # the last version the SPOG index is known to be complete for
+        self._indexed_version = 0
+        # built on first use and maintained while it is current, see label_index
+        self._label_index: Optional[LabelIndex] = None
+        self._label_index_version = -1
         super().__init__(incoming_graph_data, **attr)
         self.counter = 0
         self.config = config or MogwaiGraphConfig()
+        # the shared label sets, see intern_labels
+        self._label_sets: Dict[FrozenSet, FrozenSet] = {}
         # Initialize SPOG index based on config
         index_config = IndexConfigs[self.config.index_config.upper()].get_config()
         self.spog_index = SPOGIndex(index_config)
 
-    def get_next_node_id(self) -> str:
+    def get_next_node_id(self) -> str | int:
+        """
+        get the next node_id, an int if the config asks for int_ids
+
+        ids that are in use, e.g. inserted explicitly with add_labeled_nodes_from, are skipped
+        """
+        while True:
+            node_id = self.counter
+            self.counter += 1
+            if not self.config.int_ids:
+                node_id = str(node_id)
+            if node_id not in self._node:
+                return node_id
+
+    def _next_node_ids(self, node_ids: Collection[Hashable]) -> Dict[Hashable, Any]:
+        """
+        maps the node ids onto consecutive next node ids, skipping ids that are in use
+        """
+        start = self.counter
+        self.counter += len(node_ids)
+        new_ids = range(start, self.counter)
+        if not self.config.int_ids:
+            new_ids = map(str, new_ids)
+        mapping = dict(zip(node_ids, new_ids))
+        if not self._node.keys().isdisjoint(mapping.values()):
+            self.counter = start
+            for n in mapping:
+                mapping[n] = self.get_next_node_id()
+        return mapping
+
+    def intern_labels(self, labels: Any) -> Any:
+        """
+        the shared instance of the given labels: a label string is interned,
+        a collection of labels becomes a frozenset shared by all elements with these labels
+        """
+        if type(labels) is str:
+            return intern(labels)
+        if isinstance(labels, (set, frozenset, list, tuple)):
+            key = frozenset(
+                intern(label) if type(label) is str else label for label in labels
+            )
+            return self._label_sets.setdefault(key, key)
+        return labels
+
+    def intern_properties(self, properties: dict) -> dict:
+        """
+        a copy of the properties with interned keys and string values
+        of at most INTERN_MAX_LENGTH characters
+        """
+        return {
+            (intern(key) if type(key) is str else key): (
+                intern(value)
+                if type(value) is str and len(value) <= INTERN_MAX_LENGTH
+                else value
+            )
+            for key, value in properties.items()
+        }
+
+    def bump_version(self) -> int:
         """
-        get the next node_id
+        mark the graph as modified
+
+        All mutating methods of this class call this, code that changes
+        element attributes directly (e.g. graph.nodes[n]["key"] = value)
+        needs to call it so that cached traversal results are invalidated.
+
+        Returns:
+            int: the new version
         """
-        node_id = self.counter
-        self.counter += 1
-        node_id_str = str(node_id)
-        return node_id_str
+        self._touch()
+        return self.version
+
+    def _touch(self, indexed: bool = False, labeled: bool = False):
+        """
+        increment the version, `indexed` if the SPOG index reflects the change
+        and `labeled` if the label index does
+        """
+        in_sync = self._indexed_version == self.version
+        labels_in_sync = self._label_index_version == self.version
+        self.version += 1
+        if indexed and in_sync:
+            self._indexed_version = self.version
+        if labeled and labels_in_sync:
+            self._label_index_version = self.version
+
+    @property
+    def label_index(self) -> LabelIndex:
+        """
+        the bitmap index of the vertex labels, built on first use.
+        The labeled add methods and the remove methods maintain it,
+        other changes (see bump_version) make it rebuild on the next use.
+        """
+        index = self._label_index
+        if (
+            index is None
+            or self._label_index_version != self.version
+            or index.holes > len(index)
+        ):
+            index = self._label_index = LabelIndex.of(
+                self._node.items(), self.config.label_field
+            )
+            self._label_index_version = self.version
+        return index
+
+    def _maintained_label_index(self) -> Optional[LabelIndex]:
+        """the label index if it is current and must be kept current by a change"""
+        if self._label_index_version == self.version:
+            return self._label_index
+        return None
+
+    @property
+    def index_is_current(self) -> bool:
+        """
+        whether the SPOG index holds every node and property of the graph;
+        it may still hold removed elements and is outdated after changes
+        that bypassed the labeled add methods (see bump_version)
+        """
+        return (
+            self.config.index_config != "off" and self._indexed_version == self.version
+        )
 
     def add_to_index(
         self,
@@ -77,22 +260,35 @@ class MogwaiGraph(networkx.DiGraph):
         # only index if the config calls for it
         if self.config.index_config == "off":
             return
-        # Add quads for label with g="label"
-        label_quad = Quad(s=subject_id, p="label", o=label, g=f"{element_type}-label")
-        self.spog_index.add_quad(label_quad)
-
-        # Add quad for name with g="name"
-        name_quad = Quad(s=subject_id, p="name", o=name, g=f"{element_type}-name")
-        self.spog_index.add_quad(name_quad)
+        self.spog_index.add_quads(
+            self._index_quads(element_type, subject_id, label, name, properties)
+        )
 
-        # Add quads for each property with g="property"
+    @staticmethod
+    def _index_quads(
+        element_type: str,
+        subject_id: Hashable,
+        label: str,
+        name: str,
+        properties: dict,
+    ) -> list:
+        """the quads of the labels, name and properties of an element, see add_to_index"""
+        quads = [
+            Quad(s=subject_id, p="label", o=label, g=f"{element_type}-label"),
+            Quad(s=subject_id, p="name", o=name, g=f"{element_type}-name"),
+        ]
         for prop_name, prop_value in properties.items():
             if not isinstance(prop_value, Hashable):
                 prop_value = str(prop_value)  # Ensure property value is hashable
-            property_quad = Quad(
-                s=subject_id, p=prop_name, o=prop_value, g=f"{element_type}-property"
+            quads.append(
+                Quad(
+                    s=subject_id,
+                    p=prop_name,
+                    o=prop_value,
+                    g=f"{element_type}-property",
+                )
             )
-            self.spog_index.add_quad(property_quad)
+        return quads
 
     def add_labeled_node(
         self,
@@ -115,7 +311,7 @@ class MogwaiGraph(networkx.DiGraph):
             node_id (Optional[int], optional): The ID for the node. If not provided, a new ID will be generated. Defaults to None.
             kwargs (): further property values
         Returns:
-            Any: The ID of the newly added node - will be an integer if node_id was kept as default None
+            Any: The ID of the newly added node - a string (an integer with int_ids) if node_id was kept as default None
 
         Raises:
             MogwaiGraphError: If a node with the provided ID already exists in the graph.
@@ -132,12 +328,21 @@ class MogwaiGraph(networkx.DiGraph):
             raise MogwaiGraphError(
                 f"The '{self.config.label_field}' property is reserved for the node labels."
             )
+        if self.config.intern_strings:
+            label = self.intern_labels(label)
+            properties = self.intern_properties(properties)
         node_props = {
             self.config.name_field: name,
             self.config.label_field: label,
             **properties,
         }
+        label_index = self._maintained_label_index()
+        if label_index is not None:
+            old_labels = self._node.get(node_id, {}).get(self.config.label_field)
         super().add_node(node_id, **node_props)
+        if label_index is not None:
+            label_index.add(node_id, label, old_labels)
+        self._touch(indexed=True, labeled=True)
         # Use add_to_index to add label, name, and properties as quads
         self.add_to_index("node", node_id, label, name, properties)
         return node_id
@@ -159,8 +364,12 @@ class MogwaiGraph(networkx.DiGraph):
                 raise MogwaiGraphError(
                     f"The '{self.config.label_field}' property is reserved for the node labels."
                 )
+            if self.config.intern_strings:
+                edgeLabel = self.intern_labels(edgeLabel)
+                properties = self.intern_properties(properties)
             edge_props = {self.config.edge_label_field: edgeLabel, **properties}
             super().add_edge(srcId, destId, **edge_props)
+            self._touch(indexed=True, labeled=True)
             # Add a quad specifically for the edge connection
             edge_quad = Quad(s=srcId, p=edgeLabel, o=destId, g="edge-link")
             self.spog_index.add_quad(edge_quad)
@@ -172,6 +381,114 @@ class MogwaiGraph(networkx.DiGraph):
                 f"Node with srcId {srcId} or destId {destId} is not in the graph."
             )
 
+    def add_labeled_nodes_from(
+        self, nodes: Iterable[Tuple[Hashable, str, str, dict]]
+    ) -> int:
+        """
+        Bulk insert of labeled nodes.
+
+        Bypasses the per node overhead of add_labeled_node, which matters
+        when loading graphs with millions of elements.
+
+        Args:
+            nodes: (node_id, label, name, properties) tuples
+
+        Returns:
+            int: the number of nodes added
+        """
+        name_field = self.config.name_field
+        label_field = self.config.label_field
+        indexed = self.config.index_config != "off"
+        intern_strings = self.config.intern_strings
+        label_index = self._maintained_label_index()
+        added = 0
+
+        def node_data():
+            nonlocal added
+            for node_id, label, name, properties in nodes:
+                if name_field in properties or label_field in properties:
+                    raise MogwaiGraphError(
+                        f"The '{name_field}' and '{label_field}' properties are reserved for the node name and labels."
+                    )
+                if intern_strings:
+                    label = self.intern_labels(label)
+                    properties = self.intern_properties(properties)
+                if indexed:
+                    self.add_to_index("node", node_id, label, name, properties)
+                if label_index is not None:
+                    old_labels = self._node.get(node_id, {}).get(label_field)
+                    label_index.add(node_id, label, old_labels)
+                added += 1
+                yield node_id, {name_field: name, label_field: label, **properties}
+
+        super().add_nodes_from(node_data())
+        self._touch(indexed=True, labeled=True)
+        return added
+
+    def add_labeled_edges_from(
+        self, edges: Iterable[Tuple[Hashable, Hashable, str, dict]]
+    ) -> int:
+        """
+        Bulk insert of labeled edges between existing nodes.
+
+        Args:
+            edges: (src_id, dest_id, edge_label, properties) tuples
+
+        Returns:
+            int: the number of edges added
+        """
+        edge_label_field = self.config.edge_label_field
+        indexed = self.config.index_config != "off"
+        intern_strings = self.config.intern_strings
+        linked = bool(self.spog_index.config.active_indices)
+        succ, pred, nodes = self._succ, self._pred, self._node
+        last_label = interned_label = None
+        quads = []
+        added = 0
+        # the edge data dicts are written to the adjacency dicts directly,
+        # networkx.DiGraph.add_edges_from would copy every dict
+        try:
+            with _gc_paused():
+                for src, dest, label, properties in edges:
+                    if src not in nodes or dest not in nodes:
+                        raise MogwaiGraphError(
+                            f"Node with srcId {src} or destId {dest} is not in the graph."
+                        )
+                    if edge_label_field in properties:
+                        raise MogwaiGraphError(
+                            f"The '{edge_label_field}' property is reserved for the edge label."
+                        )
+                    if intern_strings:
+                        # bulk inserts mostly repeat the same label
+                        if label is not last_label:
+                            last_label, interned_label = label, self.intern_labels(
+                                label
+                            )
+                        label = interned_label
+                        if properties:
+                            properties = self.intern_properties(properties)
+                    if linked:
+                        quads.append(Quad(s=src, p=label, o=dest, g="edge-link"))
+                    if indexed:
+                        quads += self._index_quads(
+                            "edge", src, label, label, properties
+                        )
+                    data = succ[src].get(dest)
+                    if data is None:
+                        succ[src][dest] = pred[dest][src] = {
+                            edge_label_field: label,
+                            **properties,
+                        }
+                    else:
+                        data.update(properties)
+                        data[edge_label_field] = label
+                    added += 1
+        finally:
+            self.spog_index.add_quads(quads)
+            networkx._clear_cache(self)
+            self._touch(indexed=True, labeled=True)
+        return added
+
     def add_node(self, *args, **kwargs):
         """Add a node with default or explicit labels"""
         if len(args) > 0:
@@ -191,43 +508,200 @@ class MogwaiGraph(networkx.DiGraph):
         label = kwargs.pop(self.config.edge_label_field, self.config.default_edge_label)
         return self.add_labeled_edge(src, dst, label, properties=kwargs)
 
+    def add_nodes_from(self, *args, **kwargs):
+        super().add_nodes_from(*args, **kwargs)
+        self._touch()
+
+    def add_edges_from(self, *args, **kwargs):
+        super().add_edges_from(*args, **kwargs)
+        self._touch()
+
+    def remove_node(self, n):
+        label_index = self._maintained_label_index()
+        labels = self._node.get(n, {}).get(self.config.label_field)
+        super().remove_node(n)
+        if label_index is not None:
+            label_index.remove(n, labels)
+        self._touch(indexed=True, labeled=True)
+
+    def remove_nodes_from(self, nodes):
+        label_index = self._maintained_label_index()
+        if label_index is not None:
+            nodes = list(nodes)
+            for n in nodes:
+                if n in self._node:
+                    label_index.remove(n, self._node[n].get(self.config.label_field))
+        super().remove_nodes_from(nodes)
+        self._touch(indexed=True, labeled=True)
+
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self._touch(indexed=True, labeled=True)
+
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self._touch(indexed=True, labeled=True)
+
+    def clear(self):
+        super().clear()
+        self._label_index = None
+        self._touch(indexed=True)
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._touch(indexed=True, labeled=True)
+
     def _get_nodes_set(self, label: set, name: str):
-        n_none = name is None
-        if n_none:
-            return [n for n in self.nodes(date=True) if label.issubset(n[1]["labels"])]
-        if not n_none:
-            return [
-                n
-                for n in self.nodes(data=True)
-                if label.issubset(n[1]["labels"]) and n[1]["name"] == name
-            ]
-        return self.nodes
+        """the (node id, data) pairs of the nodes having all the labels and the name (if not None)"""
+        return self._labeled_nodes(self.label_index.nodes(all_of=label), name)
+
+    def _labeled_nodes(self, node_ids: Iterable[Hashable], name: str):
+        nodes = self._node
+        if name is None:
+            return [(n, nodes[n]) for n in node_ids]
+        name_field = self.config.name_field
+        return [(n, nodes[n]) for n in node_ids if nodes[n].get(name_field) == name]
 
     def get_nodes(self, label: str, name: str):
         """
-        @FIXME - this is ugly code
-        """
-        l_none, n_none = label is None, name is None
-        if not l_none and not n_none:
-            return [
-                n
-                for n in self.nodes(data=True)
-                if label in n[1]["labels"] and n[1]["name"] == name
-            ]
-        if l_none and not n_none:
-            return [n for n in self.nodes(data=True) if n[1]["name"] == name]
-        if not l_none and n_none:
-            return [n for n in self.nodes(date=True) if label in n[1]["labels"]]
-        return self.nodes
-
-    def merge(self, other: "MogwaiGraph", srcId: int, targetId: int, edgeLabel: str):
-        mapping = {k: self.get_next_node_id() for k in other.nodes}
-        relabeled = networkx.relabel_nodes(other, mapping, copy=True)
-        self.add_nodes_from(relabeled.nodes(data=True))
-        self.add_edges_from(relabeled.edges(data=True))
-        self.add_labeled_edge(
-            srcId=srcId, destId=mapping[targetId], edgeLabel=edgeLabel
-        )
+        the (node id, data) pairs of the nodes with the label and the name,
+        a None label or name matches every node, the label is looked up in the label index
+        """
+        if label is None and name is None:
+            return self.nodes
+        if label is None:
+            return self._labeled_nodes(self._node, name)
+        return self._labeled_nodes(self.label_index.nodes(all_of=[label]), name)
+
+    def merge(
+        self,
+        other: "MogwaiGraph",
+        srcId: Hashable = None,
+        targetId: Hashable = None,
+        edgeLabel: str = None,
+        node_id: Callable[[Hashable], Hashable] = None,
+        copy: bool = True,
+    ) -> Dict[Hashable, Hashable]:
+        """
+        merge the nodes and edges of the other graph into this graph
+        and link its node `targetId` from the node `srcId` of this graph
+
+        Args:
+            other: the graph to merge
+            srcId: the node of this graph to link from, None for no link
+            targetId: the node of the other graph to link to
+            edgeLabel: the label of the link
+            node_id: maps the node ids of the other graph to the ids in this graph,
+                by default the nodes get the next node ids of this graph
+            copy: copy the node and edge data, without copying the data dicts are moved
+                so the other graph must not be used after the merge
+
+        Returns:
+            Dict[Hashable, Hashable]: maps the node ids of the other graph to the ids in this graph
+        """
+        return self.merge_all([(other, srcId, targetId, edgeLabel)], node_id, copy)[0]
+
+    def merge_all(
+        self,
+        merges: Iterable[Tuple["MogwaiGraph", Hashable, Hashable, str]],
+        node_id: Callable[[Hashable], Hashable] = None,
+        copy: bool = True,
+    ) -> List[Dict[Hashable, Hashable]]:
+        """
+        merge several graphs in one pass, see merge
+
+        The nodes and edges are written to the adjacency dicts directly without
+        building relabeled copies of the graphs, the SPOG index and the label index
+        are updated in bulk and the links are added with add_labeled_edges_from.
+
+        Args:
+            merges: (other graph, srcId, targetId, edgeLabel) tuples
+            node_id: maps the node ids of the other graphs to the ids in this graph
+            copy: copy the node and edge data instead of moving it
+
+        Returns:
+            List[Dict[Hashable, Hashable]]: the node id mapping of every merged graph
+
+        Raises:
+            MogwaiGraphError: if node_id maps two nodes onto the same id
+                or onto an id that is already in the graph
+        """
+        name_field, label_field = self.config.name_field, self.config.label_field
+        edge_label_field = self.config.edge_label_field
+        intern_strings = self.config.intern_strings
+        indexed = self.config.index_config != "off"
+        linked = bool(self.spog_index.config.active_indices)
+        label_index = self._maintained_label_index()
+        nodes, succ, pred = self._node, self._succ, self._pred
+        mappings, links, quads = [], [], []
+        try:
+            with _gc_paused():
+                for other, src, target, edge_label in merges:
+                    if node_id is None:
+                        mapping = self._next_node_ids(other._node)
+                    else:
+                        mapping = {n: node_id(n) for n in other._node}
+                        if len(set(mapping.values())) < len(mapping):
+                            raise MogwaiGraphError(
+                                "The merged nodes must be mapped onto distinct ids."
+                            )
+                        if not nodes.keys().isdisjoint(mapping.values()):
+                            raise MogwaiGraphError(
+                                "The merged nodes must not be in the graph already."
+                            )
+                    for n, data in other._node.items():
+                        new_id = mapping[n]
+                        if copy:
+                            data = dict(data)
+                        labels = data.get(label_field)
+                        if intern_strings and labels is not None:
+                            labels = data[label_field] = self.intern_labels(labels)
+                        nodes[new_id] = data
+                        if label_index is not None:
+                            label_index.add(new_id, labels)
+                        if indexed:
+                            properties = {
+                                key: value
+                                for key, value in data.items()
+                                if key != name_field and key != label_field
+                            }
+                            quads += self._index_quads(
+                                "node", new_id, labels, data.get(name_field), properties
+                            )
+                    for new_id in mapping.values():
+                        succ[new_id], pred[new_id] = {}, {}
+                    for n, neighbors in other._succ.items():
+                        src_id = mapping[n]
+                        out = succ[src_id]
+                        for m, data in neighbors.items():
+                            dest_id = mapping[m]
+                            if copy:
+                                data = dict(data)
+                            out[dest_id] = pred[dest_id][src_id] = data
+                            if linked or indexed:
+                                label = data.get(edge_label_field)
+                            if linked:
+                                quads.append(
+                                    Quad(s=src_id, p=label, o=dest_id, g="edge-link")
+                                )
+                            if indexed:
+                                properties = {
+                                    key: value
+                                    for key, value in data.items()
+                                    if key != edge_label_field
+                                }
+                                quads += self._index_quads(
+                                    "edge", src_id, label, label, properties
+                                )
+                    mappings.append(mapping)
+                    if src is not None:
+                        links.append((src, mapping[target], edge_label, {}))
+        finally:
+            self.spog_index.add_quads(quads)
+            networkx._clear_cache(self)
+            self._touch(indexed=True, labeled=True)
+        self.add_labeled_edges_from(links)
+        return mappings
 
     def join(
         self,
@@ -236,27 +710,50 @@ class MogwaiGraph(networkx.DiGraph):
         join_field: str,
         target_key: str,
         edge_label: str,
-    ):
-        """Joins two node types by field values and creates edges between them."""
-        node_lookup = self.spog_index.get_lookup("P", "O")
-        if not node_lookup:
-            raise ValueError("No SPOG index available")
-
-        field_values = node_lookup.get(join_field)
-        if field_values is None:
-            raise ValueError(f"Join field {join_field} not found in index")
-
-        target_values = node_lookup.get(target_key)
-        if target_values is None:
-            raise ValueError(f"Target key {target_key} not found in index")
-
-        os_lookup = self.spog_index.get_lookup("O", "S")
-        for source_id in os_lookup.get(from_label):
-            source_value = self.nodes[source_id][join_field]
-            target_ids = os_lookup.get(source_value)
-            for target_id in target_ids:
-                if to_label in self.nodes[target_id].get("labels", []):
-                    self.add_labeled_edge(source_id, target_id, edge_label)
+        properties: dict = None,
+    ) -> int:
+        """
+        Joins two node types by field values and creates edges between them:
+        every `from_label` node gets an edge to every `to_label` node whose
+        `target_key` value equals its `join_field` value.
+
+        Hash join: the hash table is built on the smaller side, the larger side
+        probes it and all edges are inserted with add_labeled_edges_from.
+
+        Args:
+            from_label: the label of the source nodes
+            to_label: the label of the target nodes
+            join_field: the field of the source nodes
+            target_key: the field of the target nodes
+            edge_label: the label of the created edges
+            properties: the properties of the created edges
+
+        Returns:
+            int: the number of edges created
+        """
+        label_index = self.label_index
+        sources = _join_keys(
+            self._node, label_index.nodes(all_of=[from_label]), join_field
+        )
+        targets = _join_keys(
+            self._node, label_index.nodes(all_of=[to_label]), target_key
+        )
+        build_sources = len(sources) <= len(targets)
+        build, probe = (sources, targets) if build_sources else (targets, sources)
+        table: Dict[Hashable, list] = {}
+        for node_id, key in build:
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = [node_id]
+            else:
+                bucket.append(node_id)
+        matches = _probe(table, probe)
+        properties = properties or {}
+        if build_sources:
+            edges = ((src, dest, edge_label, properties) for dest, src in matches)
+        else:
+            edges = ((src, dest, edge_label, properties) for src, dest in matches)
+        return self.add_labeled_edges_from(edges)
 
     def draw(self, outputfile, title: str = "MogwaiGraph", **kwargs):
         """
@@ -0,0 +1,192 @@
+"""
+Created on 2026-10-19
+
+Rewrite rules applied by `Traversal._optimize_query`.
+Every rule rewrites the steps of a (built) traversal in place and reports
+whether it fired, so `Traversal.explain()` can show which rewrites were applied.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from mogwai.core.traversal import Traversal
+
+
+class RewriteRule(ABC):
+    """
+    base class for query rewrite rules
+    """
+
+    @property
+    def name(self) -> str:
+        return self.__class__.__name__
+
+    @abstractmethod
+    def apply(self, traversal: "Traversal") -> bool:
+        """
+        rewrite the steps of the given traversal in place
+
+        Returns:
+            bool: True if the rule changed the traversal
+        """
+        pass
+
+
+class MergeLimits(RewriteRule):
+    """
+    `limit(a).limit(b)` is the same as `limit(min(a, b))`
+    """
+
+    def apply(self, traversal: "Traversal") -> bool:
+        from mogwai.core.steps.filter_steps import Range
+
+        fired = False
+        steps = traversal.query_steps
+        i = 1
+        while i < len(steps):
+            prev, step = steps[i - 1], steps[i]
+            if (
+                type(prev) is Range
+                and type(step) is Range
+                and prev.low == 0
+                and step.low == 0
+                and prev.high >= 0
+                and step.high >= 0
+            ):
+                steps[i - 1] = Range(traversal, 0, min(prev.high, step.high))
+                steps.pop(i)
+                fired = True
+            else:
+                i += 1
+        return fired
+
+
+class RemoveOrderBeforeCount(RewriteRule):
+    """
+    the order of the traversers does not matter for a global `count()`,
+    so an `order()` directly in front of it can be dropped
+    """
+
+    def apply(self, traversal: "Traversal") -> bool:
+        from mogwai.core import AnonymousTraversal
+        from mogwai.core.steps.enums import Scope
+        from mogwai.core.steps.map_steps import Count, Order
+
+        fired = False
+        steps = traversal.query_steps
+        i = 1
+        while i < len(steps):
+            prev, step = steps[i - 1], steps[i]
+            if (
+                type(prev) is Order
+                and not isinstance(prev.by, AnonymousTraversal)
+                and type(step) is Count
+                and step.scope == Scope.global_
+            ):
+                steps.pop(i - 1)
+                fired = True
+            else:
+                i += 1
+        return fired
+
+
+class FilterToSemiJoin(RewriteRule):
+    """
+    `filter_(...)` and `not_(...)` with a predicate that only walks along edges
+    and checks the vertices it reaches, like `filter_(out("route").has("code", "LAX"))`,
+    become a semi join (anti join) with the set of vertices passing the predicate,
+    see `SemiJoin`
+    """
+
+    def apply(self, traversal: "Traversal") -> bool:
+        from mogwai.core.steps.filter_steps import Filter, Not, SemiJoin
+
+        fired = False
+        steps = traversal.query_steps
+        for i, step in enumerate(steps):
+            if type(step) in (Filter, Not):
+                predicate = step.anon_traversals[0]
+                if SemiJoin.stages_of(predicate) is not None:
+                    join = SemiJoin(traversal, predicate, negate=type(step) is Not)
+                    join.build()
+                    steps[i] = join
+                    fired = True
+        return fired
+
+
+class HasLabelToLabelScan(RewriteRule):
+    """
+    `V().has_label(...)` (also with several labels, repeated or negated with `not_`)
+    enumerates the vertices with these labels from the label index of the graph
+    instead of testing the labels of every vertex, see `LabelIndex`
+    """
+
+    def apply(self, traversal: "Traversal") -> bool:
+        from mogwai.core.steps.start_steps import V
+
+        steps = traversal.query_steps
+        start = steps[0] if steps else None
+        if (
+            type(start) is not V
+            or start.init is not None
+            or start.graph.config.label_field != "labels"
+        ):
+            return False
+        labels = dict(start.labels or {})
+        fired = False
+        while len(steps) > 1:
+            query = self._label_query(steps[1])
+            if query is None:
+                break
+            key, values = query
+            labels[key] = labels.get(key, set()) | values
+            steps.pop(1)
+            fired = True
+        if fired:
+            start.labels = labels
+        return fired
+
+    @staticmethod
+    def _label_query(step) -> Tuple[str, Set] | None:
+        """the LabelIndex.query argument equivalent to a has_label step, None if there is none"""
+        from mogwai.core.steps.filter_steps import Contains, ContainsAll, Not
+
+        negate = False
+        if type(step) is Not:
+            predicate = step.anon_traversals[0]
+            if len(predicate.query_steps) != 1:
+                return None
+            step, negate = predicate.query_steps[0], True
+        if type(step) is Contains and step.key == "labels":
+            values = [step.value]
+        elif type(step) is ContainsAll and step.key == "labels" and not negate:
+            values = step.values
+        else:
+            return None
+        try:
+            values = set(values)
+        except TypeError:
+            return None
+        if any(callable(value) or value is None for value in values):
+            return None
+        return ("none_of" if negate else "all_of"), values
+
+
+DEFAULT_RULES: List[RewriteRule] = [
+    MergeLimits(),
+    RemoveOrderBeforeCount(),
+    HasLabelToLabelScan(),
+    FilterToSemiJoin(),
+]
+
+
+def optimize(traversal: "Traversal", rules: List[RewriteRule] = None) -> List[str]:
+    """
+    apply the rewrite rules to the given traversal
+
+    Returns:
+        List[str]: the names of the rules that fired
+    """
+    rules = DEFAULT_RULES if rules is None else rules
+    return [rule.name for rule in rules if rule.apply(traversal)]
@@ -0,0 +1,209 @@
+"""
+Created on 2026-10-19
+
+Per-step profiling of traversals, see `Traversal.profile()`.
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from mogwai.core.steps.base_steps import Step
+    from mogwai.core.traversal import Traversal
+
+
+@dataclass
+class StepMetrics:
+    """
+    The metrics of a single step.
+    Steps of anonymous traversals (e.g. the body of a `repeat` or `filter_`) are listed as children
+    and their metrics are accumulated over all invocations of the anonymous traversal.
+
+    Attributes:
+        name (str): the step as printed by `print_query`
+        traversers_in (int): the number of traversers that were passed to the step
+        traversers_out (int): the number of traversers produced by the step
+        calls (int): how often the step was invoked
+        self_time (float): the time in seconds spent in the step itself
+        percent (float): the share of the total time spent in this step (including its children)
+        children (List[StepMetrics]): the metrics of the steps of nested anonymous traversals
+    """
+
+    name: str
+    traversers_in: int = 0
+    traversers_out: int = 0
+    calls: int = 0
+    self_time: float = 0.0
+    percent: float = 0.0
+    children: List["StepMetrics"] = field(default_factory=list)
+
+    @property
+    def time(self) -> float:
+        """the time in seconds spent in this step including its children"""
+        return self.self_time + sum(child.time for child in self.children)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "traversers_in": self.traversers_in,
+            "traversers_out": self.traversers_out,
+            "calls": self.calls,
+            "time": self.time,
+            "self_time": self.self_time,
+            "percent": self.percent,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class TraversalMetrics:
+    """
+    The result of a profiled traversal
+    """
+
+    steps: List[StepMetrics]
+    duration: float
+
+    def flatten(self) -> Iterator[Tuple[int, StepMetrics]]:
+        """iterate over (depth, metrics) of all steps, depth first"""
+
+        def walk(steps: List[StepMetrics], depth: int):
+            for step in steps:
+                yield depth, step
+                yield from walk(step.children, depth + 1)
+
+        return walk(self.steps, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "duration": self.duration,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+    def table(self) -> str:
+        """the metrics as a printable table"""
+        header = ("Step", "Traversers in", "Traversers out", "Time (ms)", "% Dur")
+        rows = [
+            (
+                "  " * depth + step.name,
+                str(step.traversers_in),
+                str(step.traversers_out),
+                f"{step.time * 1000:.3f}",
+                f"{step.percent:.2f}",
+            )
+            for depth, step in self.flatten()
+        ]
+        widths = [
+            max(len(row[i]) for row in [header, *rows]) for i in range(len(header))
+        ]
+        lines = [
+            "  ".join(
+                col.ljust(widths[i]) if i == 0 else col.rjust(widths[i])
+                for i, col in enumerate(row)
+            )
+            for row in [header, *rows]
+        ]
+        lines.insert(1, "=" * len(lines[0]))
+        lines.append("-" * len(lines[0]))
+        lines.append(f"Total: {self.duration * 1000:.3f} ms")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.table()
+
+
+class TraversalProfiler:
+    """
+    Collects the metrics of a profiled traversal.
+
+    The time is attributed exclusively to the step whose code is running:
+    the profiler keeps a stack of active steps, pulling a traverser from an
+    upstream step or invoking an anonymous traversal pushes the respective
+    step, so lazily chained generators are accounted for correctly.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[int, StepMetrics] = {}
+        self._stack: List[StepMetrics] = []
+        self._last = None
+        self.start_time = perf_counter()
+
+    def _get_metrics(self, step: "Step") -> StepMetrics:
+        metrics = self.metrics.get(id(step))
+        if metrics is None:
+            metrics = StepMetrics(step.print_query())
+            self.metrics[id(step)] = metrics
+        return metrics
+
+    def _enter(self, metrics: StepMetrics):
+        now = perf_counter()
+        if self._stack:
+            self._stack[-1].self_time += now - self._last
+        self._stack.append(metrics)
+        self._last = now
+
+    def _exit(self):
+        now = perf_counter()
+        self._stack.pop().self_time += now - self._last
+        self._last = now
+
+    def run_step(self, step: "Step", traversers: Iterable) -> Iterable:
+        """run the given step while recording its metrics"""
+        metrics = self._get_metrics(step)
+        metrics.calls += 1
+        if isinstance(traversers, (list, set, tuple)):
+            metrics.traversers_in += len(traversers)
+        else:
+            traversers = self._count_input(traversers, metrics)
+        self._enter(metrics)
+        try:
+            output = step(traversers)
+        finally:
+            self._exit()
+        if isinstance(output, (list, set, tuple)):
+            metrics.traversers_out += len(output)
+            return output
+        return self._wrap_output(output, metrics)
+
+    def _count_input(self, traversers: Iterable, metrics: StepMetrics):
+        for t in traversers:
+            metrics.traversers_in += 1
+            yield t
+
+    def _wrap_output(self, output: Iterable, metrics: StepMetrics):
+        it = iter(output)
+        while True:
+            self._enter(metrics)
+            try:
+                t = next(it)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            metrics.traversers_out += 1
+            yield t
+
+    def get_metrics(self, traversal: "Traversal") -> TraversalMetrics:
+        """collect the metrics of all (non-terminal) steps of the given traversal"""
+        duration = perf_counter() - self.start_time
+
+        def collect(steps: List["Step"]) -> List[StepMetrics]:
+            result = []
+            for step in steps:
+                if step.isterminal:
+                    continue
+                metrics = self._get_metrics(step)
+                metrics.children = [
+                    child
+                    for anon_traversal in (step.anon_traversals or [])
+                    for child in collect(anon_traversal.query_steps or [])
+                ]
+                result.append(metrics)
+            return result
+
+        result = TraversalMetrics(collect(traversal.query_steps), duration)
+        total = sum(step.time for step in result.steps)
+        for _, step in result.flatten():
+            step.percent = 100 * step.time / total if total > 0 else 0.0
+        return result
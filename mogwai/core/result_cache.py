@@ -0,0 +1,86 @@
+"""
+Created on 2026-10-19
+
+An LRU cache for the results of traversals, see MogwaiGraphTraversalSource.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from mogwai.config import RESULT_CACHE_SIZE
+
+
+class ResultCache:
+    """
+    A thread safe LRU cache with an optional time to live.
+
+    The keys are built by the traversals and contain the graph version,
+    so results of a graph that has been modified in the meantime are never
+    returned, they are evicted like any other least recently used entry.
+    """
+
+    def __init__(self, max_size: int = RESULT_CACHE_SIZE, ttl: Optional[float] = None):
+        """
+        Args:
+            max_size: the maximum number of cached results
+            ttl: the number of seconds a result stays valid, None for no expiry
+        """
+        if max_size < 1:
+            raise ValueError("The size of a result cache must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        look up a result
+
+        Returns:
+            Tuple[bool, Any]: whether the key was found and the cached result
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """cache a result, evicting the least recently used one if the cache is full"""
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """remove all results, the counters are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """the hit, miss and eviction counters and the current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
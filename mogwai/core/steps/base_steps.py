@@ -1,11 +1,28 @@
-from mogwai.core.traverser import Traverser
+from mogwai.core.traverser import Traverser, TraverserBatch
 from abc import abstractmethod
 from mogwai.core.exceptions import GraphTraversalError
-from typing import List, TYPE_CHECKING, Any, Callable, Iterable
+from itertools import chain, islice
+from typing import List, TYPE_CHECKING, Any, Callable, Iterable, Iterator
 if TYPE_CHECKING:
     from mogwai.core.traversal import Traversal, AnonymousTraversal
 from mogwai.utils.type_utils import TypeUtils as tu
 
+BATCH_SIZE = 1024 #default number of traversers per batch in batch mode
+
+def batched(items:Iterable, size:int=BATCH_SIZE) -> Iterator[List]:
+    """split items into lists of at most `size` items"""
+    if isinstance(items, list):
+        for i in range(0, len(items), size):
+            yield items[i:i+size]
+    else:
+        it = iter(items)
+        while batch := list(islice(it, size)):
+            yield batch
+
+def unbatched(batches:Iterable[List]) -> Iterator:
+    """flatten batches into a stream of items"""
+    return chain.from_iterable(batches)
+
 class Step:
     ISTERMINAL  = 1<<0
     ISSTART     = 1<<1
@@ -15,6 +32,9 @@ class Step:
     SUPPORTS_MULTIPLE_BY = 1<<5 | SUPPORTS_BY
     SUPPORTS_FROMTO = 1<<6
     SUPPORTS_WITH = 1<<7
+    ISBARRIER   = 1<<8 #the step materializes all incoming traversers before producing output
+    READS_STORE = 1<<9 #the step reads the objects saved in the traverser with `as_`
+    HAS_SIDE_EFFECTS = 1<<10 #the step changes the graph or calls user code for its effects
 
     def __init__(self, traversal:'Traversal', flags:int=0):
         self.traversal = traversal
@@ -22,6 +42,7 @@ class Step:
         self._by = None
         self._is_built = False
         self.anon_traversals:List['AnonymousTraversal']| None = None
+        self._batch = None #optional function that maps a list of traversers onto a list of traversers (see `batches`)
 
     def register_anon_traversal(self, *anon_traversals:'AnonymousTraversal'):
         if self.anon_traversals is None:
@@ -43,6 +64,14 @@ class Step:
         else:
             return (self.flags & Step.NEEDS_PATH)!=0
     @property
+    def is_pure(self):
+        """whether the output only depends on the graph elements of the incoming traversers (not on their path or store) and the step has no side effects"""
+        if self.flags & (Step.NEEDS_PATH|Step.READS_STORE|Step.HAS_SIDE_EFFECTS): return False
+        return not self.anon_traversals or all(at.is_pure for at in self.anon_traversals)
+    @property
+    def isbarrier(self):
+        return (self.flags & Step.ISBARRIER)!=0
+    @property
     def supports_by(self):
         return (self.flags & Step.SUPPORTS_BY)!=0
     @property
@@ -55,10 +84,25 @@ class Step:
     def supports_fromto(self):
         return (self.flags & Step.SUPPORTS_FROMTO)==Step.SUPPORTS_FROMTO
 
+    @property
+    def batch_native(self):
+        return self._batch is not None or type(self).batches is not Step.batches
+
     @abstractmethod
     def __call__(self, traversers: Iterable['Traverser']) -> Iterable['Traverser']:
         pass
 
+    def batches(self, batches:Iterable[List['Traverser']], size:int=BATCH_SIZE) -> Iterable[List['Traverser']]:
+        """
+        The batch protocol: process lists of traversers instead of single traversers.
+        Streaming steps provide `self._batch`, barrier steps override this method.
+        Any other step is adapted by running it on the flattened batches.
+        """
+        if self._batch is not None:
+            return (out for batch in batches if (out:=self._batch(batch)))
+        traversers = [] if self.isstart else unbatched(batches)
+        return batched(self(traversers), size)
+
     @abstractmethod
     def build(self):
         if self.anon_traversals:
@@ -73,6 +117,10 @@ class Step:
 
     def print_query(self) -> str: return self.__class__.__name__
 
+    def used_indexes(self) -> List[str]:
+        """the names of the graph indexes this step uses (see `Traversal.explain`)"""
+        return []
+
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}[isstart={self.isstart}, isterminal={self.isterminal}]>"
 
@@ -96,7 +144,8 @@ class FlatMapStep(Step):
 
 class SideEffectStep(Step):
     def __init__(self, traversal: 'Traversal', side_effect: 'AnonymousTraversal|Callable[[Traverser], None]', **kwargs):
-        super().__init__(traversal, **kwargs)
+        flags = kwargs.pop('flags', 0)
+        super().__init__(traversal, flags=flags|Step.ISBARRIER|Step.HAS_SIDE_EFFECTS, **kwargs)
         self.side_effect = side_effect
 
     def __call__(self, traversers: Iterable['Traverser']) -> Iterable['Traverser']:
@@ -114,11 +163,23 @@ class FilterStep(Step):
     def __init__(self, traversal:'Traversal', **kwargs):
         super().__init__(traversal, **kwargs)
         self._filter = None #self._filter should contain a function that takes a dict-like object and returns a bool
+        self._predicate = None #the predicate on the data of graph elements, if the step only checks that (see `_filter_elements`)
 
     def __call__(self, traversers: Iterable['Traverser']) -> Iterable['Traverser']:
         if(self._filter is None): raise GraphTraversalError("No filter defined! This is most likely a bug.")
         return (t for t in traversers if self._filter(t))
 
+    def _filter_elements(self, predicate:Callable[[dict], bool]):
+        """filter traversers by the data of their graph element, one by one and in batches"""
+        self._predicate = predicate
+        self._filter = lambda t: predicate(self.traversal._get_element(t))
+        def _batch(batch:List['Traverser']|'TraverserBatch') -> List['Traverser']|'TraverserBatch':
+            elements = self.traversal._get_elements(batch)
+            if isinstance(batch, TraverserBatch):
+                return batch.select([i for i, e in enumerate(elements) if predicate(e)])
+            return [t for t, e in zip(batch, elements) if predicate(e)]
+        self._batch = _batch
+
 class BranchStep(Step):
     def __init__(self, traversal:'Traversal', **kwargs):
         super().__init__(traversal, **kwargs)
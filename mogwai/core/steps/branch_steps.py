@@ -32,6 +32,11 @@ class Repeat(BranchStep):
         self._until = until
         self.register_anon_traversal(until)
 
+    @property
+    def isbarrier(self) -> bool:
+        #without `until` or `emit` the repeated traversal is simply chained `times` times
+        return self.until is not None or bool(self.emit)
+
     @property
     def emit(self) -> bool | AnonymousTraversal:
         return self._emit
@@ -70,7 +75,7 @@ class Repeat(BranchStep):
             def until_step(travs:Iterable[Traverser]) -> Tuple[Set[Traverser], Set[Traverser]]:
                 travs = tu.ensure_is_set(travs)
                 #we can't use generators here
-                condition_fulfilled = {t for t in travs if next(iter(self.until([t.copy()])), _NA)!=_NA}
+                condition_fulfilled = {t for t in travs if self.until.first(t, _NA) is not _NA}
                 #for remaining_travs the condition is fullfilled
                 return condition_fulfilled, travs-condition_fulfilled
 
@@ -122,7 +127,7 @@ class Repeat(BranchStep):
 
 class Branch(BranchStep):
     def __init__(self, traversal:'Traversal',branchFunc:'AnonymousTraversal'):
-        super().__init__(traversal=traversal)
+        super().__init__(traversal=traversal, flags=Branch.ISBARRIER)
         self.branchFunc = branchFunc
         self.options:Dict[Any,'AnonymousTraversal'] = {}
         self.defaultStep=None
@@ -150,8 +155,7 @@ class Branch(BranchStep):
     def __call__(self,traversers:Iterable[Traverser])->Iterable[Traverser]:
         valueTraverserPairs = []
         for traverser in traversers:
-            ret = self.branchFunc([traverser.copy()])
-            ret = next(iter(ret), _NA)
+            ret = self.branchFunc.first(traverser, _NA)
             if ret!=_NA:
                 if isinstance(ret, Value):
                     valueTraverserPairs.append((traverser,ret.value))
@@ -1,7 +1,8 @@
-from .base_steps import FilterStep
+from .base_steps import FilterStep, BATCH_SIZE
 from typing import List, Set, Tuple, Any, Generator, Iterable
 from mogwai.core import Traversal, AnonymousTraversal
 from mogwai.core import Traverser
+from mogwai.core.traverser import TraverserBatch
 from mogwai.core.traverser import Value, Property
 from mogwai.decorators import as_traversal_function
 from mogwai.utils.type_utils import TypeUtils as tu
@@ -12,11 +13,29 @@ logger = logging.getLogger("Mogwai")
 
 _NA = object() #represents missing values
 
+class _Seen:
+    """
+    set of the objects seen so far, unhashable objects are compared one by one
+    """
+    def __init__(self):
+        self.hashable = set()
+        self.unhashable = []
+
+    def add(self, obj) -> bool:
+        """add obj and return whether it was not seen before"""
+        try:
+            if obj in self.hashable: return False
+            self.hashable.add(obj)
+        except TypeError:
+            if obj in self.unhashable: return False
+            self.unhashable.append(obj)
+        return True
+
 class Filter(FilterStep):
     def __init__(self, traversal:Traversal, filter:AnonymousTraversal):
         super().__init__(traversal)
         def _filter(t:'Traverser'):
-            return next(iter(filter([t.copy()])), _NA) is not _NA
+            return filter.first(t, _NA) is not _NA
         self._filter = _filter
         self.register_anon_traversal(filter)
 
@@ -27,7 +46,7 @@ class Not(FilterStep):
     def __init__(self, traversal:Traversal, filter:AnonymousTraversal):
         super().__init__(traversal)
         def _filter(t:'Traverser'):
-            return next(iter(filter([t.copy()])), _NA) is _NA
+            return filter.first(t, _NA) is _NA
         self._filter = _filter
         self.register_anon_traversal(filter)
 
@@ -38,7 +57,7 @@ class And(FilterStep):
     def __init__(self, traversal:Traversal, optA:AnonymousTraversal,optB:AnonymousTraversal):
         super().__init__(traversal)
         def _filter(t:'Traverser'):
-            return next(iter(optA([t.copy()])), _NA) is not _NA and next(iter(optB([t.copy()])), _NA) is not _NA
+            return optA.first(t, _NA) is not _NA and optB.first(t, _NA) is not _NA
         self._filter = _filter
         self.register_anon_traversal(optA, optB)
 
@@ -49,13 +68,162 @@ class Or(FilterStep):
     def __init__(self, traversal:Traversal, optA:AnonymousTraversal,optB:AnonymousTraversal):
         super().__init__(traversal)
         def _filter(t:'Traverser'):
-            return next(iter(optA([t.copy()])), _NA) is not _NA or next(iter(optB([t.copy()])), _NA) is not _NA
+            return optA.first(t, _NA) is not _NA or optB.first(t, _NA) is not _NA
         self._filter = _filter
         self.register_anon_traversal(optA, optB)
 
     def print_query(self) -> str:
         return f"{self.__class__.__name__}({', '.join((t.print_query() for t in self.anon_traversals))})"
 
+class SemiJoin(FilterStep):
+    """
+    `filter_` (or `not_` if `negate`) with a predicate traversal that only moves along edges (out, in_, both)
+    and checks the data of the vertices it reaches (has, has_label, ...), see `optimizer.FilterToSemiJoin`.
+
+    The traversers are checked one by one with the (memoized) predicate traversal until this becomes more
+    expensive than computing the set of all vertices that pass the predicate at once:
+    starting from the vertices that pass the last checks (looked up in the `OS` index if the graph has one),
+    the edges are walked backwards. From then on, a traverser is checked by set membership.
+    """
+    def __init__(self, traversal:Traversal, predicate:AnonymousTraversal, negate:bool=False):
+        super().__init__(traversal)
+        self.negate = negate
+        self.register_anon_traversal(predicate)
+        self.stages = None
+        def _filter(t:'Traverser'):
+            return (self._passes(t) is not _NA) ^ self.negate
+        self._filter = _filter
+        def _batch(batch:List['Traverser']|TraverserBatch) -> List['Traverser']|TraverserBatch:
+            if isinstance(batch, TraverserBatch):
+                return batch.select([i for i, t in enumerate(batch) if _filter(t)])
+            return [t for t in batch if _filter(t)]
+        self._batch = _batch
+
+    @staticmethod
+    def stages_of(predicate:AnonymousTraversal) -> List[Tuple[Any, List[Any]]]|None:
+        """
+        split the steps of the (built) predicate traversal into the vertex filters before the first hop
+        and (hop, vertex filters) pairs, None if the traversal does not consist of such steps only
+        """
+        from .flatmap_steps import Out, In, Both
+        stages = [(None, [])]
+        for step in predicate.query_steps:
+            if type(step) in (Out, In, Both):
+                stages.append((step, []))
+            elif isinstance(step, FilterStep) and step._predicate is not None:
+                stages[-1][1].append(step)
+            else:
+                return None
+        return stages if len(stages) > 1 else None
+
+    def build(self):
+        super().build()
+        self.stages = self.stages_of(self.anon_traversals[0])
+        self.members = None
+        self.version = None
+        self.checked = 0
+        self.fanout = self._fanout() if self.stages else 0
+        self.threshold = self._join_cost() if self.stages else float("inf")
+
+    def _passes(self, t:'Traverser'):
+        if type(t) is Traverser and not t.is_edge:
+            graph = self.traversal.graph
+            if self.members is not None and self.version != graph.version:
+                #the graph changed while the traversal ran
+                self.members, self.checked = None, 0
+            if self.members is None:
+                self.checked += 1
+                if self.checked * self.fanout > self.threshold:
+                    self.members, self.version = self._join(), graph.version
+            if self.members is not None:
+                return True if t.node_id in self.members else _NA
+        return self.anon_traversals[0].first(t, _NA)
+
+    def _hop_degree(self, hop) -> float:
+        from .flatmap_steps import Both
+        graph = self.traversal.graph
+        degree = graph.number_of_edges() / max(graph.number_of_nodes(), 1)
+        return 2 * degree if type(hop) is Both else degree
+
+    def _fanout(self) -> float:
+        """estimated number of traversers produced by running the predicate traversal once"""
+        fanout = 1.0
+        for hop, _ in self.stages[1:]:
+            fanout *= self._hop_degree(hop)
+        return fanout
+
+    def _join_cost(self) -> float:
+        """estimated number of vertices and edges visited by `_join`"""
+        graph = self.traversal.graph
+        edges = graph.number_of_edges()
+        candidates = self._candidates(self.stages[-1][1])
+        size = len(candidates) if candidates is not None else graph.number_of_nodes()
+        if not self.stages[-1][1]:
+            size = edges
+        cost = size
+        for hop, _ in self.stages[:0:-1]:
+            size = min(edges, size * self._hop_degree(hop))
+            cost += size
+        return cost
+
+    def _candidates(self, checks:List[FilterStep]) -> Set|None:
+        """the vertices that may pass a Has check according to the `OS` index, None without (current) index"""
+        graph = self.traversal.graph
+        lookup = graph.spog_index.get_lookup("O", "S")
+        if lookup is None or not graph.index_is_current:
+            return None
+        for check in checks:
+            #only top level properties are indexed, nested keys and collections are not
+            if type(check) is Has and type(check.key) is str and check.key not in ("id", graph.config.label_field) \
+                and check.label is None and check.value is not None and not callable(check.value):
+                try:
+                    return lookup.get(check.value, set())
+                except TypeError:
+                    continue
+        return None
+
+    def used_indexes(self) -> List[str]:
+        if self.stages and self._candidates(self.stages[-1][1]) is not None:
+            return ["OS"]
+        return []
+
+    def _join(self) -> Set:
+        """the set of vertices for which the predicate traversal has at least one result"""
+        from .flatmap_steps import Out, In
+        graph = self.traversal.graph
+        nodes = graph._node
+        label_field = graph.config.edge_label_field
+        def passing(vertices:Iterable, checks:List[FilterStep]) -> Set:
+            predicates = [check._predicate for check in checks]
+            return {v for v in vertices if v in nodes and all(p(nodes[v]) for p in predicates)}
+        hop, checks = self.stages[-1]
+        if checks:
+            candidates = self._candidates(checks)
+            current = passing(nodes if candidates is None else candidates, checks)
+        else:
+            current = None #any vertex
+        for k in range(len(self.stages)-1, 0, -1):
+            hop = self.stages[k][0]
+            direction = hop.direction
+            match = (lambda data: True) if direction is None else (lambda data: data.get(label_field) == direction)
+            #(adjacency walked forward by the hop, adjacency to walk backwards)
+            if type(hop) is Out: adjacencies = [(graph._succ, graph._pred)]
+            elif type(hop) is In: adjacencies = [(graph._pred, graph._succ)]
+            else: adjacencies = [(graph._succ, graph._pred), (graph._pred, graph._succ)]
+            previous = set()
+            for forward, backward in adjacencies:
+                if current is None:
+                    previous.update(u for u, neighbors in forward.items() if any(match(data) for data in neighbors.values()))
+                else:
+                    for v in current:
+                        previous.update(u for u, data in backward[v].items() if match(data))
+            current = passing(previous, self.stages[k-1][1])
+        return current
+
+    def print_query(self) -> str:
+        name = "AntiJoin" if self.negate else self.__class__.__name__
+        return f"{name}({self.anon_traversals[0].print_query()})"
+
 class Has(FilterStep):
     def __init__(self, traversal:Traversal, key:str|List[str], value:Any=None, label:str|None=None):
         super().__init__(traversal)
@@ -64,18 +232,18 @@ class Has(FilterStep):
         self.value = value
         indexer = (lambda t: t.get) if key=="id" else tu.get_dict_indexer(key, _NA)
         if value is None:
-            self._filter = lambda t: indexer(self.traversal._get_element(t)) != _NA
+            self._filter_elements(lambda e: indexer(e) != _NA)
         elif label is not None:
             if value is None:
                 raise QueryError("Cannot filter by label without a value")
             if callable(value):
                 raise QueryError("Cannot filter by label and a function as value")
-            self._filter = lambda t: indexer(self.traversal._get_element(t)) == self.value and self.label in self.traversal._get_element(t)['labels']
+            self._filter_elements(lambda e: indexer(e) == self.value and self.label in e['labels'])
         else:
             if callable(value):
-                self._filter = lambda t: self.value(indexer(self.traversal._get_element(t)))
+                self._filter_elements(lambda e: self.value(indexer(e)))
             else:
-                self._filter = lambda t: indexer(self.traversal._get_element(t)) == self.value
+                self._filter_elements(lambda e: indexer(e) == self.value)
 
 class HasWithin(FilterStep):
     """
@@ -86,14 +254,14 @@ class HasWithin(FilterStep):
         self.key = key
         self.valueOptions = valueOptions
         indexer = (lambda t: t.get) if key=="id" else tu.get_dict_indexer(key, _NA)
-        self._filter = lambda t: indexer(self.traversal._get_element(t)) in self.valueOptions
+        self._filter_elements(lambda e: indexer(e) in self.valueOptions)
 
 class HasNot(FilterStep):
     def __init__(self, traversal:Traversal, key:str|List[str]):
         super().__init__(traversal)
         self.key = key
         indexer = tu.get_dict_indexer(key, _NA)
-        self._filter = lambda t: indexer(self.traversal._get_element(t)) == _NA
+        self._filter_elements(lambda e: indexer(e) == _NA)
 
 class HasKey(FilterStep):
     def __init__(self, traversal:Traversal, *keys:str):
@@ -160,16 +328,17 @@ class Contains(FilterStep):
         self.key = key
         self.value = value
         indexer = tu.get_dict_indexer(self.key, [])
-        self._filter = lambda t: self.value in indexer(self.traversal._get_element(t))
+        self._filter_elements(lambda e: self.value in indexer(e))
 
 class ContainsAll(FilterStep):
     #same as Has, but `values` can be a collection; all items in `values` need to be present
     def __init__(self, traversal:Traversal, key:str|List[str], values:Set[Any]|List[Any]):
         super().__init__(traversal)
         self.key = key
+        self.values = values
         if(type(values) is set):
             def _hasall(x):
-                if(type(x) is set):
+                if(type(x) in (set, frozenset)):
                     return values.issubset(x) #this is a lot faster
                 else: return all([v in x for v in values])
         else:
@@ -185,11 +354,11 @@ class Within(FilterStep):
         self.key = key
         self.options = options
         indexer = tu.get_dict_indexer(key)
-        self._filter = lambda t: indexer(self.traversal._get_element(t)) in options
+        self._filter_elements(lambda e: indexer(e) in options)
 
 class Is(FilterStep):
     def __init__(self, traversal: Traversal, condition: Any):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=Is.ISBARRIER)
         self.condition = condition
 
     def __call__(self, traversers: Iterable['Traverser']) -> 'Generator[Traverser]':
@@ -292,23 +461,31 @@ class Dedup(FilterStep):
         self.by = by
 
     def build(self):
-        self.seen = []
-        def _dedup(obj):
-            if obj in self.seen: return False
-            else:
-                self.seen.append(obj)
-                return True
-
+        self.seen = _Seen()
         if self.by is None:
-            self._filter = lambda t: _dedup((t.get,t.path) if isinstance(t, Traverser) else t.val)
+            self._filter = lambda t: self.seen.add((t.get, tuple(t.path) if t.path else t.path) if isinstance(t, Traverser) else t.val)
         else:
             indexer = tu.get_dict_indexer(self.by, None)
-            self._filter = lambda t: (x:=indexer(self.traversal._get_element(t))) is not None and _dedup(x)
+            self._filter = lambda t: (x:=indexer(self.traversal._get_element(t))) is not None and self.seen.add(x)
+        def _batch(batch:List[Traverser]|TraverserBatch) -> List[Traverser]|TraverserBatch:
+            if not isinstance(batch, TraverserBatch):
+                return [t for t in batch if self._filter(t)]
+            if self.by is None:
+                keys = ((element_id, None) for element_id in batch.ids)
+                return batch.select([i for i, key in enumerate(keys) if self.seen.add(key)])
+            indexer = tu.get_dict_indexer(self.by, None)
+            elements = self.traversal._get_elements(batch)
+            return batch.select([i for i, e in enumerate(elements) if (x:=indexer(e)) is not None and self.seen.add(x)])
+        self._batch = _batch
 
     def __call__(self, traversers: Iterable[Traverser]) -> Iterable[Traverser]:
-        self.seen = []
+        self.seen = _Seen()
         return super().__call__(traversers)
 
+    def batches(self, batches:Iterable[List[Traverser]], size:int=BATCH_SIZE) -> Iterable[List[Traverser]]:
+        self.seen = _Seen()
+        return super().batches(batches, size)
+
 @as_traversal_function
 def or_(optA:AnonymousTraversal, optB:AnonymousTraversal):
     return Or(None, optA, optB)
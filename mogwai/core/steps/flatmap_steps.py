@@ -1,15 +1,57 @@
 from .base_steps import FlatMapStep
-from typing import Iterable
+from typing import Iterable, List
 from mogwai.core import Traversal
-from mogwai.core.traverser import Traverser, Value as TravValue, Property
+from mogwai.core.traverser import Traverser, TraverserBatch, Value as TravValue, Property
 from mogwai.decorators import as_traversal_function
 from mogwai.core.exceptions import GraphTraversalError
 from mogwai.utils.type_utils import TypeUtils as tu
 
+def _expand(step:FlatMapStep, adjacency:str, to_edge:bool=False):
+    """
+    batch implementation of the steps that move from vertices to their neighbors or edges
+    `adjacency` is the name of the networkx adjacency dict to use (`_succ` or `_pred`)
+    """
+    outgoing = adjacency == "_succ"
+    def edge_error():
+        return GraphTraversalError(f"{step.__class__.__name__} cannot be applied to edges.")
+
+    def _batch(batch:List[Traverser]|TraverserBatch) -> List[Traverser]|TraverserBatch:
+        adj = getattr(step.traversal.graph, adjacency)
+        direction = step.direction
+        if isinstance(batch, TraverserBatch):
+            if batch.is_edge: raise edge_error()
+            sources, states = batch.ids, batch.states
+        elif step.traversal.needs_path:
+            #paths can only be tracked by materialized traversers
+            result = []
+            for t in batch:
+                if t.is_edge: raise edge_error()
+                for other, data in adj[t.node_id].items():
+                    if direction is not None and data.get('labels') != direction: continue
+                    if not to_edge: result.append(t.copy_to(other))
+                    elif outgoing: result.append(t.copy_to(t.node_id, other))
+                    else: result.append(t.copy_to(other, t.node_id))
+            return result
+        else:
+            if any(t.is_edge for t in batch): raise edge_error()
+            sources, states = [t.node_id for t in batch], batch
+        ids = []
+        new_states = None if states is None else []
+        for i, source in enumerate(sources):
+            targets = [other for other, data in adj[source].items() if direction is None or data.get('labels') == direction]
+            if to_edge:
+                targets = [(source, other) for other in targets] if outgoing else [(other, source) for other in targets]
+            ids.extend(targets)
+            if new_states is not None:
+                new_states.extend([states[i]] * len(targets))
+        return TraverserBatch(ids, new_states, is_edge=to_edge)
+    return _batch
+
 class Out(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=Out.ISBARRIER)
         self.direction = direction
+        self._batch = _expand(self, "_succ")
         if self.direction is None:
             self._flatmap = lambda t: (t.copy_to(neighbor) for neighbor in self.traversal.graph.successors(t.node_id))
         else:
@@ -23,8 +65,9 @@ class Out(FlatMapStep):
 
 class OutE(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=OutE.ISBARRIER)
         self.direction = direction
+        self._batch = _expand(self, "_succ", to_edge=True)
         if self.direction is None:
             self._flatmap = lambda t: (t.copy_to(*edge) for edge in self.traversal.graph.out_edges(nbunch=t.node_id))
         else:
@@ -38,8 +81,9 @@ class OutE(FlatMapStep):
 
 class In(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=In.ISBARRIER)
         self.direction = direction
+        self._batch = _expand(self, "_pred")
         if self.direction is None:
             self._flatmap = lambda t: (t.copy_to(neighbor) for neighbor in self.traversal.graph.predecessors(t.node_id))
         else:
@@ -53,8 +97,9 @@ class In(FlatMapStep):
 
 class InE(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=InE.ISBARRIER)
         self.direction = direction
+        self._batch = _expand(self, "_pred", to_edge=True)
         if self.direction is None:
             self._flatmap = lambda t: (t.copy_to(*edge) for edge in self.traversal.graph.in_edges(nbunch=t.node_id))
         else:
@@ -68,7 +113,7 @@ class InE(FlatMapStep):
 
 class InV(FlatMapStep):
     def __init__(self, traversal:Traversal):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=InV.ISBARRIER)
         self._flatmap = lambda t: (t.move_to(t.target),) #needs to be an iterable
 
     def __call__(self, traversers:Iterable[Traverser]) -> Iterable[Traverser]:
@@ -79,7 +124,7 @@ class InV(FlatMapStep):
 
 class OutV(FlatMapStep):
     def __init__(self, traversal:Traversal):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=OutV.ISBARRIER)
         self._flatmap = lambda t: (t.move_to(t.node_id),) #needs to be an iterable
 
     def __call__(self, traversers:Iterable[Traverser]) -> Iterable[Traverser]:
@@ -90,7 +135,7 @@ class OutV(FlatMapStep):
 
 class Both(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=Both.ISBARRIER)
         self.direction = direction
         if self.direction is None:
             def _flatmap(t:'Traverser'):
@@ -114,7 +159,7 @@ class Both(FlatMapStep):
 
 class BothE(FlatMapStep):
     def __init__(self, traversal:Traversal, direction:str=None):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=BothE.ISBARRIER)
         self.direction = direction
         if self.direction is None:
             def _flatmap(t:'Traverser'):
@@ -136,7 +181,7 @@ class BothE(FlatMapStep):
 
 class BothV(FlatMapStep):
     def __init__(self, traversal:Traversal):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=BothV.ISBARRIER)
         self._flatmap = lambda t: (t.copy_to(t.node_id),t.move_to(t.target))
 
     def __call__(self, traversers:Iterable[Traverser]) -> Iterable[Traverser]:
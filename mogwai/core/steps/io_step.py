@@ -93,7 +93,7 @@ class IO(Step):
             #read from file
             graph = backend.read(self.file_path, self.config)
             #merge the graph with the current graph
-            self.traversal.graph.merge(graph)
+            self.traversal.graph.merge(graph, copy=False)
         elif self.task == IOEnum.writer:
             #write to file
             backend.write(self.traversal.graph, self.file_path)
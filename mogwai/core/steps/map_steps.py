@@ -1,11 +1,14 @@
-from .base_steps import MapStep
+from abc import abstractmethod
+from .base_steps import MapStep, BATCH_SIZE, batched
 from typing import List, Any, Iterable, Generator, Callable, Tuple
 from mogwai.core.traversal import Traversal, AnonymousTraversal
-from mogwai.core.traverser import Traverser, Value as TravValue, Property
+from mogwai.core.traverser import Traverser, TraverserBatch, Value as TravValue, Property
 from mogwai.core.steps.enums import Scope, Order as EnumOrder
 from mogwai.core.exceptions import QueryError, GraphTraversalError
 from mogwai.decorators import as_traversal_function
 from mogwai.utils.type_utils import TypeUtils as tu
+from collections import Counter
+from .reducers import REDUCERS, Reducer, Extremum, _EMPTY
 import logging
 logger = logging.getLogger("Mogwai")
 
@@ -74,6 +77,23 @@ class Values(MapStep):
                 elif x!=_NA:
                     yield t.to_value(x)
             self._map = _map
+            def _batch(batch:List[Traverser|Property]|TraverserBatch) -> List[TravValue]:
+                indexer = self.indexers[0]
+                if isinstance(batch, TraverserBatch):
+                    to_value = batch.to_value
+                    owners = batch.iter_states()
+                else:
+                    to_value = lambda t, x: t.to_value(x)
+                    owners = batch
+                result = []
+                for t, obj in zip(owners, self.traversal._get_elements(batch, values=True)):
+                    x = indexer(obj)
+                    if isinstance(x, list):
+                        result.extend(to_value(t, y) for y in x)
+                    elif x!=_NA:
+                        result.append(to_value(t, x))
+                return result
+            self._batch = _batch
         else:
             def _map(t:Traverser|Property) -> Generator[TravValue,None,None]:
                 #Same as above, but now with an iteration over the keys.
@@ -190,7 +210,7 @@ class ElementMap(MapStep):
 class Select(MapStep):
     def __init__(self, traversal:Traversal, keys:str|List[str], by:List[str]|None=None, **kwargs):
         flags = kwargs.pop('flags', 0)
-        super().__init__(traversal=traversal, flags=flags|Select.SUPPORTS_MULTIPLE_BY, **kwargs)
+        super().__init__(traversal=traversal, flags=flags|Select.SUPPORTS_MULTIPLE_BY|Select.READS_STORE, **kwargs)
         self.keys = keys
         self.by = [by] if by else []
 
@@ -249,7 +269,7 @@ class Select(MapStep):
 
 class Order(MapStep):
     def __init__(self, traversal:Traversal, by:str|List[str]|AnonymousTraversal=None, order:EnumOrder|None=None, asc:bool|None=None, **kwargs):
-        super().__init__(traversal, flags=Order.SUPPORTS_ANON_BY)
+        super().__init__(traversal, flags=Order.SUPPORTS_ANON_BY|Order.ISBARRIER)
 
         desc = kwargs.get('desc', False)
         if asc is None:
@@ -260,7 +280,7 @@ class Order(MapStep):
         self.asc = asc
         self.order = order
         self._by = by
-        logger.debug(f"Order is sorting in {('ascending' if self.asc else 'descending')} order")
+        logger.debug("Order is sorting in %s order", 'ascending' if self.asc else 'descending')
 
     @property
     def by(self):
@@ -314,7 +334,7 @@ class Order(MapStep):
                 elif isinstance(self.by, AnonymousTraversal):
                     for t in traversers:
                         travs.append(t)
-                        keys.append(extract_first_item(tu.ensure_is_list(self.by([t.copy()]))))
+                        keys.append(extract_first_item(self.by.results(t)))
             else:
                 traversers = tu.ensure_is_list(traversers)
                 if(len(traversers)==0): return traversers
@@ -335,7 +355,7 @@ class Order(MapStep):
                     indexer = tu.get_dict_indexer(self.by,None)
                     sortmap = {t:x for t in traversers if (x:=indexer(self.traversal._get_element(t))) is not None}
                 elif isinstance(self.by, AnonymousTraversal):
-                    sortmap = {t:extract_first_item(tu.ensure_is_list(self.by([t.copy()]))) for t in traversers}
+                    sortmap = {t:extract_first_item(self.by.results(t)) for t in traversers}
             else:
                 traversers = tu.ensure_is_list(traversers)
                 if(len(traversers)==0): return traversers
@@ -345,6 +365,20 @@ class Order(MapStep):
                     raise GraphTraversalError("Cannot order traversers without `by` key")
             return (k for k, _ in sorted(sortmap.items(), key=lambda item: item[1], reverse=not(self.asc)))
 
+    def batches(self, batches:Iterable[List[Traverser]|TraverserBatch], size:int=BATCH_SIZE) -> Iterable[List[Traverser]|TraverserBatch]:
+        #ordering needs all traversers at once
+        batches = list(batches)
+        if batches and isinstance(self.by, (str, list)) and all(isinstance(batch, TraverserBatch) for batch in batches) \
+            and len({batch.is_edge for batch in batches})==1:
+            batch = TraverserBatch.concat(batches)
+            indexer = tu.get_dict_indexer(self.by, None)
+            keys = [indexer(e) for e in self.traversal._get_elements(batch)]
+            indices = sorted((i for i, key in enumerate(keys) if key is not None), key=keys.__getitem__, reverse=not self.asc)
+            ordered = batch.select(indices)
+            return (ordered.select(range(i, min(i+size, len(ordered)))) for i in range(0, len(ordered), size))
+        traversers = [t for batch in batches for t in batch]
+        return batched(tu.ensure_is_list(self(traversers)), size)
+
     def print_query(self) -> str:
         if isinstance(self.by, AnonymousTraversal):
             return f"{self.__class__.__name__}(by {self.by.print_query()})"
@@ -370,6 +404,7 @@ class Fold(MapStep):
         self.foldfunc=foldfunc
         if((seed is None) ^ (foldfunc is None)):
             raise QueryError("`seed` and `foldfunc` should be both None or both not None.")
+        self.flags |= Fold.ISBARRIER
         
     def __call__(self, traversers:Iterable[Traverser]) -> List[Traverser]:
         if self.seed is not None:
@@ -415,7 +450,7 @@ class Path(MapStep):
 
 class Count(MapStep):
     def __init__(self, traversal:Traversal, scope:Scope=Scope.global_):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=Count.ISBARRIER if scope==Scope.global_ else 0)
         self.scope = scope
 
     def __call__(self, traversers:Iterable[Traverser]) -> List[TravValue]:
@@ -431,109 +466,238 @@ class Count(MapStep):
             return gen()
         return [TravValue(len(tu.ensure_is_list(traversers)))]
 
-class Max(MapStep):
-    def __init__(self, traversal: Traversal, scope:Scope=Scope.global_):
-        super().__init__(traversal)
+    def batches(self, batches:Iterable[List[Traverser]], size:int=BATCH_SIZE) -> Iterable[List[TravValue]]:
+        if self.scope==Scope.local:
+            return super().batches(batches, size)
+        return [[TravValue(sum(len(batch) for batch in batches))]]
+
+class _Reducing(MapStep):
+    """
+    Base class of the steps that reduce the values of all traversers (global scope)
+    or the list held by each traverser (local scope) in a single pass, see `reducers`.
+    Batches of values are reduced at once.
+    """
+    def __init__(self, traversal:Traversal, scope:Scope=Scope.global_, **kwargs):
+        flags = kwargs.pop('flags', 0)
+        super().__init__(traversal, flags=flags|(self.ISBARRIER if scope==Scope.global_ else 0), **kwargs)
         self.scope = scope
+        def _map(t:TravValue) -> TravValue|None:
+            if not isinstance(t, TravValue) or not isinstance(t.val, Iterable):
+                return None
+            reducer = self.reducer()
+            self._reduce(reducer, tu.ensure_is_list(t.val))
+            return None if (result:=reducer.result()) is _EMPTY else t.set_value(result)
+        self._map = _map
 
-    def __call__(self, traversers: Iterable[Traverser] | Iterable[Any]) -> Iterable[Traverser] | Iterable[Any]:
-        if self.scope == Scope.global_:
-            max_val = None
-            max_items = []
-            try:
-                for trav in traversers:
-                    if isinstance(trav, TravValue):
-                        if(max_val is None or trav.val >= max_val):
-                            if(max_val==trav.val):
-                                max_items.append(trav)
-                            else:
-                                max_items = [trav]
-                                max_val = trav.val
-                    else:
-                        raise GraphTraversalError("Cannot compare non-value traversers.")
-            except TypeError as e:
-                raise GraphTraversalError("Cannot compare values: " + str(e))
-            return max_items
-        else:
-            def _map(t:Traverser):
-                if isinstance(t, TravValue):
-                    return max(t)
-                else:
-                    raise GraphTraversalError("Cannot compare non-value traversers.")
-            self._map = _map
-            return super().__call__(traversers)
+    @abstractmethod
+    def reducer(self) -> Reducer:
+        pass
 
-class Min(MapStep):
-    def __init__(self, traversal: Traversal, scope:Scope=Scope.global_):
-        super().__init__(traversal)
-        self.scope = scope
+    def _values(self, traversers:List[Traverser]) -> List[Any]:
+        try:
+            return [t.val for t in traversers]
+        except AttributeError:
+            raise GraphTraversalError("Cannot reduce non-value traversers.")
 
-    def __call__(self, traversers: Iterable[Traverser] | Iterable[Any]) -> Iterable[Traverser] | Iterable[Any]:
-        if self.scope == Scope.global_:
-            min_val = None
-            min_items = []
-            try:
-                for trav in traversers:
-                    if isinstance(trav, TravValue):
-                        if(min_val is None or trav.val <= min_val):
-                            if(min_val==trav.val):
-                                min_items.append(trav)
-                            else:
-                                min_items = [trav]
-                                min_val = trav.val
-                    else:
-                        raise GraphTraversalError("Cannot compare traversers that reference elemnts.")
-            except TypeError as e:
-                raise GraphTraversalError("Cannot compare values: " + str(e))
-            return min_items
-        else:
-            def _map(t:Traverser):
-                if isinstance(t, TravValue):
-                    return max(t)
-                else:
-                    raise GraphTraversalError("Cannot compare non-value traversers.")
-            self._map = _map
+    def _reduce(self, reducer:Reducer, values:List[Any], traversers:List[TravValue]|None=None):
+        reducer.update(values)
+
+    def __call__(self, traversers:Iterable[Traverser]) -> Iterable[TravValue]:
+        if self.scope==Scope.local:
             return super().__call__(traversers)
+        return self.batches([traversers], BATCH_SIZE)[0]
 
-class Aggregate(MapStep):
-    def __init__(self, traversal: Traversal, aggfunc:str, scope:Scope=Scope.global_):
-        super().__init__(traversal)
-        if aggfunc in ['mean', 'sum']:
-            self.aggfunc = aggfunc
-        else:
+    def batches(self, batches:Iterable[List[Traverser]], size:int=BATCH_SIZE) -> List[List[TravValue]]:
+        if self.scope==Scope.local:
+            return super().batches(batches, size)
+        reducer = self.reducer()
+        for batch in batches:
+            for chunk in batched(batch, size):
+                self._reduce(reducer, self._values(chunk), chunk)
+        return [self._output(reducer)]
+
+    def _output(self, reducer:Reducer) -> List[TravValue]:
+        result = reducer.result()
+        return [] if result is _EMPTY else [TravValue(result)]
+
+class _Extremum(_Reducing):
+    largest = True
+
+    def reducer(self) -> Reducer:
+        return Extremum(self.largest)
+
+    def _reduce(self, reducer:Reducer, values:List[Any], traversers:List[TravValue]|None=None):
+        try:
+            reducer.update(values, traversers)
+        except TypeError as e:
+            raise GraphTraversalError("Cannot compare values: " + str(e))
+
+    def _output(self, reducer:Reducer) -> List[TravValue]:
+        #the (first) traverser holding the extreme value
+        return [] if reducer.result() is _EMPTY else [reducer.item]
+
+class Max(_Extremum):
+    largest = True
+
+class Min(_Extremum):
+    largest = False
+
+class Aggregate(_Reducing):
+    def __init__(self, traversal:Traversal, aggfunc:str, scope:Scope=Scope.global_, *args):
+        """
+        Reduce numbers with the named reducer (see `reducers.REDUCERS`),
+        `args` are passed to the reducer, e.g. the percentile.
+        """
+        super().__init__(traversal, scope)
+        if aggfunc not in REDUCERS:
             raise QueryError(f"Unsupported aggregation function `{aggfunc}`")
+        self.aggfunc = aggfunc
+        self.args = args
+        try:
+            self.reducer()
+        except ValueError as e:
+            raise QueryError(str(e))
+
+    def reducer(self) -> Reducer:
+        return REDUCERS[self.aggfunc](*self.args)
+
+    def _reduce(self, reducer:Reducer, values:List[Any], traversers:List[TravValue]|None=None):
+        try:
+            reducer.update(values)
+        except (TypeError, ValueError):
+            #ValueError: numpy failed to convert a batch to floats
+            raise GraphTraversalError("Encountered non-numeric traverser.")
+
+    def print_query(self) -> str:
+        args = ", ".join(str(arg) for arg in self.args)
+        return f"{self.aggfunc.capitalize()}({args})" if args else self.aggfunc.capitalize()
+
+def _element_value(t:Traverser|TravValue) -> Any:
+    """the id of the element of a traverser or the value of a value traverser"""
+    return t.val if isinstance(t, TravValue) else t.get
+
+class Group(MapStep):
+    MAX_BY = 2
+
+    def __init__(self, traversal:Traversal, scope:Scope=Scope.global_, **kwargs):
+        """
+        Group the traversers into a single Value holding a dict in one pass.
+        The first `by` modulation gives the key (the element id or value if omitted),
+        the second one the values: a property key collects the property values of the group,
+        an anonymous traversal is run on the traversers of each group, e.g. `group().by('country').by(count())`.
+        Without a second `by` the groups hold the element ids (or values).
+        Traversers without a key are left out. With `Scope.local`, the items of the list held
+        by each Value traverser (e.g. after `fold()`) are grouped instead.
+        """
+        flags = kwargs.pop('flags', 0)|Group.SUPPORTS_ANON_BY|Group.SUPPORTS_MULTIPLE_BY
+        if scope==Scope.global_: flags |= Group.ISBARRIER
+        super().__init__(traversal, flags=flags, **kwargs)
         self.scope = scope
+        self.by = []
 
-    def __call__(self, traversers: Iterable[Traverser] | Iterable[Any]) -> Iterable[Traverser] | Iterable[Any]:
-        from numbers import Number
-        if self.scope == Scope.global_:
-            #first ensure that all items are numbers
-            numbers = []
-            try:
-                for trav in traversers:
-                    if isinstance(trav, TravValue) and isinstance(trav.val, Number):
-                        numbers.append(trav.val)
-                    else:
-                        raise GraphTraversalError("Encountered non-numeric traverser.")
-            except TypeError:
-                raise GraphTraversalError("Encountered non-numeric traverser.")
-            match self.aggfunc:
-                case "mean":
-                    return [TravValue(sum(numbers)/len(numbers))]
-                case "sum":
-                    return [TravValue(sum(numbers))]
-        else:
-            if self.aggfunc == "sum":
-                def _map(t:Traverser|TravValue):
-                    if isinstance(t, TravValue) and isinstance(t.val, Iterable):
-                        return t.set_value(sum(t.val))
-            elif(self.aggfunc == 'mean'):
-                def _map(t:Traverser|TravValue):
-                    if isinstance(t, TravValue) and isinstance(t.val, Iterable):
-                        val = tu.ensure_is_list(t.val)
-                        return t.set_value(sum(val)/len(val))
+    def build(self):
+        if len(self.by) > self.MAX_BY:
+            raise QueryError(f"`{self.print_query()}` supports at most {self.MAX_BY} by-modulations.")
+        for by in self.by:
+            if isinstance(by, AnonymousTraversal):
+                if self.scope==Scope.local:
+                    raise QueryError(f"`{self.print_query()}` does not support anonymous by-modulations in local scope.")
+                if by not in (self.anon_traversals or []): self.register_anon_traversal(by)
+        super().build()
+        self._key = self._extractor(self.by[0] if self.by else None)
+
+    def _extractor(self, by:str|List[str]|AnonymousTraversal|None) -> Callable[[Any], Any]:
+        """the function mapping a traverser (an item in local scope) onto its key or value, _NA if it has none"""
+        if self.scope==Scope.local:
+            if by is None: return lambda item: item
+            indexer = tu.get_dict_indexer(by, _NA)
+            return lambda item: indexer(item) if isinstance(item, dict) else _NA
+        if by is None:
+            return _element_value
+        if isinstance(by, AnonymousTraversal):
+            def extract(t:Traverser) -> Any:
+                result = by.first(t, _NA)
+                return result if result is _NA else _element_value(result)
+            return extract
+        indexer = tu.get_dict_indexer(by, _NA)
+        return lambda t: indexer(self.traversal._get_element(t))
+
+    def _keyed(self, traversers:Iterable[Traverser]|Iterable[Any]) -> Iterable[Tuple[Any, Any]]:
+        try:
+            for t in traversers:
+                if (key:=self._key(t)) is not _NA:
+                    hash(key)
+                    yield key, t
+        except TypeError as e:
+            raise GraphTraversalError("Cannot group by unhashable keys: " + str(e))
+
+    def aggregate(self, traversers:Iterable[Traverser]|Iterable[Any]) -> dict:
+        """the groups of the traversers (or items in local scope)"""
+        reducer = self.by[1] if len(self.by)==2 else None
+        groups = {}
+        if isinstance(reducer, AnonymousTraversal):
+            if len(reducer.query_steps)==1 and type(reducer.query_steps[0]) is Count and reducer.query_steps[0].scope==Scope.global_:
+                return dict(Counter(key for key, _ in self._keyed(traversers)))
+            for key, t in self._keyed(traversers):
+                groups.setdefault(key, []).append(t)
+            #a reducing traversal gives one value per group, groups it gives none for are left out
+            reducing = reducer.query_steps[-1].isbarrier
+            reduced = {}
+            for key, group in groups.items():
+                values = [_element_value(r) for r in reducer(group)]
+                if not reducing: reduced[key] = values
+                elif len(values)==1: reduced[key] = values[0]
+                elif values: reduced[key] = values
+            return reduced
+        value = self._extractor(reducer)
+        for key, t in self._keyed(traversers):
+            group = groups.setdefault(key, [])
+            if (v:=value(t)) is not _NA:
+                group.append(v)
+        return groups
+
+    def __call__(self, traversers:Iterable[Traverser]) -> Iterable[TravValue]:
+        if self.scope==Scope.local:
+            def _map(t:Traverser|TravValue) -> TravValue:
+                if isinstance(t, TravValue) and isinstance(t.val, Iterable):
+                    return t.set_value(self.aggregate(t.val))
+                raise GraphTraversalError(f"{self.__class__.__name__}(local) can only be applied to values holding lists.")
             self._map = _map
             return super().__call__(traversers)
+        return [TravValue(self.aggregate(traversers))]
+
+    def print_query(self) -> str:
+        base = self.__class__.__name__ + ("(local)" if self.scope==Scope.local else "")
+        by = [b.print_query() if isinstance(b, AnonymousTraversal) else str(b) for b in self.by]
+        return base + "".join(f" by {b}" for b in by)
+
+class GroupCount(Group):
+    MAX_BY = 1
+
+    def __init__(self, traversal:Traversal, scope:Scope=Scope.global_, **kwargs):
+        """
+        Count the traversers per key (the element id or value, or the result of the `by` modulation)
+        into a single Value holding a dict, e.g. `groupCount().by('country')`.
+        With `Scope.local`, the items of the list held by each Value traverser are counted.
+        """
+        super().__init__(traversal, scope, **kwargs)
+
+    def aggregate(self, traversers:Iterable[Traverser]|Iterable[Any]) -> dict:
+        return dict(Counter(key for key, _ in self._keyed(traversers)))
+
+    def batches(self, batches:Iterable[List[Traverser]|TraverserBatch], size:int=BATCH_SIZE) -> Iterable[List[TravValue]]:
+        if self.scope==Scope.local or not self.by or isinstance(self.by[0], AnonymousTraversal):
+            return super().batches(batches, size)
+        #count the property values of the elements batch by batch without materializing the traversers
+        indexer = tu.get_dict_indexer(self.by[0], _NA)
+        counts = Counter()
+        try:
+            for batch in batches:
+                elements = self.traversal._get_elements(batch)
+                counts.update(key for e in elements if (key:=indexer(e)) is not _NA)
+        except TypeError as e:
+            raise GraphTraversalError("Cannot group by unhashable keys: " + str(e))
+        return [[TravValue(dict(counts))]]
 
 @as_traversal_function
 def element_map(*keys:str) -> 'Traversal':
@@ -601,4 +765,24 @@ def mean(scope:Scope=Scope.global_):
 
 @as_traversal_function
 def sum_(scope:Scope=Scope.global_):
-    return Aggregate(None, 'sum', scope)
\ No newline at end of file
+    return Aggregate(None, 'sum', scope)
+
+@as_traversal_function
+def variance(scope:Scope=Scope.global_, sample:bool=False):
+    return Aggregate(None, 'variance', scope, sample)
+
+@as_traversal_function
+def stddev(scope:Scope=Scope.global_, sample:bool=False):
+    return Aggregate(None, 'stddev', scope, sample)
+
+@as_traversal_function
+def percentile(q:float, scope:Scope=Scope.global_):
+    return Aggregate(None, 'percentile', scope, q)
+
+@as_traversal_function
+def group(scope:Scope=Scope.global_):
+    return Group(None, scope)
+
+@as_traversal_function
+def group_count(scope:Scope=Scope.global_):
+    return GroupCount(None, scope)
@@ -7,7 +7,7 @@ from mogwai.decorators import as_traversal_function
 
 class As(Step):
     def __init__(self, traversal:Traversal, *args:str):
-        super().__init__(traversal)
+        super().__init__(traversal, flags=As.ISBARRIER)
         self.keys = args
 
     def __call__(self, traversers:Iterable['Traverser']) -> Iterable['Traverser']:
@@ -0,0 +1,262 @@
+from .base_steps import FlatMapStep
+from typing import List, Any, Iterator, Tuple, Dict, Callable
+from heapq import heappush, heappop
+import networkx
+from mogwai.core import Traversal, AnonymousTraversal
+from mogwai.core.traverser import Traverser
+from mogwai.decorators import as_traversal_function
+from mogwai.core.exceptions import GraphTraversalError, QueryError
+from mogwai.utils.type_utils import TypeUtils as tu
+
+_NA = object()
+DIRECTIONS = ("out", "in", "both")
+
+class _GraphWalk(FlatMapStep):
+    """
+    base class of the steps that search the graph from the vertex of each traverser
+    instead of enumerating walks traverser by traverser.
+    Only edges with one of the given labels are followed and only vertices (other than the start)
+    and edges for which the filter traversals have a result are visited.
+    """
+    def __init__(self, traversal:Traversal, label:str|List[str]|None=None, direction:str="out",
+                 vertex_filter:AnonymousTraversal|None=None, edge_filter:AnonymousTraversal|None=None):
+        super().__init__(traversal)
+        if direction not in DIRECTIONS:
+            raise QueryError(f"Invalid direction `{direction}`, expected one of {DIRECTIONS}")
+        self.label = label
+        self.labels = None if label is None else ({label} if isinstance(label, str) else set(label))
+        self.direction = direction
+        self.vertex_filter = vertex_filter
+        self.edge_filter = edge_filter
+        for anon in (vertex_filter, edge_filter):
+            if anon is not None:
+                self.register_anon_traversal(anon)
+
+    def _source(self, t:Traverser) -> Any:
+        if type(t) is not Traverser or t.is_edge:
+            raise GraphTraversalError(f"{self.__class__.__name__} can only be applied to vertices.")
+        return t.node_id
+
+    def _edge_ok(self, u:Any, v:Any, data:dict) -> bool:
+        """whether the stored edge (u, v) may be followed"""
+        if self.labels is not None and data.get(self.traversal.graph.config.edge_label_field) not in self.labels:
+            return False
+        return self.edge_filter is None or self.edge_filter.first(Traverser(u, v), _NA) is not _NA
+
+    def _vertex_ok(self, v:Any) -> bool:
+        return self.vertex_filter is None or self.vertex_filter.first(Traverser(v), _NA) is not _NA
+
+    def _adjacency(self, reverse:bool=False) -> List[Tuple[dict, bool]]:
+        """the networkx adjacency dicts to walk and whether they hold the edges in reversed orientation"""
+        graph = self.traversal.graph
+        forward = self.direction == "out" if not reverse else self.direction == "in"
+        if self.direction == "both":
+            return [(graph._succ, False), (graph._pred, True)]
+        return [(graph._succ, False)] if forward else [(graph._pred, True)]
+
+    def _neighbors(self, adjacency:List[Tuple[dict, bool]], u:Any, weight:str|None=None, exempt:Any=_NA) -> Iterator[Tuple[Any, float]]:
+        """the admissible neighbors of u with the weight of the edge leading to them, `exempt` skips the vertex filter"""
+        for adj, reversed_ in adjacency:
+            for v, data in adj[u].items():
+                edge = (v, u) if reversed_ else (u, v)
+                if self._edge_ok(*edge, data) and (v == exempt or self._vertex_ok(v)):
+                    yield v, (1 if weight is None else data.get(weight, 1))
+
+class ShortestPath(_GraphWalk):
+    """
+    Emits the shortest path from the vertex of each traverser to one of the target vertices
+    as a Value holding the list of vertex ids (or their `by` properties), like `Path` does.
+    Unweighted paths are found with a (bidirectional, for a single target id) breadth first search,
+    weighted paths with Dijkstra's algorithm (networkx' bidirectional Dijkstra where possible).
+    Traversers without a path within `max_hops` are dropped.
+    """
+    def __init__(self, traversal:Traversal, to:Any, by_weight:str|None=None, max_hops:int|None=None,
+                 label:str|List[str]|None=None, direction:str="out", by:str|List[str]|None=None,
+                 vertex_filter:AnonymousTraversal|None=None, edge_filter:AnonymousTraversal|None=None):
+        super().__init__(traversal, label=label, direction=direction, vertex_filter=vertex_filter, edge_filter=edge_filter)
+        if max_hops is not None and max_hops < 0:
+            raise QueryError("max_hops must not be negative")
+        self.to = to
+        self.by_weight = by_weight
+        self.max_hops = max_hops
+        self.by = by
+        if isinstance(to, AnonymousTraversal):
+            self.register_anon_traversal(to)
+
+    def build(self):
+        super().build()
+        if isinstance(self.to, AnonymousTraversal):
+            self.target = None
+            self.is_target = lambda v: self.to.first(Traverser(v), _NA) is not _NA
+        elif isinstance(self.to, (list, tuple, set, frozenset)):
+            targets = set(self.to)
+            self.target = next(iter(targets)) if len(targets)==1 else None
+            self.is_target = targets.__contains__
+        else:
+            self.target = self.to
+            self.is_target = lambda v: v == self.to
+        indexer = tu.get_dict_indexer(self.by, None) if self.by else None
+        nodes = self.traversal.graph._node
+        self._format = (lambda route: [indexer(nodes[v]) for v in route]) if indexer else (lambda route: route)
+        def _flatmap(t:Traverser):
+            route = self.shortest_route(self._source(t))
+            return [] if route is None else [t.to_value(self._format(route))]
+        self._flatmap = _flatmap
+
+    def shortest_route(self, source:Any) -> List[Any]|None:
+        """the vertex ids of a shortest path from source to a target, None if there is none"""
+        nodes = self.traversal.graph._node
+        if source not in nodes:
+            return None
+        if self.is_target(source):
+            return [source]
+        if self.target is not None and self.target not in nodes:
+            return None
+        if self.by_weight is None:
+            if self.target is not None and self._vertex_ok(self.target):
+                return self._bidirectional_bfs(source, self.target)
+            return self._bfs(source)
+        if self.target is not None and self.max_hops is None and self.direction == "out":
+            return self._bidirectional_dijkstra(source, self.target)
+        return self._dijkstra(source)
+
+    def _bfs(self, source:Any) -> List[Any]|None:
+        adjacency = self._adjacency()
+        parents = {source: None}
+        frontier = [source]
+        hops = 0
+        while frontier and (self.max_hops is None or hops < self.max_hops):
+            hops += 1
+            next_frontier = []
+            for u in frontier:
+                for v, _ in self._neighbors(adjacency, u):
+                    if v in parents: continue
+                    parents[v] = u
+                    if self.is_target(v):
+                        return _route(parents, v)
+                    next_frontier.append(v)
+            frontier = next_frontier
+        return None
+
+    def _bidirectional_bfs(self, source:Any, target:Any) -> List[Any]|None:
+        forward, backward = self._adjacency(), self._adjacency(reverse=True)
+        parents, children = {source: None}, {target: None}
+        depths = ({source: 0}, {target: 0})
+        frontiers = ([source], [target])
+        best, meeting = None, None
+        hops = 0
+        while frontiers[0] and frontiers[1] and (self.max_hops is None or hops < self.max_hops):
+            hops += 1
+            #expand the smaller frontier by one level
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            adjacency, seen, other = (forward, parents, children) if side == 0 else (backward, children, parents)
+            depth, other_depth = depths[side], depths[1-side]
+            next_frontier = []
+            for u in frontiers[side]:
+                for v, _ in self._neighbors(adjacency, u, exempt=source):
+                    if v in seen: continue
+                    seen[v] = u
+                    depth[v] = depth[u] + 1
+                    if v in other:
+                        # the whole level is expanded since a later meeting may be closer to the other end
+                        length = depth[v] + other_depth[v]
+                        if best is None or length < best:
+                            best, meeting = length, v
+                    next_frontier.append(v)
+            if meeting is not None:
+                if self.max_hops is not None and best > self.max_hops: return None
+                return _route(parents, meeting) + _route(children, meeting)[::-1][1:]
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+        return None
+
+    def _weight_function(self, source:Any) -> Callable[[Any, Any, dict], float|None]:
+        def weight(u, v, data):
+            if not self._edge_ok(u, v, data): return None
+            if (u != source and not self._vertex_ok(u)) or (v != source and not self._vertex_ok(v)): return None
+            return data.get(self.by_weight, 1)
+        return weight
+
+    def _bidirectional_dijkstra(self, source:Any, target:Any) -> List[Any]|None:
+        try:
+            _, route = networkx.bidirectional_dijkstra(self.traversal.graph, source, target, weight=self._weight_function(source))
+            return route
+        except networkx.NetworkXNoPath:
+            return None
+
+    def _dijkstra(self, source:Any) -> List[Any]|None:
+        """Dijkstra's algorithm on (vertex, hops) states, so that the number of hops can be limited"""
+        adjacency = self._adjacency()
+        heap = [(0, 0, 0, source, None)]
+        parents = {}
+        fewest_hops = {} #the smallest number of hops with which a vertex was settled
+        counter = 1 #tie breaker, vertex ids need not be comparable
+        while heap:
+            distance, hops, _, u, state = heappop(heap)
+            if u in fewest_hops and fewest_hops[u] <= hops: continue
+            fewest_hops[u] = hops
+            parents[(u, hops)] = state
+            if self.is_target(u):
+                route, key = [], (u, hops)
+                while key is not None:
+                    route.append(key[0])
+                    key = parents[key]
+                return route[::-1]
+            if self.max_hops is not None and hops >= self.max_hops: continue
+            for v, weight in self._neighbors(adjacency, u, self.by_weight):
+                if v in fewest_hops and fewest_hops[v] <= hops+1: continue
+                heappush(heap, (distance+weight, hops+1, counter, v, (u, hops)))
+                counter += 1
+        return None
+
+    def print_query(self) -> str:
+        return f"{self.__class__.__name__}(to={self.to})"
+
+class KHop(_GraphWalk):
+    """
+    Moves each traverser to every vertex reachable within `k` hops (the start vertex excluded),
+    each vertex is visited once in breadth first order.
+    """
+    def __init__(self, traversal:Traversal, k:int, label:str|List[str]|None=None, direction:str="out",
+                 vertex_filter:AnonymousTraversal|None=None, edge_filter:AnonymousTraversal|None=None):
+        super().__init__(traversal, label=label, direction=direction, vertex_filter=vertex_filter, edge_filter=edge_filter)
+        if k < 0:
+            raise QueryError("k must not be negative")
+        self.k = k
+        def _flatmap(t:Traverser):
+            return (t.copy_to(v) for v in self.reachable(self._source(t)))
+        self._flatmap = _flatmap
+
+    def reachable(self, source:Any) -> Iterator[Any]:
+        adjacency = self._adjacency()
+        seen = {source}
+        frontier = [source]
+        for _ in range(self.k):
+            next_frontier = []
+            for u in frontier:
+                for v, _ in self._neighbors(adjacency, u):
+                    if v not in seen:
+                        seen.add(v)
+                        next_frontier.append(v)
+                        yield v
+            frontier = next_frontier
+            if not frontier: break
+
+    def print_query(self) -> str:
+        return f"{self.__class__.__name__}({self.k})"
+
+def _route(parents:Dict[Any, Any], v:Any) -> List[Any]:
+    route = []
+    while v is not None:
+        route.append(v)
+        v = parents[v]
+    return route[::-1]
+
+@as_traversal_function
+def shortest_path(to:Any, by_weight:str=None, max_hops:int=None, label:str|List[str]=None, direction:str="out",
+                  by:str|List[str]=None, vertex_filter:AnonymousTraversal=None, edge_filter:AnonymousTraversal=None):
+    return ShortestPath(None, to, by_weight=by_weight, max_hops=max_hops, label=label, direction=direction, by=by,
+                        vertex_filter=vertex_filter, edge_filter=edge_filter)
+
+@as_traversal_function
+def k_hop(k:int, label:str|List[str]=None, direction:str="out", vertex_filter:AnonymousTraversal=None, edge_filter:AnonymousTraversal=None):
+    return KHop(None, k, label=label, direction=direction, vertex_filter=vertex_filter, edge_filter=edge_filter)
@@ -0,0 +1,215 @@
+"""
+Created on 2026-10-19
+
+Single pass reductions of streams of values, used by the aggregating map steps.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Iterable, List
+
+_EMPTY = object()  # the result of a reduction without values
+
+
+class Reducer(ABC):
+    """
+    A reduction that is fed one value at a time with `add` or a batch
+    (e.g. the list held by a traverser in local scope) with `update`
+    and keeps O(1) state unless noted otherwise.
+    """
+
+    @abstractmethod
+    def add(self, x: Any) -> None:
+        pass
+
+    def update(self, xs: Iterable[Any]) -> None:
+        for x in xs:
+            self.add(x)
+
+    @abstractmethod
+    def result(self) -> Any:
+        """the reduced value, _EMPTY if there was nothing to reduce"""
+
+
+class Sum(Reducer):
+    """
+    Sums ints (and other exact numbers) exactly and floats with Neumaier's
+    compensated summation, batches of floats are summed with math.fsum.
+    The sum of no values is 0.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.exact = 0
+        self.total = 0.0
+        self.compensation = 0.0
+        self.floats = False
+
+    def _add_float(self, x: float):
+        self.floats = True
+        total = self.total + x
+        if abs(self.total) >= abs(x):
+            self.compensation += (self.total - total) + x
+        else:
+            self.compensation += (x - total) + self.total
+        self.total = total
+
+    def add(self, x: Any) -> None:
+        self.count += 1
+        if isinstance(x, float):
+            self._add_float(x)
+        else:
+            self.exact += x
+
+    def update(self, xs: Iterable[Any]) -> None:
+        floats: List[float] = []
+        for x in xs:
+            if isinstance(x, float):
+                floats.append(x)
+            else:
+                self.exact += x
+            self.count += 1
+        if floats:
+            self._add_float(math.fsum(floats))
+
+    def result(self) -> Any:
+        if not self.floats:
+            return self.exact
+        return self.exact + (self.total + self.compensation)
+
+
+class Mean(Sum):
+    """the compensated sum divided by the number of values"""
+
+    def result(self) -> Any:
+        if self.count == 0:
+            return _EMPTY
+        return super().result() / self.count
+
+
+class Variance(Reducer):
+    """
+    Welford's online variance; batches are reduced on their own (with numpy
+    if available) and merged with Chan's formula.
+    The population variance by default, the sample variance if `sample`.
+    """
+
+    def __init__(self, sample: bool = False):
+        self.ddof = 1 if sample else 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: Any) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def update(self, xs: Iterable[Any]) -> None:
+        xs = xs if isinstance(xs, list) else list(xs)
+        try:
+            import numpy as np
+        except ImportError:
+            return super().update(xs)
+        if not xs:
+            return
+        values = np.asarray(xs, dtype=np.float64)
+        n, mean = len(values), values.mean()
+        m2 = np.square(values - mean).sum()
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def result(self) -> Any:
+        if self.count <= self.ddof:
+            return _EMPTY
+        return float(self.m2 / (self.count - self.ddof))
+
+
+class StdDev(Variance):
+    """the square root of the variance"""
+
+    def result(self) -> Any:
+        variance = super().result()
+        return variance if variance is _EMPTY else math.sqrt(variance)
+
+
+class Percentile(Reducer):
+    """
+    The q-th percentile (0 <= q <= 100) with linear interpolation between
+    the closest ranks, like numpy.percentile. This needs all values, which
+    are kept as 8 byte floats.
+    """
+
+    def __init__(self, q: float = 50):
+        if not 0 <= q <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+        self.q = q
+        self.values = array("d")
+
+    def add(self, x: Any) -> None:
+        self.values.append(x)
+
+    def update(self, xs: Iterable[Any]) -> None:
+        self.values.extend(xs)
+
+    def result(self) -> Any:
+        n = len(self.values)
+        if n == 0:
+            return _EMPTY
+        rank = (n - 1) * self.q / 100
+        lo = math.floor(rank)
+        hi = min(lo + 1, n - 1)
+        try:
+            import numpy as np
+
+            values = np.frombuffer(self.values, dtype=np.float64)
+            lo_value, hi_value = np.partition(values, [lo, hi])[[lo, hi]].tolist()
+        except ImportError:
+            values = sorted(self.values)
+            lo_value, hi_value = values[lo], values[hi]
+        return lo_value + (hi_value - lo_value) * (rank - lo)
+
+
+class Extremum(Reducer):
+    """
+    The largest (or smallest) value and the item it belongs to,
+    the first one in case of ties. Any comparable values can be reduced.
+    """
+
+    def __init__(self, largest: bool = True):
+        self.largest = largest
+        self.value = _EMPTY
+        self.item = None
+
+    def add(self, x: Any, item: Any = None) -> None:
+        if (
+            self.value is _EMPTY
+            or (self.largest and x > self.value)
+            or (not self.largest and x < self.value)
+        ):
+            self.value = x
+            self.item = item
+
+    def update(self, xs: Iterable[Any], items: List[Any] | None = None) -> None:
+        xs = xs if isinstance(xs, list) else list(xs)
+        if not xs:
+            return
+        best = max(xs) if self.largest else min(xs)
+        self.add(best, items[xs.index(best)] if items is not None else None)
+
+    def result(self) -> Any:
+        return self.value
+
+
+REDUCERS = {
+    "sum": Sum,
+    "mean": Mean,
+    "variance": Variance,
+    "stddev": StdDev,
+    "percentile": Percentile,
+}
@@ -1,26 +1,33 @@
-from .base_steps import Step, SideEffectStep
+from .base_steps import Step, SideEffectStep, BATCH_SIZE, batched
 from mogwai.core import MogwaiGraph
-from mogwai.core.traverser import Traverser
+from mogwai.core.traverser import Traverser, TraverserBatch
 from mogwai.core.traversal import Traversal
-from typing import List, Tuple, Set
+from typing import Dict, Iterable, List, Tuple, Set
 from ..exceptions import GraphTraversalError
 
 class V(Step):
     def __init__(self, graph:MogwaiGraph, init:int|List[int]=None):
-        super().__init__(None, flags=Step.ISSTART)
+        super().__init__(None, flags=Step.ISSTART|Step.ISBARRIER)
         self.graph = graph
         self.init = init if init is None or isinstance(init, (list, tuple)) else [init]
+        #the label query (see LabelIndex.query) the vertices are restricted to, set by the optimizer for has_label steps
+        self.labels:Dict[str, Set[str]]|None = None
 
     def set_traversal(self, traversal:Traversal):
         self.traversal = traversal
 
+    def _all_vertices(self) -> Iterable:
+        if self.labels is None:
+            return self.graph.nodes()
+        return self.graph.label_index.nodes(**self.labels)
+
     def __call__(self, traversers:List[Traverser]) -> List[Traverser]:
         if len(traversers)>0:
             raise GraphTraversalError("Cannot perform V step on a non-empty Traversal.")
         else:
             if self.init is None:
                 #spawn a traverser for every vertex in graph
-                for v in self.graph.nodes():
+                for v in self._all_vertices():
                     traversers.append(Traverser(v, track_path=self.traversal.needs_path))
             else:
                 for v in self.init:
@@ -30,9 +37,29 @@ class V(Step):
                         raise GraphTraversalError(f"No node with id {v}. Keep in mind that all node ids are strings!")
         return traversers
 
+    def batches(self, batches:Iterable[List[Traverser]], size:int=BATCH_SIZE) -> Iterable[List[Traverser]]:
+        if self.init is None:
+            ids = self._all_vertices()
+        else:
+            ids = self.init
+            for v in ids:
+                if v not in self.graph.nodes:
+                    raise GraphTraversalError(f"No node with id {v}. Keep in mind that all node ids are strings!")
+        if self.traversal.needs_path:
+            return ([Traverser(v, track_path=True) for v in batch] for batch in batched(ids, size))
+        return (TraverserBatch(batch) for batch in batched(ids, size))
+
+    def used_indexes(self) -> List[str]:
+        return ["labels"] if self.labels is not None else []
+
+    def print_query(self) -> str:
+        if self.labels is None:
+            return super().print_query()
+        return f"{self.__class__.__name__}(" + ", ".join(f"{key}={sorted(map(str, labels))}" for key, labels in self.labels.items()) + ")"
+
 class AddV(SideEffectStep):
     def __init__(self, graph:MogwaiGraph, labels:str|Set[str], name:str="", **kwargs):
-        super(SideEffectStep, self).__init__(None, flags=Step.ISSTART)
+        super(SideEffectStep, self).__init__(None, flags=Step.ISSTART|Step.HAS_SIDE_EFFECTS)
         self.graph = graph
         self.name = name
         self.properties = kwargs
@@ -50,7 +77,7 @@ class AddV(SideEffectStep):
 
 class E(Step):
     def __init__(self, graph:MogwaiGraph, init:Tuple[int]|List[Tuple[int]]):
-        super().__init__(None, flags=Step.ISSTART)
+        super().__init__(None, flags=Step.ISSTART|Step.ISBARRIER)
         self.graph = graph
         self.init = init if init is None or isinstance(init, list) else [init]
     
@@ -73,9 +100,21 @@ class E(Step):
                         raise GraphTraversalError(f"No edge from {e[0]} to {e[1]}.")
         return traversers
 
+    def batches(self, batches:Iterable[List[Traverser]], size:int=BATCH_SIZE) -> Iterable[List[Traverser]]:
+        if self.init is None:
+            ids = self.graph.edges()
+        else:
+            ids = self.init
+            for e in ids:
+                if e not in self.graph.edges:
+                    raise GraphTraversalError(f"No edge from {e[0]} to {e[1]}.")
+        if self.traversal.needs_path:
+            return ([Traverser(*e, track_path=True) for e in batch] for batch in batched(ids, size))
+        return (TraverserBatch(batch, is_edge=True) for batch in batched(ids, size))
+
 class AddE(SideEffectStep):
     def __init__(self, graph:MogwaiGraph, relation:str, from_:int=None, to_:int=None, **kwargs):
-        super(SideEffectStep, self).__init__(None, flags=Step.ISSTART|Step.SUPPORTS_FROMTO)
+        super(SideEffectStep, self).__init__(None, flags=Step.ISSTART|Step.SUPPORTS_FROMTO|Step.HAS_SIDE_EFFECTS)
         self.graph = graph
         self.relation = relation
         self.from_, self.to_ = from_, to_
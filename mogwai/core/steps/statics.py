@@ -1,25 +1,44 @@
-from .branch_steps import branch, repeat, union
-from .filter_steps import has, has_not, has_id, has_label, has_name, contains, filter_, simple_path, limit, dedup, and_, or_, not_
-from .flatmap_steps import out, outE, outV, in_, inV, both, bothV, bothE
-from .map_steps import properties, value, values, key, id_, select, path, count, min_, max_, mean, sum_, element_map
-from .modulation_steps import as_, until, emit
+from mogwai.utils.lazy_import import lazy_attributes
 from .predicates import *
 from .enums import Scope, Cardinality, Order, IO
 desc, asc = Order.desc, Order.asc
 local, global_ = Scope.local, Scope.global_
 single, map_, list_, set_, dict_ = Cardinality.single, Cardinality.map_, Cardinality.list_, Cardinality.set_, Cardinality.dict_
 
+#the anonymous step functions, their modules are imported on first access
+_STEP_FUNCTIONS = {
+    ".branch_steps": ["branch", "repeat", "union"],
+    ".filter_steps": ["has", "has_not", "has_id", "has_label", "has_name", "contains", "filter_", "simple_path", "limit", "dedup", "and_", "or_", "not_"],
+    ".flatmap_steps": ["out", "outE", "outV", "in_", "inV", "both", "bothV", "bothE"],
+    ".map_steps": ["properties", "value", "values", "key", "id_", "select", "path", "count", "min_", "max_", "mean", "sum_", "variance", "stddev", "percentile", "element_map", "group", "group_count"],
+    ".modulation_steps": ["as_", "until", "emit"],
+    ".path_steps": ["shortest_path", "k_hop"],
+}
+
+def camel_case_name(name:str) -> str:
+    components = name.split('_')
+    camel_case_name = components[0] + ''.join(x.capitalize() for x in components[1:])
+    if name.endswith('_'):
+        camel_case_name += '_'
+    return camel_case_name
+
 #I'm reasonably sure that this is NOT good practice, but it works, so ¯\_(ツ)_/¯
 def add_camel_case_aliases(module_globals):
     """Add camelCase aliases for all snake_case callables in the module's globals."""
     camel_case_aliases = {}
     for name, obj in module_globals.items():
         if callable(obj) and '_' in name:  # Only convert callable objects with underscores
-            components = name.split('_')
-            camel_case_name = components[0] + ''.join(x.capitalize() for x in components[1:])
-            if name.endswith('_'):
-                camel_case_name += '_'
-            if camel_case_name != name:
-                camel_case_aliases[camel_case_name] = obj
+            if camel_case_name(name) != name:
+                camel_case_aliases[camel_case_name(name)] = obj
     module_globals.update(camel_case_aliases)
-add_camel_case_aliases(globals())
\ No newline at end of file
+add_camel_case_aliases(globals())
+
+_lazy = {}
+for _module, _names in _STEP_FUNCTIONS.items():
+    for _name in _names:
+        _lazy[_name] = _module
+        if '_' in _name and camel_case_name(_name) != _name:
+            _lazy[camel_case_name(_name)] = f"{_module}:{_name}"
+__getattr__, __dir__ = lazy_attributes(globals(), _lazy)
+#`from statics import *` imports all step functions
+__all__ = [name for name in globals() if not name.startswith('_')] + list(_lazy)
@@ -1,7 +1,9 @@
 from .base_steps import Step
 from mogwai.core.traversal import Traversal
 from mogwai.core.traverser import Traverser, Value, Property
-from typing import Set, List, Iterable, Generator, Any
+from typing import Set, List, Iterable, Generator, Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from mogwai.core.profiling import TraversalMetrics
 from mogwai.utils.type_utils import TypeUtils as tu
 import logging
 logger = logging.getLogger("Mogwai")
@@ -108,4 +110,12 @@ class Iterate(AsGenerator):
         self.flags = Step.ISTERMINAL
 
     def __call__(self, traversers:Iterable[Traverser]|Iterable[Value]|Iterable[Property]) -> None:
-        for _ in traversers: pass #TODO: optimize this: we needn't execute this if there are no side effects!
\ No newline at end of file
+        for _ in traversers: pass #TODO: optimize this: we needn't execute this if there are no side effects!
+
+class Profile(Step):
+    def __init__(self, traversal:Traversal):
+        super().__init__(traversal, flags=Step.ISTERMINAL)
+
+    def __call__(self, traversers:Iterable[Traverser]|Iterable[Value]|Iterable[Property]) -> 'TraversalMetrics':
+        for _ in traversers: pass
+        return self.traversal._profiler.get_metrics(self.traversal)
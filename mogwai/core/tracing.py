@@ -0,0 +1,112 @@
+"""
+Created on 2026-10-19
+
+Structured tracing of traversals, see `Traversal.with_trace()`.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Optional
+
+from mogwai.config import TRACE_BUFFER_SIZE
+
+if TYPE_CHECKING:
+    from mogwai.core.steps.base_steps import Step
+
+
+@dataclass
+class TraceEvent:
+    """
+    A step being invoked (enter) or its output being exhausted (exit).
+
+    Attributes:
+        time (float): the seconds since the tracer was created
+        kind (str): enter or exit
+        step (str): the step as printed by `print_query`
+        depth (int): 0 for the steps of the traversal, 1 for the steps of its anonymous traversals, ...
+        traversers (int): the number of traversers (or batches in batch mode) produced, on exit only
+        duration (float): the seconds since the matching enter event, on exit only;
+            lazily evaluated steps include the time spent in the upstream steps
+    """
+
+    time: float
+    kind: str
+    step: str
+    depth: int
+    traversers: Optional[int] = None
+    duration: Optional[float] = None
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.time * 1000:10.3f} ms {'  ' * self.depth}{self.kind:5} {self.step}"
+        )
+        if self.kind == "exit":
+            text += f" -> {self.traversers} in {self.duration * 1000:.3f} ms"
+        return text
+
+
+class TraversalTracer:
+    """
+    Records the enter and exit events of the steps of a traversal and its
+    anonymous traversals in a ring buffer that keeps the last `capacity` events,
+    so tracing a long running query takes constant memory.
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE):
+        self.events: Deque[TraceEvent] = deque(maxlen=capacity)
+        self.dropped = 0
+        self.start_time = perf_counter()
+        self._names: Dict[int, str] = {}
+
+    def _name(self, step: "Step") -> str:
+        name = self._names.get(id(step))
+        if name is None:
+            name = self._names[id(step)] = step.print_query()
+        return name
+
+    def _record(self, event: TraceEvent):
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+
+    def run_step(self, step: "Step", depth: int, run) -> Iterable:
+        """record the invocation of a step, `run` invokes it and returns its output"""
+        name = self._name(step)
+        start = perf_counter()
+        self._record(TraceEvent(start - self.start_time, "enter", name, depth))
+        output = run()
+        if isinstance(output, (list, set, tuple)):
+            self._exit(name, depth, start, len(output))
+            return output
+        return self._wrap_output(output, name, depth, start)
+
+    def _exit(self, name: str, depth: int, start: float, count: int):
+        now = perf_counter()
+        self._record(
+            TraceEvent(now - self.start_time, "exit", name, depth, count, now - start)
+        )
+
+    def _wrap_output(
+        self, output: Iterable, name: str, depth: int, start: float
+    ) -> Iterator:
+        count = 0
+        for item in output:
+            count += 1
+            yield item
+        self._exit(name, depth, start, count)
+
+    def slowest(self, n: int = 10) -> List[TraceEvent]:
+        """the n exit events with the longest durations in the buffer"""
+        exits = [event for event in self.events if event.kind == "exit"]
+        return sorted(exits, key=lambda event: -event.duration)[:n]
+
+    def format(self) -> str:
+        """the events as printable lines"""
+        lines = [str(event) for event in self.events]
+        if self.dropped:
+            lines.insert(0, f"... {self.dropped} earlier events dropped")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
@@ -1,19 +1,51 @@
 import logging
+import weakref
+from copy import copy
+from dataclasses import replace
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set, Tuple
-
-from mogwai.config import DEFAULT_ITERATION_DEPTH, USE_MULTIPROCESSING
-from mogwai.core.exceptions import GraphTraversalError
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+
+from mogwai.config import (
+    ASYNC_CHUNK_SIZE,
+    DEFAULT_ITERATION_DEPTH,
+    RESULT_CACHE_SIZE,
+    TRACE_BUFFER_SIZE,
+    USE_MULTIPROCESSING,
+)
+from mogwai.core.budget import CancellationToken, TraversalBudget
+from mogwai.core.exceptions import GraphTraversalError, TraversalBudgetExceeded
+from mogwai.core.profiling import TraversalProfiler
 from mogwai.core.steps.enums import Cardinality
 from mogwai.core.steps.enums import Order as EnumOrder
 from mogwai.core.steps.enums import Scope
-from mogwai.core.traverser import Traverser
+from mogwai.core.traverser import Traverser, TraverserBatch
 from mogwai.decorators import add_camel_case_methods, with_call_order
 from mogwai.utils.type_utils import TypeUtils as tu
 
 from .exceptions import QueryError
 from .mogwaigraph import MogwaiGraph
-from .steps.base_steps import Step
+from .result_cache import ResultCache
+from .tracing import TraversalTracer
+from .steps.base_steps import BATCH_SIZE, Step, unbatched
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .computer import GraphComputer
+    from .explain import TraversalExplanation
 
 logger = logging.getLogger("Mogwai")
 
@@ -26,6 +58,9 @@ def step_method(not_anonymous=False):
 
         @wraps(func)  # Preserves metadata and type hinting
         def wrapper(*args, **kwargs):
+            calls = args[0]._calls
+            if calls is not None:
+                calls.append((func, args[1:], kwargs))
             return func(*args, **kwargs)
 
         return wrapper
@@ -33,6 +68,79 @@ def step_method(not_anonymous=False):
     return decorator
 
 
+# steps with side effects or lazy results, traversals using them are never cached
+UNCACHEABLE_STEPS = {
+    "addE",
+    "addV",
+    "io",
+    "iter",
+    "iterate",
+    "profile",
+    "property",
+    "side_effect",
+}
+
+# steps that change the graph or call user code that may, see Traversal.has_side_effects()
+MUTATING_STEPS = {"addE", "addV", "io", "property", "side_effect"}
+
+
+# marks the absence of a result in AnonymousTraversal.first
+_EMPTY = object()
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _freeze(value: Any) -> Hashable:
+    """a hashable representation of a step argument, see `Traversal._cache_key`"""
+    if isinstance(value, AnonymousTraversal):
+        return (
+            AnonymousTraversal,
+            _freeze_call(*value._initial_step),
+            tuple(_freeze_call(*template) for template in value._step_templates),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if callable(value):
+        # the result of a function may change without the graph changing
+        raise _Uncacheable()
+    try:
+        hash(value)
+    except TypeError:
+        raise _Uncacheable()
+    return (type(value), value)
+
+
+def _freeze_call(func: Callable, args: Tuple, kwargs: Dict) -> Hashable:
+    func = getattr(func, "__func__", func)
+    if func.__name__ in UNCACHEABLE_STEPS:
+        raise _Uncacheable()
+    return func, _freeze(args), _freeze(kwargs)
+
+
+def _mutates(func: Callable, args: Tuple, kwargs: Dict) -> bool:
+    """whether a step call or one of the anonymous traversals in its arguments may change the graph"""
+    func = getattr(func, "__func__", func)
+    if func.__name__ in MUTATING_STEPS:
+        return True
+    values = [*args, *kwargs.values()]
+    while values:
+        value = values.pop()
+        if isinstance(value, (list, tuple)):
+            values.extend(value)
+        elif isinstance(value, AnonymousTraversal):
+            if _mutates(*value._initial_step) or any(
+                _mutates(*template) for template in value._step_templates
+            ):
+                return True
+    return False
+
+
 @add_camel_case_methods
 class Traversal:
     """
@@ -75,6 +183,9 @@ class Traversal:
         eager: bool = False,
         query_verify: bool = False,
         use_mp: bool = False,
+        budget: TraversalBudget | None = None,
+        batch_size: int | None = None,
+        result_cache: ResultCache | None = None,
     ):
         if start is None:
             raise QueryError("start step cannot be None")
@@ -90,6 +201,77 @@ class Traversal:
         self.verify_query = query_verify
         self.optimize = optimize
         self.max_iteration_depth = DEFAULT_ITERATION_DEPTH
+        self.budget = budget
+        self.batch_size = batch_size
+        self.result_cache = result_cache
+        # the step method calls, see _cache_key
+        self._calls = []
+        self._monitor = None
+        self._profile = False
+        self._profiler = None
+        self._trace_capacity = None
+        self.tracer: TraversalTracer | None = None
+        # the nesting depth of anonymous traversals and whether steps are logged, see _prepare
+        self._depth = 0
+        self._debug = False
+        self.rewrites: List[str] = []
+
+    def with_budget(
+        self,
+        timeout: float | None = None,
+        max_traversers: int | None = None,
+        max_path_length: int | None = None,
+        token: CancellationToken | None = None,
+    ) -> "Traversal":
+        """
+        Limit the resources this traversal may use when it is run.
+        If a limit is exceeded, a `TraversalBudgetExceeded` (or `TraversalTimeout`/`TraversalCancelled`)
+        exception is raised, which holds the partial statistics of the run.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            the maximum wall-clock time in seconds
+        max_traversers : int, optional
+            the maximum number of traversers produced by all steps together
+        max_path_length : int, optional
+            the maximum length of a traverser's path (only checked if paths are tracked)
+        token : CancellationToken, optional
+            a token to cancel the traversal from another thread
+        """
+        self.budget = TraversalBudget(
+            timeout=timeout,
+            max_traversers=max_traversers,
+            max_path_length=max_path_length,
+            token=token,
+        )
+        return self
+
+    def with_trace(self, capacity: int = TRACE_BUFFER_SIZE) -> "Traversal":
+        """
+        Record the enter and exit events of every step (including the steps of
+        anonymous traversals) while the traversal runs, e.g. to find the steps of a slow query.
+        The last `capacity` events are kept in `tracer.events`, see `TraversalTracer`.
+        Traced traversals bypass the result cache. Without tracing the steps run without any hooks.
+
+        Parameters
+        ----------
+        capacity : int
+            the size of the ring buffer of events
+        """
+        self._trace_capacity = capacity
+        return self
+
+    def with_batch_size(self, batch_size: int | None = BATCH_SIZE) -> "Traversal":
+        """
+        Run this traversal with the batch protocol: the steps process lists of `batch_size`
+        traversers instead of one traverser at a time (see `Step.batches`).
+        Steps without a batch implementation are adapted automatically.
+        Use `None` to go back to running one traverser at a time.
+        Profiled traversals always run one traverser at a time.
+        """
+        self.batch_size = batch_size
+        return self
 
     def number_of_steps(self, recursive: bool = False) -> int:
         if recursive:
@@ -397,6 +579,85 @@ class Traversal:
         self._add_step(Aggregate(self, "mean", scope))
         return self
 
+    @step_method()
+    def variance(
+        self, scope: Scope = Scope.global_, sample: bool = False
+    ) -> "Traversal":
+        """
+        The variance of the numbers, computed in a single pass (Welford).
+
+        Parameters
+        ----------
+        scope : Scope, default Scope.global_
+            with Scope.local the list held by each traverser is reduced
+        sample : bool, default False
+            the sample instead of the population variance
+        """
+        from .steps.map_steps import Aggregate
+
+        self._add_step(Aggregate(self, "variance", scope, sample))
+        return self
+
+    @step_method()
+    def stddev(self, scope: Scope = Scope.global_, sample: bool = False) -> "Traversal":
+        """
+        The standard deviation of the numbers, see `variance`.
+        """
+        from .steps.map_steps import Aggregate
+
+        self._add_step(Aggregate(self, "stddev", scope, sample))
+        return self
+
+    @step_method()
+    def percentile(self, q: float, scope: Scope = Scope.global_) -> "Traversal":
+        """
+        The q-th percentile of the numbers, interpolated linearly like numpy.percentile,
+        e.g. `percentile(50)` for the median.
+
+        Parameters
+        ----------
+        q : float
+            the percentile, between 0 and 100
+        scope : Scope, default Scope.global_
+            with Scope.local the list held by each traverser is reduced
+        """
+        from .steps.map_steps import Aggregate
+
+        self._add_step(Aggregate(self, "percentile", scope, q))
+        return self
+
+    @step_method()
+    def group(self, scope: Scope = Scope.global_) -> "Traversal":
+        """
+        Group the traversers into a dict, keyed by the first `by` modulation
+        and reduced by the second one, e.g. `group().by("country").by(count())`.
+
+        Parameters
+        ----------
+        scope : Scope, default Scope.global_
+            with Scope.local the list held by each traverser is grouped
+        """
+        from .steps.map_steps import Group
+
+        self._add_step(Group(self, scope))
+        return self
+
+    @step_method()
+    def group_count(self, scope: Scope = Scope.global_) -> "Traversal":
+        """
+        Count the traversers per key of the `by` modulation,
+        e.g. `group_count().by("country")`.
+
+        Parameters
+        ----------
+        scope : Scope, default Scope.global_
+            with Scope.local the items of the list held by each traverser are counted
+        """
+        from .steps.map_steps import GroupCount
+
+        self._add_step(GroupCount(self, scope))
+        return self
+
     @step_method()
     def element_map(self, *keys: str) -> "Traversal":
         from .steps.map_steps import ElementMap
@@ -472,6 +733,86 @@ class Traversal:
         self._add_step(BothV(self))
         return self
 
+    ## ===== PATH STEPS ======
+    @step_method()
+    def shortest_path(
+        self,
+        to: Any,
+        by_weight: str = None,
+        max_hops: int = None,
+        label: str | List[str] = None,
+        direction: str = "out",
+        by: str | List[str] = None,
+        vertex_filter: "AnonymousTraversal" = None,
+        edge_filter: "AnonymousTraversal" = None,
+    ) -> "Traversal":
+        """
+        Emit the shortest path from each vertex to a target vertex as a list of vertex ids,
+        in the same format as `path()` (mapped to the `by` property if given).
+        Vertices without a path are dropped.
+
+        Parameters
+        ----------
+        to : Any
+            the id of the target vertex, a collection of ids or an anonymous traversal that has a result for the targets
+        by_weight : str, optional
+            the edge property to minimize the sum of (missing values count as 1), the number of hops if None
+        max_hops : int, optional
+            the maximum number of edges of the path
+        label : str or List[str], optional
+            only follow edges with (one of) these labels
+        direction : str
+            follow the edges `out`, `in` or `both` ways
+        vertex_filter : AnonymousTraversal, optional
+            only visit the vertices for which this traversal has a result
+        edge_filter : AnonymousTraversal, optional
+            only follow the edges for which this traversal has a result
+        """
+        from .steps.path_steps import ShortestPath
+
+        self._add_step(
+            ShortestPath(
+                self,
+                to,
+                by_weight=by_weight,
+                max_hops=max_hops,
+                label=label,
+                direction=direction,
+                by=by,
+                vertex_filter=vertex_filter,
+                edge_filter=edge_filter,
+            )
+        )
+        return self
+
+    @step_method()
+    def k_hop(
+        self,
+        k: int,
+        label: str | List[str] = None,
+        direction: str = "out",
+        vertex_filter: "AnonymousTraversal" = None,
+        edge_filter: "AnonymousTraversal" = None,
+    ) -> "Traversal":
+        """
+        Move to every vertex reachable within `k` hops, each vertex once.
+        Unlike `repeat(out()).times(k)`, walks are not enumerated.
+        See `shortest_path` for the parameters.
+        """
+        from .steps.path_steps import KHop
+
+        self._add_step(
+            KHop(
+                self,
+                k,
+                label=label,
+                direction=direction,
+                vertex_filter=vertex_filter,
+                edge_filter=edge_filter,
+            )
+        )
+        return self
+
     ## ===== BRANCH STEPS =====
     @step_method()
     @with_call_order
@@ -589,6 +930,7 @@ class Traversal:
 
         def effect(t: "Traverser"):
             indexer(self._get_element(t))[key] = value
+            self.graph.bump_version()
 
         self._add_step(SideEffectStep(self, side_effect=effect))
         return self
@@ -839,8 +1181,24 @@ class Traversal:
         self._add_step(Iterate(self))
         return self
 
+    @step_method(not_anonymous=True)
+    def profile(self) -> "Traversal":
+        """
+        Profile the traversal instead of returning its result.
+        Running the traversal returns a `TraversalMetrics` object with the number of traversers
+        flowing in and out of every step (including the steps of anonymous traversals) and the time spent in it.
+        Print it to get a table.
+        """
+        from .steps.terminal_steps import Profile
+
+        self._profile = True
+        self._add_step(Profile(self))
+        return self
+
     def _optimize_query(self):
-        pass
+        from .optimizer import optimize
+
+        self.rewrites = optimize(self)
 
     def _verify_query(self):
         from .steps.modulation_steps import Temp
@@ -854,35 +1212,251 @@ class Traversal:
         for step in self.query_steps:
             step.build()
 
-    def run(self) -> Any:
+    def _prepare(self) -> str:
+        """
+        build, optimize and verify the traversal
+
+        Returns:
+            str: the query before optimization
+        """
         # first, provide the start step with this traversal
-        self.traversers = []
         self.query_steps[0].set_traversal(self)
+        # the monitor and profiler need to be in place before the anonymous traversals are built
+        self._monitor = self.budget.monitor() if self.budget is not None else None
+        self._profiler = TraversalProfiler() if self._profile else None
+        self.tracer = (
+            TraversalTracer(self._trace_capacity)
+            if self._trace_capacity is not None
+            else None
+        )
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         self._build()
-        self.needs_path = any([s.needs_path for s in self.query_steps])
+        original = self.print_query()
         if self.optimize:
             self._optimize_query()
+        self.needs_path = any([s.needs_path for s in self.query_steps])
         self._verify_query()
+        return original
+
+    def explain(self) -> "TraversalExplanation":
+        """
+        Build and optimize the traversal without running it and return its plan.
+        The plan shows for every step (including the steps of nested anonymous traversals)
+        whether it streams or is a barrier, whether it needs paths and which indexes it uses,
+        as well as the rewrite rules applied by the optimizer.
+        """
+        from .explain import TraversalExplanation
+
+        original = self._prepare()
+        return TraversalExplanation.of(self, original)
+
+    def has_side_effects(self) -> bool:
+        """whether one of the steps may change the graph, see MUTATING_STEPS"""
+        calls = self._calls
+        if calls is None:
+            # an anonymous traversal
+            calls = [self._initial_step, *self._step_templates]
+        return any(_mutates(*call) for call in calls)
+
+    def _cache_key(self) -> Hashable | None:
+        """
+        the key of the result of this traversal in a ResultCache:
+        the graph, its version and the step calls with their arguments,
+        None if the traversal has side effects or takes functions as arguments
+
+        The graph is referenced weakly: a cache shared by several sources does not keep
+        their graphs alive, and a collected graph's key never equals the key of a new
+        graph, even if the new graph got the same id.
+        """
+        try:
+            plan = tuple(_freeze_call(*call) for call in self._calls)
+        except _Uncacheable:
+            return None
+        return weakref.ref(self.graph), self.graph.version, plan
+
+    def run(self) -> Any:
+        if (
+            self.result_cache is not None
+            and not self._profile
+            and self._trace_capacity is None
+        ):
+            key = self._cache_key()
+            if key is not None:
+                found, result = self.result_cache.get(key)
+                if not found:
+                    result = self._run()
+                    if isinstance(result, Iterator):
+                        return result
+                    # the graph may have been changed while the traversal ran
+                    if key[1] != self.graph.version:
+                        return result
+                    self.result_cache.put(key, result)
+                self.traversers = result
+                return copy(result) if isinstance(result, (list, dict, set)) else result
+        return self._run()
+
+    def _run(self) -> Any:
+        self.traversers = []
+        self._prepare()
+        if self.batch_size and self._profiler is None:
+            return self._run_batched()
         if self.eager:
             try:
                 for step in self.query_steps:
-                    logger.debug("Running step:" + str(step))
-                    self.traversers = step(self.traversers)
+                    if self._debug:
+                        logger.debug("Running step: %s", step)
+                    self.traversers = self._execute_step(step, self.traversers)
                     if (
                         not type(self.traversers) is list and not step.isterminal
                     ):  # terminal steps could produce any type of output
                         self.traversers = list(self.traversers)
+            except TraversalBudgetExceeded:
+                raise
             except Exception as e:
                 raise GraphTraversalError(
                     f"Something went wrong in step {step.print_query()}"
                 )
         else:
             for step in self.query_steps:
-                logger.debug("Running step:" + str(step))
-                self.traversers = step(self.traversers)
+                if self._debug:
+                    logger.debug("Running step: %s", step)
+                self.traversers = self._execute_step(step, self.traversers)
             # TODO: Try to do some fancy error handling
         return self.traversers
 
+    async def run_async(self, executor: "Executor | None" = None) -> Any:
+        """
+        Run the traversal without blocking the event loop.
+        The traversal runs in `executor` (the default thread pool of the loop if None),
+        lazy results are collected into a list there. Use `iter_async` to stream the results instead.
+        Cancelling the awaiting task cancels the traversal.
+        """
+        import asyncio
+
+        token = self._async_token()
+        loop = asyncio.get_running_loop()
+
+        def run():
+            result = self.run()
+            return list(result) if isinstance(result, Iterator) else result
+
+        try:
+            return await loop.run_in_executor(executor, run)
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
+
+    async def iter_async(
+        self,
+        chunk_size: int = ASYNC_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+        offload: bool = True,
+    ) -> AsyncIterator:
+        """
+        Iterate over the results of the traversal with `async for`.
+        The results are computed in chunks of `chunk_size` in `executor` (the default thread pool
+        of the loop if None), so the event loop stays responsive while barrier steps and IO run.
+        With `offload=False` the chunks are computed in the event loop thread, which
+        yields control to other tasks between two chunks.
+        A terminal `to_list()` is streamed item by item, other terminal steps yield their single result.
+        Leaving the loop early or cancelling the task cancels the traversal.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        token = self._async_token()
+
+        async def call(func: Callable[[], Any]) -> Any:
+            if offload:
+                return await loop.run_in_executor(executor, func)
+            await asyncio.sleep(0)
+            return func()
+
+        finished = False
+        try:
+            result = await call(self._run_streaming)
+            if isinstance(result, (list, tuple, Iterator)):
+                results = iter(result)
+                while chunk := await call(lambda: list(islice(results, chunk_size))):
+                    for item in chunk:
+                        yield item
+            else:
+                yield result
+            finished = True
+        finally:
+            if not finished:
+                token.cancel()
+
+    def _async_token(self) -> CancellationToken:
+        """give this traversal its own cancellation token, linked to the token of its budget"""
+        budget = self.budget or TraversalBudget()
+        token = CancellationToken(parent=budget.token)
+        self.budget = replace(budget, token=token)
+        return token
+
+    def _run_streaming(self) -> Any:
+        """run the traversal, a terminal `to_list()` streams its items instead of collecting them"""
+        from .steps.terminal_steps import AsGenerator, ToList
+
+        terminal = self.query_steps[-1]
+        if type(terminal) is not ToList:
+            return self.run()
+        self.query_steps[-1] = AsGenerator(
+            self, by=terminal.by, include_data=terminal.data
+        )
+        try:
+            return self.run()
+        finally:
+            self.query_steps[-1] = terminal
+
+    def _run_batched(self) -> Any:
+        """run the traversal with the batch protocol, see `with_batch_size`"""
+        batches = iter(())
+        step = None
+        try:
+            for step in self.query_steps:
+                if self._debug:
+                    logger.debug("Running step: %s", step)
+                if step.isterminal:
+                    self.traversers = step(unbatched(batches))
+                    return self.traversers
+                if self.tracer is not None:
+                    batches = self.tracer.run_step(
+                        step,
+                        self._depth,
+                        lambda: step.batches(batches, self.batch_size),
+                    )
+                else:
+                    batches = step.batches(batches, self.batch_size)
+                if self._monitor is not None:
+                    batches = self._monitor.guard_batches(batches, step)
+                if self.eager:
+                    batches = list(batches)
+        except TraversalBudgetExceeded:
+            raise
+        except Exception as e:
+            if not self.eager:
+                raise
+            raise GraphTraversalError(
+                f"Something went wrong in step {step.print_query()}"
+            ) from e
+        self.traversers = unbatched(batches)
+        return list(self.traversers) if self.eager else self.traversers
+
+    def _execute_step(self, step: "Step", traversers: Iterable) -> Any:
+        """run a single step, profiling it and enforcing the budget if requested"""
+        if self._profiler is not None and not step.isterminal:
+            traversers = self._profiler.run_step(step, traversers)
+        elif self.tracer is not None and not step.isterminal:
+            traversers = self.tracer.run_step(
+                step, self._depth, lambda: step(traversers)
+            )
+        else:
+            traversers = step(traversers)
+        if self._monitor is not None and not step.isterminal:
+            traversers = self._monitor.guard(traversers, step)
+        return traversers
+
     def _get_element(self, traverser: "Traverser", data: bool = False):
         if type(traverser) == Traverser:
             if data:
@@ -902,6 +1476,34 @@ class Traversal:
                 + " Probably you are performing a step that can only be executed on graph elements on a value or property traverser."
             )
 
+    def _get_elements(
+        self, traversers: List["Traverser"], values: bool = False
+    ) -> List:
+        """
+        get the data of the graph elements of a batch of traversers at once
+
+        Args:
+            traversers: the traversers, a list or a TraverserBatch
+            values: return the value of Value and Property traversers instead of raising an error
+        """
+        nodes = self.graph._node
+        adj = self.graph._adj
+        if isinstance(traversers, TraverserBatch):
+            if traversers.is_edge:
+                return [adj[u][v] for u, v in traversers.ids]
+            return [nodes[v] for v in traversers.ids]
+        elements = []
+        for t in traversers:
+            if type(t) is Traverser:
+                elements.append(
+                    nodes[t.node_id] if t.target is None else adj[t.node_id][t.target]
+                )
+            elif values:
+                elements.append(t.val)
+            else:
+                self._get_element(t)  # raises the error
+        return elements
+
     def _get_element_from_id(self, element_id: str | tuple):
         if isinstance(element_id, tuple):
             node = self.graph.edges[element_id]
@@ -929,11 +1531,14 @@ class AnonymousTraversal(Traversal):
 
     This behavior is implemented in the following way.
     1. When an anonymous traversal is created, it is empty, and it has a list of step templates.
-    2. When a step method is retrieved from the anonymous traversal, this `__getattribute__` call to obtain the method
-        is intercepted. Instead of returning the actual step method, which would run immediately and construct the step,
-        a deferred step method is returned. This deferred step method stores the step method and its arguments in the step templates.
+    2. The step methods of this class are deferred step methods (see `_deferred_step_method`, they are installed below the class).
+        Instead of running the actual step method, which would construct the step immediately,
+        a deferred step method stores the step method and its arguments in the step templates.
     3. When the anonymous traversal is build by a parent traversal, the parent traversal constructs the anonymous traversal.
         In the anonymous traversal's build method, it constructs all the steps from the step templates as if the step methods are only called at this point.
+        The constructed (and optimized) steps are kept as the compiled plan of the traversal:
+        building it again for the same graph and settings (e.g. for the next query using the same anonymous traversal)
+        only rebuilds the steps to reset their state instead of replaying the templates.
     4. The anonymous traversal is now ready to be run.
     """
 
@@ -943,9 +1548,27 @@ class AnonymousTraversal(Traversal):
         )
         self.graph = None
         self.terminated = False
+        self._monitor = None
+        self._profiler = None
+        self.tracer = None
+        self._depth = 0
+        self._debug = False
+        # whether the steps run without profiler, budget monitor and tracer, see __call__
+        self._plain = True
+        self.rewrites = []
+        self.batch_size = None
+        self.result_cache = None
+        self._calls = None
         self._needs_path = False
         self._initial_step = initial_deferred_step
         self._step_templates = []
+        # whether the step templates are being replayed, see _deferred_step_method
+        self._replaying = False
+        # the graph and settings the query steps were compiled for, see _build
+        self._compiled_for = None
+        # results per graph element, see first and results
+        self._memo = None
+        self._memo_version = None
 
     # we need this since anonymous traversals need to check this before they're run.
     # this is a very tricky part, since `query_steps` is undefined until the anonymous traversal is build.
@@ -957,6 +1580,48 @@ class AnonymousTraversal(Traversal):
     def needs_path(self, value):
         self._needs_path = value
 
+    @property
+    def is_pure(self) -> bool:
+        """
+        whether the results only depend on the graph element of the incoming traverser,
+        i.e. no step reads the path or the store of the traverser or has side effects
+        """
+        return not self._needs_path and all(step.is_pure for step in self.query_steps)
+
+    def first(self, traverser: "Traverser", default: Any = None) -> Any:
+        """
+        the first result of this traversal for a copy of `traverser`, `default` if there is none.
+        Results of pure traversals (see `is_pure`) are memoized per graph element for one run,
+        so the returned traverser may be shared and must not be modified.
+        """
+        result = self._memoized(
+            traverser, False, lambda: next(iter(self([traverser.copy()])), _EMPTY)
+        )
+        return default if result is _EMPTY else result
+
+    def results(self, traverser: "Traverser") -> List:
+        """
+        all results of this traversal for a copy of `traverser`, memoized like `first`
+        """
+        return self._memoized(
+            traverser, True, lambda: tu.ensure_is_list(self([traverser.copy()]))
+        )
+
+    def _memoized(self, traverser: "Traverser", all_results: bool, run: Callable):
+        memo = self._memo
+        if memo is None or type(traverser) is not Traverser:
+            return run()
+        if self._memo_version != self.graph.version:
+            # the graph changed while the traversal ran
+            memo.clear()
+            self._memo_version = self.graph.version
+        key = (traverser.get, all_results)
+        try:
+            return memo[key]
+        except KeyError:
+            result = memo[key] = run()
+            return result
+
     def number_of_steps(self, recursive=False):
         if self.query_steps is None:
             if recursive:
@@ -977,63 +1642,85 @@ class AnonymousTraversal(Traversal):
         self.use_mp = traversal.use_mp
         self.verify_query = traversal.verify_query
         self.optimize = traversal.optimize
-        # then, build the steps
+        self._monitor = traversal._monitor
+        self._profiler = traversal._profiler
+        self.tracer = traversal.tracer
+        self._depth = traversal._depth + 1
+        self._debug = traversal._debug
+        self._plain = (
+            self._monitor is None and self._profiler is None and self.tracer is None
+        )
+        settings = (
+            self.graph,
+            self.eager,
+            self.use_mp,
+            self.verify_query,
+            self.optimize,
+        )
+        if self._compiled_for != settings:
+            self._compile()
+            self._compiled_for = settings
+        # (re)building the steps resets their state, e.g. the traversers seen by dedup
+        super()._build()
+        self._memo = {} if self.is_pure else None
+        self._memo_version = self.graph.version
+
+    def _compile(self):
+        """construct, optimize and verify the steps from the step templates"""
         self.query_steps = []
         init_step_func, init_args, init_kwargs = self._initial_step
         init_step = init_step_func(*init_args, **init_kwargs)
         init_step.traversal = self
         self.query_steps.append(init_step)
-        for step, args, kwargs in self._step_templates:
-            step(*args, **kwargs)  # this is the step function
+        self._replaying = True
+        try:
+            for step_method, args, kwargs in self._step_templates:
+                step_method(self, *args, **kwargs)
+        finally:
+            self._replaying = False
         for step in self.query_steps:
             step.build()
         self.needs_path = any([s.needs_path for s in self.query_steps])
-        if traversal.optimize:
+        if self.optimize:
             self._optimize_query()
         if self.verify_query:
             self._verify_query()
         if self.query_steps[0].isstart:
             self.query_steps[0].set_traversal(self)
-        super()._build()
 
     def __call__(self, traversers: Iterable["Traverser"]) -> Iterable["Traverser"]:
         # if this traversal is empty, just reflect back the incoming traversers
         if len(self.query_steps) == 0:
             return traversers
+        if self._plain and not self.eager and not self._debug:
+            # the hot path: anonymous traversals run once per traverser in filter_, order().by(...), ...
+            for step in self.query_steps:
+                traversers = step(traversers)
+            self.traversers = traversers
+            return traversers
         self.traversers = traversers
         if self.eager:
             try:
                 for step in self.query_steps:
-                    logger.debug("Running step in anonymous traversal:" + str(step))
-                    self.traversers = step(self.traversers)
+                    if self._debug:
+                        logger.debug("Running step in anonymous traversal: %s", step)
+                    self.traversers = self._execute_step(step, self.traversers)
                     if not type(self.traversers) is list:
                         self.traversers = list(self.traversers)
+            except TraversalBudgetExceeded:
+                raise
             except Exception as e:
                 raise GraphTraversalError(
                     f"Something went wrong in step {step.print_query()}"
                 )
         else:
             for step in self.query_steps:
-                logger.debug("Running step:" + str(step))
-                self.traversers = step(self.traversers)
+                if self._debug:
+                    logger.debug("Running step in anonymous traversal: %s", step)
+                self.traversers = self._execute_step(step, self.traversers)
             # TODO: Try to do some fancy error handling
         return self.traversers
 
-    def __getattribute__(self, name):
-        attr = super().__getattribute__(name)
-        if callable(attr) and getattr(attr, "_is_step_method", False):
-            if getattr(attr, "_anonymous", True):
-                logger.debug("Returning lambda for anonymous step " + attr.__name__)
-
-                def deferred_step(*args, **kwargs):
-                    self._step_templates.append((attr, args, kwargs))
-                    return self
-
-                return deferred_step
-            else:
-                raise QueryError(f"Step {name} is not allowed in anonymous traversals")
-        return attr
-
     def print_query(self):
         def format_args(step, args, kwargs):
             step_str = f"{step.__name__}"
@@ -1058,6 +1745,36 @@ class AnonymousTraversal(Traversal):
         return " -> ".join(texts)
 
 
+def _deferred_step_method(name: str, step_method: Callable) -> Callable:
+    """
+    the step method `name` of AnonymousTraversal: records the call in the step templates
+    instead of constructing the step, the step is constructed when the templates are replayed.
+    """
+    if not step_method._anonymous:
+
+        def not_allowed(self, *args, **kwargs):
+            raise QueryError(f"Step {name} is not allowed in anonymous traversals")
+
+        return not_allowed
+
+    @wraps(step_method)
+    def deferred_step(self, *args, **kwargs):
+        if self._replaying:
+            # e.g. name() adding a values step
+            return step_method(self, *args, **kwargs)
+        self._step_templates.append((step_method, args, kwargs))
+        self._compiled_for = None
+        return self
+
+    return deferred_step
+
+
+for _name in dir(Traversal):
+    _attr = getattr(Traversal, _name)
+    if getattr(_attr, "_is_step_method", False):
+        setattr(AnonymousTraversal, _name, _deferred_step_method(_name, _attr))
+
+
 class MogwaiGraphTraversalSource:
     """
     see https://tinkerpop.apache.org/javadocs/current/full/org/apache/tinkerpop/gremlin/process/traversal/dsl/graph/GraphTraversalSource.html
@@ -1076,12 +1793,69 @@ class MogwaiGraphTraversalSource:
         eager: bool = False,
         optimize: bool = True,
         use_mp: bool = USE_MULTIPROCESSING,
+        budget: TraversalBudget | None = None,
+        batch_size: int | None = None,
+        result_cache: ResultCache | None = None,
     ):
+        """
+        Parameters
+        ----------
+        connector : MogwaiGraph
+            the graph to traverse
+        eager : bool, default False
+            materialize the traversers after every step
+        optimize : bool, default True
+            optimize the traversals before running them
+        use_mp : bool
+            allow the use of multiprocessing
+        budget : TraversalBudget, optional
+            resource limits applied to every traversal spawned by this source
+        batch_size : int, optional
+            run the traversals with the batch protocol using batches of this size
+        result_cache : ResultCache, optional
+            cache the results of the traversals, see `with_result_cache`
+        """
         self.connector = connector
         self.traversal_args = dict(
-            optimize=optimize, eager=eager, query_verify=True, use_mp=use_mp
+            optimize=optimize,
+            eager=eager,
+            query_verify=True,
+            use_mp=use_mp,
+            budget=budget,
+            batch_size=batch_size,
+            result_cache=result_cache,
         )
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        return self.traversal_args["result_cache"]
+
+    def with_result_cache(
+        self, max_size: int = RESULT_CACHE_SIZE, ttl: float | None = None
+    ) -> "MogwaiGraphTraversalSource":
+        """
+        Cache the results of the traversals spawned by this source.
+        A traversal that is run again with the same steps and arguments against an unchanged graph
+        returns the cached result (a shallow copy of it) without being executed.
+        Traversals with side effects, lazy results or functions as arguments are not cached.
+        Changes made through the MogwaiGraph methods invalidate the cached results,
+        call `MogwaiGraph.bump_version` after changing element attributes directly.
+
+        Parameters
+        ----------
+        max_size : int
+            the number of results to keep, the least recently used ones are evicted first
+        ttl : float, optional
+            the number of seconds a result stays valid
+        """
+        self.traversal_args["result_cache"] = ResultCache(max_size, ttl)
+        return self
+
+    def _start(self, method: str, start: "Step", *args, **kwargs) -> "Traversal":
+        traversal = Traversal(self, start=start, **self.traversal_args)
+        traversal._calls.append((getattr(type(self), method), args, kwargs))
+        return traversal
+
     def E(self, *init: Tuple[str] | List[Tuple[str]]) -> "Traversal":
         from .steps.start_steps import E
 
@@ -1089,7 +1863,7 @@ class MogwaiGraphTraversalSource:
             init = None
         elif len(init) == 1:
             init = init[0]
-        return Traversal(self, start=E(self.connector, init), **self.traversal_args)
+        return self._start("E", E(self.connector, init), init)
 
     def V(self, *init: str) -> "Traversal":
         from .steps.start_steps import V
@@ -1098,24 +1872,45 @@ class MogwaiGraphTraversalSource:
             init = None
         elif len(init) == 1:
             init = init[0]
-        return Traversal(self, start=V(self.connector, init), **self.traversal_args)
+        return self._start("V", V(self.connector, init), init)
 
     def addE(
         self, relation: str, from_: str = None, to_: str = None, **kwargs
     ) -> "Traversal":
         from .steps.start_steps import AddE
 
-        return Traversal(
-            self,
-            start=AddE(self.connector, relation, from_=from_, to_=to_, **kwargs),
-            **self.traversal_args,
+        return self._start(
+            "addE", AddE(self.connector, relation, from_=from_, to_=to_, **kwargs)
         )
 
     def addV(self, label: str | Set[str], name: str = "", **kwargs) -> "Traversal":
         from .steps.start_steps import AddV
 
-        return Traversal(
-            self,
-            start=AddV(self.connector, label, name, **kwargs),
-            **self.traversal_args,
-        )
+        return self._start("addV", AddV(self.connector, label, name, **kwargs))
+
+    def compute(
+        self, workers: int | None = None, label: str | List[str] | None = None
+    ) -> "GraphComputer":
+        """
+        Run whole-graph analytics (OLAP) as bulk synchronous vertex programs
+        on array snapshots of the graph instead of traversals, e.g.
+        `g.compute().page_rank(write="pagerank")`. Requires numpy.
+
+        Parameters
+        ----------
+        workers : int, optional
+            split every superstep over a pool of this many processes
+        label : str | List[str], optional
+            only use the edges with (one of) these labels
+
+        Returns
+        -------
+        GraphComputer
+            provides page_rank, connected_components, label_propagation,
+            degree_centrality and run for custom VertexPrograms
+        """
+        from .computer import GraphComputer
+
+        if not self.traversal_args["use_mp"]:
+            workers = None
+        return GraphComputer(self.connector, workers=workers, label=label)
@@ -7,7 +7,8 @@ Created on 2024
 import logging
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any
+from itertools import repeat
+from typing import Any, Iterator, List, Optional
 
 logger = logging.getLogger("Mogwai")
 
@@ -19,12 +20,19 @@ class BaseTraverser(ABC):
         self.path = []
 
     def to(self, other: "BaseTraverser") -> "BaseTraverser":
-        other.cache = deepcopy(self.cache)
+        other.cache = self.copy_cache()
         other.path = (
             self.path.copy()
         )  # we assume that elements in the path don't change
         return other
 
+    def copy_cache(self) -> dict:
+        """a deep copy of the cache, cheap for the common case of an empty cache"""
+        cache = self.cache
+        if len(cache) == 1 and not cache["__store__"]:
+            return {"__store__": {}}
+        return deepcopy(cache)
+
     @abstractmethod
     def copy(self) -> "BaseTraverser":
         pass
@@ -112,7 +120,7 @@ class Traverser(BaseTraverser):
         t = Traverser(
             node_id=self.node_id, other_node_id=self.target, track_path=self.track_path
         )
-        t.cache = deepcopy(self.cache)
+        t.cache = self.copy_cache()
         t.path = self.path.copy() if self.path else None
         return t
 
@@ -126,14 +134,14 @@ class Traverser(BaseTraverser):
 
     def to_value(self, val, dtype=None):
         val = Value(val, dtype=dtype)
-        val.cache = deepcopy(self.cache)
+        val.cache = self.copy_cache()
         if self.track_path:
             val.path = self.path.copy()
         return val
 
     def to_property(self, key, val, dtype=None):
         p = Property(key, val, dtype=dtype)
-        p.cache = deepcopy(self.cache)
+        p.cache = self.copy_cache()
         if self.track_path:
             p.path = self.path.copy()
         return p
@@ -185,7 +193,7 @@ class Value(BaseTraverser):
 
     def copy(self):
         val = Value(deepcopy(self.value))
-        val.cache = deepcopy(self.cache)
+        val.cache = self.copy_cache()
         if self.track_path:
             val.path = self.path.copy()
         return val
@@ -212,14 +220,14 @@ class Property(Value):
 
     def to_value(self):
         val = Value(self.val, dtype=self.dtype)
-        val.cache = deepcopy(self.cache)
+        val.cache = self.copy_cache()
         if self.track_path:
             val.path = self.path.copy()
         return val
 
     def to_key(self):
         val = Value(self.key, dtype=str)
-        val.cache = deepcopy(self.cache)
+        val.cache = self.copy_cache()
         if self.track_path:
             val.path = self.path.copy()
         return val
@@ -229,10 +237,81 @@ class Property(Value):
 
     def copy(self):
         prop = Property(deepcopy(self.key), deepcopy(self.value))
-        prop.cache = deepcopy(self.cache)
+        prop.cache = self.copy_cache()
         if self.track_path:
             prop.path = self.path.copy()
         return prop
 
     def __str__(self):
         return f"{self.__class__.__qualname__}[key={self.key}, value={self.val}]"
+
+
+class TraverserBatch:
+    """
+    A batch of traversers stored as parallel lists of element ids and
+    state references, used by the batch protocol (see `Step.batches`).
+
+    A state is the traverser the batch member was spawned from (its cache
+    is copied once the member is materialized) or None for a fresh
+    traverser. Batches never track paths.
+    """
+
+    __slots__ = ("ids", "states", "is_edge")
+
+    def __init__(
+        self,
+        ids: List[Any],
+        states: Optional[List[Optional[BaseTraverser]]] = None,
+        is_edge: bool = False,
+    ):
+        self.ids = ids
+        self.states = states
+        self.is_edge = is_edge
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __bool__(self) -> bool:
+        return len(self.ids) > 0
+
+    @staticmethod
+    def concat(batches: List["TraverserBatch"]) -> "TraverserBatch":
+        """join batches of the same kind of elements"""
+        ids = [element_id for batch in batches for element_id in batch.ids]
+        states = None
+        if any(batch.states is not None for batch in batches):
+            states = [state for batch in batches for state in batch.iter_states()]
+        is_edge = batches[0].is_edge if batches else False
+        return TraverserBatch(ids, states, is_edge)
+
+    def iter_states(self) -> Iterator[Optional[BaseTraverser]]:
+        return (
+            iter(self.states)
+            if self.states is not None
+            else repeat(None, len(self.ids))
+        )
+
+    def select(self, indices: List[int]) -> "TraverserBatch":
+        """the batch of the members at the given indices"""
+        ids = self.ids
+        states = self.states
+        return TraverserBatch(
+            [ids[i] for i in indices],
+            [states[i] for i in indices] if states is not None else None,
+            self.is_edge,
+        )
+
+    def to_value(self, state: Optional[BaseTraverser], val: Any) -> Value:
+        """a Value traverser for a member with the given state"""
+        value = Value(val)
+        if state is not None:
+            value.cache = state.copy_cache()
+        return value
+
+    def __iter__(self) -> Iterator[Traverser]:
+        """materialize the traversers"""
+        for element_id, state in zip(self.ids, self.iter_states()):
+            t = Traverser(*element_id) if self.is_edge else Traverser(element_id)
+            if state is not None:
+                t.cache = state.copy_cache()
+            yield t
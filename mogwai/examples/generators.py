@@ -0,0 +1,343 @@
+"""
+Created on 2026-10-19
+
+Synthetic labelled property graphs for benchmarks and stress tests
+"""
+
+import json
+import random
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from mogwai.core import MogwaiGraph, MogwaiGraphConfig
+
+DEGREE_DISTRIBUTIONS = ["uniform", "power-law"]
+PROPERTY_TYPES = {"int": "long", "float": "double", "str": "string", "bool": "boolean"}
+
+Vertex = Tuple[int, str, str, Dict[str, Any]]
+Edge = Tuple[int, int, str, Dict[str, Any]]
+
+
+@dataclass
+class PropertySpec:
+    """
+    the distribution of a typed property
+
+    Attributes:
+        name: the property name
+        dtype: one of int, float, str or bool
+        low: lower bound of numeric values
+        high: upper bound of numeric values
+        distribution: uniform or normal for numeric values
+        cardinality: the number of distinct str values
+        null_ratio: the fraction of elements without this property
+    """
+
+    name: str
+    dtype: str = "int"
+    low: float = 0
+    high: float = 100
+    distribution: str = "uniform"
+    cardinality: int = 100
+    null_ratio: float = 0.0
+
+    def __post_init__(self):
+        if self.dtype not in PROPERTY_TYPES:
+            raise ValueError(f"Unsupported property type {self.dtype}")
+        if self.distribution not in ["uniform", "normal"]:
+            raise ValueError(f"Unsupported distribution {self.distribution}")
+
+    def sample(self, rng: random.Random) -> Any:
+        """draw a value, None if the property is missing"""
+        if self.null_ratio and rng.random() < self.null_ratio:
+            return None
+        if self.dtype == "bool":
+            return rng.random() < 0.5
+        if self.dtype == "str":
+            return f"{self.name}{rng.randrange(self.cardinality)}"
+        if self.distribution == "normal":
+            mean = (self.low + self.high) / 2
+            value = rng.gauss(mean, (self.high - self.low) / 6)
+            value = min(max(value, self.low), self.high)
+        else:
+            value = self.low + rng.random() * (self.high - self.low)
+        return int(round(value)) if self.dtype == "int" else value
+
+
+class GraphGenerator:
+    """
+    Generate a labelled property graph with a given number of vertices
+    and edges.
+
+    The generator is deterministic for a given seed. Vertex ids are the
+    integers 0..num_vertices-1, generate turns them into the node ids of the graph. For the power-law distribution both
+    in and out degrees follow a Chung-Lu like weighting in which
+    low vertex ids are the hubs.
+
+    Elements are produced as streams so that large graphs can be written
+    to disk without being held in memory, only the out degree of each
+    vertex is kept.
+    """
+
+    def __init__(
+        self,
+        num_vertices: int,
+        num_edges: int,
+        degree_distribution: str = "power-law",
+        exponent: float = 2.5,
+        vertex_labels: int | List[str] = 3,
+        edge_labels: int | List[str] = 1,
+        vertex_properties: List[PropertySpec] = None,
+        edge_properties: List[PropertySpec] = None,
+        seed: int = 42,
+        self_loops: bool = False,
+    ):
+        """
+        Args:
+            num_vertices: the number of vertices
+            num_edges: the number of edges, parallel edges are never generated
+            degree_distribution: uniform or power-law
+            exponent: the exponent of the power-law degree distribution (> 1)
+            vertex_labels: the vertex labels or their cardinality
+            edge_labels: the edge labels or their cardinality
+            vertex_properties: typed vertex properties
+            edge_properties: typed edge properties
+            seed: the random seed
+            self_loops: allow edges from a vertex to itself
+        """
+        if degree_distribution not in DEGREE_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unsupported degree distribution {degree_distribution}, use one of {DEGREE_DISTRIBUTIONS}"
+            )
+        if exponent <= 1:
+            raise ValueError("The power-law exponent must be larger than 1")
+        max_degree = num_vertices if self_loops else num_vertices - 1
+        if num_edges > num_vertices * max_degree:
+            raise ValueError(
+                f"{num_edges} edges do not fit in a graph with {num_vertices} vertices"
+            )
+        self.num_vertices = num_vertices
+        self.num_edges = num_edges
+        self.degree_distribution = degree_distribution
+        self.exponent = exponent
+        self.vertex_labels = self._labels(vertex_labels, "Label")
+        self.edge_labels = self._labels(edge_labels, "edge")
+        self.vertex_properties = vertex_properties or []
+        self.edge_properties = edge_properties or []
+        self.seed = seed
+        self.self_loops = self_loops
+        self.max_degree = max_degree
+        # inverse transform sampling of p(i) ~ (i+1)^-alpha
+        self._alpha = 1 / (exponent - 1)
+        if self._alpha != 1:
+            self._span = (num_vertices + 1) ** (1 - self._alpha) - 1
+            self._inv = 1 / (1 - self._alpha)
+
+    @staticmethod
+    def _labels(labels: int | List[str], prefix: str) -> List[str]:
+        if isinstance(labels, int):
+            return [f"{prefix}{i}" for i in range(labels)]
+        return list(labels)
+
+    def _rng(self, purpose: str) -> random.Random:
+        return random.Random(f"{self.seed}:{purpose}")
+
+    def _pick(self, rng: random.Random) -> int:
+        """pick a vertex according to the degree distribution"""
+        n = self.num_vertices
+        if self.degree_distribution == "uniform":
+            return rng.randrange(n)
+        u = rng.random()
+        if self._alpha == 1:
+            x = (n + 1) ** u
+        else:
+            x = (1 + u * self._span) ** self._inv
+        return min(int(x) - 1, n - 1)
+
+    def _properties(
+        self, specs: List[PropertySpec], rng: random.Random
+    ) -> Dict[str, Any]:
+        properties = {}
+        for spec in specs:
+            value = spec.sample(rng)
+            if value is not None:
+                properties[spec.name] = value
+        return properties
+
+    def out_degrees(self) -> array:
+        """the out degree of every vertex"""
+        rng = self._rng("degrees")
+        degrees = array("q", [0]) * self.num_vertices
+        for _ in range(self.num_edges):
+            src = self._pick(rng)
+            while degrees[src] >= self.max_degree:
+                src = rng.randrange(self.num_vertices)
+            degrees[src] += 1
+        return degrees
+
+    def _targets(self, src: int, degree: int, rng: random.Random) -> List[int]:
+        """pick degree distinct targets for the given source"""
+        n = self.num_vertices
+        if degree > n // 2:
+            targets = rng.sample(range(n), min(degree + 1, n))
+            if not self.self_loops and src in targets:
+                targets.remove(src)
+            return targets[:degree]
+        targets = []
+        seen = set()
+        attempts = 0
+        while len(targets) < degree:
+            attempts += 1
+            # a hub may have exhausted the likely targets, fall back to uniform picks
+            if attempts > 20 * degree + 100:
+                dst = rng.randrange(n)
+            else:
+                dst = self._pick(rng)
+            if dst in seen or (dst == src and not self.self_loops):
+                continue
+            seen.add(dst)
+            targets.append(dst)
+        return targets
+
+    def vertices(self) -> Iterator[Vertex]:
+        """stream (id, label, name, properties) tuples"""
+        rng = self._rng("vertices")
+        for vertex_id in range(self.num_vertices):
+            label = self.vertex_labels[rng.randrange(len(self.vertex_labels))]
+            properties = self._properties(self.vertex_properties, rng)
+            yield vertex_id, label, f"v{vertex_id}", properties
+
+    def adjacency(self) -> Iterator[Tuple[int, List[Edge]]]:
+        """stream the out edges grouped by source vertex"""
+        degrees = self.out_degrees()
+        rng = self._rng("edges")
+        for src in range(self.num_vertices):
+            edges = []
+            for dst in self._targets(src, degrees[src], rng):
+                label = self.edge_labels[rng.randrange(len(self.edge_labels))]
+                edges.append(
+                    (src, dst, label, self._properties(self.edge_properties, rng))
+                )
+            yield src, edges
+
+    def edges(self) -> Iterator[Edge]:
+        """stream (src, dst, label, properties) tuples"""
+        for _src, edges in self.adjacency():
+            yield from edges
+
+    def generate(self, config: MogwaiGraphConfig = None) -> MogwaiGraph:
+        """
+        build the graph in memory through the bulk insert path
+
+        the vertex ids are the node ids the graph would have given them,
+        strings unless the config asks for int_ids
+        """
+        graph = MogwaiGraph(config=config)
+        if graph.config.int_ids:
+            graph.add_labeled_nodes_from(self.vertices())
+            graph.add_labeled_edges_from(self.edges())
+        else:
+            graph.add_labeled_nodes_from(
+                (str(vertex_id), label, name, properties)
+                for vertex_id, label, name, properties in self.vertices()
+            )
+            graph.add_labeled_edges_from(
+                (str(src), str(dst), label, properties)
+                for src, dst, label, properties in self.edges()
+            )
+        # the next added node gets the next id
+        graph.counter = self.num_vertices
+        return graph
+
+    def write_graphml(self, file_path: str) -> None:
+        """
+        stream the graph to a GraphML file that can be read with
+        graphml_to_mogwaigraph(file_path, node_label_key="labelV",
+        node_name_key="name", edge_label_key="labelE", keep=False)
+        """
+
+        def value(v: Any) -> str:
+            if isinstance(v, bool):
+                return "true" if v else "false"
+            return escape(str(v))
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+            keys = [("node", "labelV", "str"), ("node", "name", "str")]
+            keys += [("node", spec.name, spec.dtype) for spec in self.vertex_properties]
+            keys += [("edge", "labelE", "str")]
+            keys += [("edge", spec.name, spec.dtype) for spec in self.edge_properties]
+            for element, name, dtype in keys:
+                f.write(
+                    f"  <key id={quoteattr(f'{element[0]}_{name}')} for=\"{element}\" "
+                    f'attr.name={quoteattr(name)} attr.type="{PROPERTY_TYPES[dtype]}"/>\n'
+                )
+            f.write('  <graph id="G" edgedefault="directed">\n')
+            for vertex_id, label, name, properties in self.vertices():
+                f.write(f'    <node id="{vertex_id}">')
+                f.write(f'<data key="n_labelV">{value(label)}</data>')
+                f.write(f'<data key="n_name">{value(name)}</data>')
+                for key, v in properties.items():
+                    f.write(f"<data key={quoteattr('n_' + key)}>{value(v)}</data>")
+                f.write("</node>\n")
+            for edge_id, (src, dst, label, properties) in enumerate(self.edges()):
+                f.write(f'    <edge id="{edge_id}" source="{src}" target="{dst}">')
+                f.write(f'<data key="e_labelE">{value(label)}</data>')
+                for key, v in properties.items():
+                    f.write(f"<data key={quoteattr('e_' + key)}>{value(v)}</data>")
+                f.write("</edge>\n")
+            f.write("  </graph>\n</graphml>\n")
+
+    def write_graphson(self, file_path: str) -> None:
+        """
+        stream the graph to a line oriented GraphSON 3.0 file with one
+        vertex and its out edges per line
+        """
+        from mogwai.io.mogwai_io import GraphSON
+
+        graphson = GraphSON()
+        wrap = graphson.wrap_type
+        edge_id = 0
+        property_id = 0
+        with open(file_path, "w", encoding="utf-8") as f:
+            for (vertex_id, label, name, properties), (_src, edges) in zip(
+                self.vertices(), self.adjacency()
+            ):
+                vertex_properties = {}
+                for key, v in {"name": name, **properties}.items():
+                    vertex_properties[key] = [
+                        {"id": wrap(property_id), "value": wrap(v)}
+                    ]
+                    property_id += 1
+                out_edges: Dict[str, List[dict]] = {}
+                for _src, dst, edge_label, edge_properties in edges:
+                    edge = {"id": wrap(edge_id), "inV": wrap(dst)}
+                    if edge_properties:
+                        edge["properties"] = {
+                            k: wrap(v) for k, v in edge_properties.items()
+                        }
+                    out_edges.setdefault(edge_label, []).append(edge)
+                    edge_id += 1
+                record = {
+                    "id": wrap(vertex_id),
+                    "label": label,
+                    "properties": vertex_properties,
+                }
+                if out_edges:
+                    record["outE"] = out_edges
+                f.write(json.dumps(record) + "\n")
+
+
+def generate_graph(
+    num_vertices: int,
+    num_edges: int,
+    config: Optional[MogwaiGraphConfig] = None,
+    **kwargs,
+) -> MogwaiGraph:
+    """
+    shortcut for GraphGenerator(num_vertices, num_edges, **kwargs).generate(config)
+    """
+    return GraphGenerator(num_vertices, num_edges, **kwargs).generate(config)
@@ -4,13 +4,49 @@ Created on 2024-08-17
 @author: wf
 """
 
+import asyncio
 import logging
 import os
-from typing import Dict, List
+import threading
+from typing import Any, Callable, Dict, List
 
 from mogwai.core import MogwaiGraph
 from mogwai.graph_config import GraphConfig, GraphConfigs
 from mogwai.parser.graphml_converter import graphml_to_mogwaigraph
+from mogwai.utils.rw_lock import ReadWriteLock
+
+
+class SharedGraph:
+    """
+    A MogwaiGraph shared between several (web) sessions.
+
+    Queries run under the read lock so that many sessions can traverse
+    the same in-memory graph at once, mutations and traversals with
+    side effects need the write lock.
+    """
+
+    def __init__(self, name: str, graph: MogwaiGraph):
+        self.name = name
+        self.graph = graph
+        self.lock = ReadWriteLock()
+
+    def traversal_source(self, **kwargs):
+        """get a traversal source for the shared graph"""
+        from mogwai.core.traversal import MogwaiGraphTraversalSource
+
+        return MogwaiGraphTraversalSource(self.graph, **kwargs)
+
+    def run(self, traversal) -> Any:
+        """run the given traversal while holding the read lock, the write lock if it has side effects"""
+        if traversal.has_side_effects():
+            return self.update(lambda graph: traversal.run())
+        with self.lock.read_locked():
+            return traversal.run()
+
+    def update(self, func: Callable[[MogwaiGraph], Any]) -> Any:
+        """apply func to the graph while holding the write lock"""
+        with self.lock.write_locked():
+            return func(self.graph)
 
 
 class Graphs:
@@ -30,6 +66,10 @@ class Graphs:
             config_file = os.path.join(self.examples_dir, "example_graph_configs.yaml")
         self.config_file = config_file
         self.graphs: Dict[str, MogwaiGraph] = {}
+        self.shared_graphs: Dict[str, SharedGraph] = {}
+        # guards the per name load locks and the shared graph handles
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
 
         self.log(f"Loading configurations from: {self.config_file}")
         self.configs = GraphConfigs.load_from_yaml_file(self.config_file)
@@ -70,35 +110,72 @@ class Graphs:
         return names
 
     def get(self, name: str) -> MogwaiGraph:
-        """Get a graph by name, loading it if necessary"""
+        """Get a graph by name, loading it if necessary
+
+        Loading is single-flight: concurrent callers asking for the same
+        graph wait for the first load instead of loading it again.
+        """
         if name not in self.configs.configs:
             error_msg = f"Graph '{name}' not found in configurations"
             self.log(error_msg)
             raise ValueError(error_msg)
 
-        if name not in self.graphs:
-            config = self.configs.configs[name]
-            if config.custom_loader:
-                self.log(f"Using custom loader for graph '{name}'")
-                # Assuming custom_loader is a string representing a method name in MogwaiGraph
-                loader = getattr(MogwaiGraph, config.custom_loader, None)
-                if loader and callable(loader):
-                    self.graphs[name] = loader()
-                else:
-                    error_msg = f"Invalid custom loader {config.custom_loader} for graph '{name}'"
-                    self.log(error_msg)
-                    raise ValueError(error_msg)
-            elif config.file_path:
-                file_path = os.path.join(self.examples_dir, config.file_path)
-                self.log(f"Loading graph '{name}' from file: {file_path}")
-                self.graphs[name] = self._load_graph(file_path, config)
-            else:
-                error_msg = f"No loader or file path specified for graph '{name}'"
-                self.log(error_msg)
-                raise ValueError(error_msg)
-
+        graph = self.graphs.get(name)
+        if graph is not None:
+            return graph
+        with self._get_load_lock(name):
+            # another thread might have loaded the graph while we waited
+            if name not in self.graphs:
+                graph = self._load(name)
+                graph.name = name
+                self.graphs[name] = graph
         return self.graphs[name]
 
+    async def get_async(self, name: str) -> MogwaiGraph:
+        """Get a graph by name, loading it in a worker thread so that the event loop is not blocked"""
+        return await asyncio.to_thread(self.get, name)
+
+    def get_shared(self, name: str) -> SharedGraph:
+        """Get a shared, lock protected handle for the graph with the given name"""
+        graph = self.get(name)
+        with self._lock:
+            shared = self.shared_graphs.get(name)
+            if shared is None or shared.graph is not graph:
+                shared = SharedGraph(name, graph)
+                self.shared_graphs[name] = shared
+        return shared
+
+    def _get_load_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            lock = self._load_locks.get(name)
+            if lock is None:
+                lock = threading.Lock()
+                self._load_locks[name] = lock
+        return lock
+
+    def _load(self, name: str) -> MogwaiGraph:
+        """Load the graph with the given name according to its configuration"""
+        config = self.configs.configs[name]
+        if config.custom_loader:
+            self.log(f"Using custom loader for graph '{name}'")
+            # Assuming custom_loader is a string representing a method name in MogwaiGraph
+            loader = getattr(MogwaiGraph, config.custom_loader, None)
+            if loader and callable(loader):
+                return loader()
+            error_msg = (
+                f"Invalid custom loader {config.custom_loader} for graph '{name}'"
+            )
+            self.log(error_msg)
+            raise ValueError(error_msg)
+        elif config.file_path:
+            file_path = os.path.join(self.examples_dir, config.file_path)
+            self.log(f"Loading graph '{name}' from file: {file_path}")
+            return self._load_graph(file_path, config)
+        else:
+            error_msg = f"No loader or file path specified for graph '{name}'"
+            self.log(error_msg)
+            raise ValueError(error_msg)
+
 
 # Usage example:
 if __name__ == "__main__":
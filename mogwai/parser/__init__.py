@@ -1,3 +1,18 @@
-from .filesystem import FileSystemGraph
-from .graphml_converter import graphml_to_mogwaigraph
-from .pdfgraph import PDFGraph
+from typing import TYPE_CHECKING
+
+from mogwai.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .filesystem import FileSystemGraph
+    from .graphml_converter import graphml_to_mogwaigraph
+    from .pdfgraph import PDFGraph
+
+# imported on first access, so that using one parser does not import the others
+_LAZY_ATTRIBUTES = {
+    "FileSystemGraph": ".filesystem",
+    "graphml_to_mogwaigraph": ".graphml_converter",
+    "PDFGraph": ".pdfgraph",
+}
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+# `from package import *` imports the lazy attributes
+__all__ = list(_LAZY_ATTRIBUTES)
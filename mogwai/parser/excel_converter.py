@@ -1,7 +1,6 @@
-import ast
 import os
+from typing import Any, Dict, Iterator, List, Tuple
 
-import pandas as pd
 from openpyxl import load_workbook
 
 from mogwai.core import MogwaiGraph
@@ -11,8 +10,26 @@ from .filesystem import get_file_stats
 
 class EXCELGraph(MogwaiGraph):
     LABEL = "EXCELFile"
+    ROW_LABEL = "EXCELRow"
 
-    def __init__(self, file: str = None, name: str = None, **kwargs):
+    def __init__(
+        self,
+        file: str = None,
+        name: str = None,
+        rows: bool = False,
+        foreign_keys: Dict[str, str] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            file: the Excel file
+            name: the name of the file node, the file name by default
+            rows: turn every row into a node labeled with EXCELRow and its sheet name
+                instead of storing the columns of a sheet as properties of its node
+            foreign_keys: in rows mode, link the rows whose "sheet.column" value equals
+                the "other sheet.key column" value of another row, e.g.
+                {"orders.customer": "customers.id"}; the edges are labeled with the column
+        """
         super().__init__(**kwargs)
         if file is not None:
             if not os.path.exists(file):
@@ -22,7 +39,10 @@ class EXCELGraph(MogwaiGraph):
             self.root = self.add_labeled_node(
                 label=EXCELGraph.LABEL, name=name, **get_file_stats(self.file)
             )
-            self.construct()
+            if rows:
+                self.construct_rows(foreign_keys or {})
+            else:
+                self.construct()
 
     def construct(self):
         dic = excel_to_dic(self.file)
@@ -34,12 +54,66 @@ class EXCELGraph(MogwaiGraph):
             )
             self.add_labeled_edge(self.root, node, "HAS_SHEET")
 
+    def construct_rows(self, foreign_keys: Dict[str, str]):
+        """
+        one pass over the workbook in read-only mode, the rows are streamed
+        into the bulk insert so that only one row is held in memory at a time
+        """
+        workbook = load_workbook(self.file, read_only=True, data_only=True)
+        try:
+            worksheets = workbook.worksheets
+            self.nodes[self.root].update(
+                {
+                    "metadata": workbook_metadata(workbook),
+                    "number_of_sheets": len(worksheets),
+                }
+            )
+            for worksheet in worksheets:
+                columns, rows = read_rows(worksheet)
+                sheet = self.add_labeled_node(
+                    label="EXCELSheet", name=worksheet.title, columns=columns
+                )
+                self.add_labeled_edge(self.root, sheet, "HAS_SHEET")
+                row_ids = []
+                self.add_labeled_nodes_from(
+                    self._row_nodes(worksheet.title, columns, rows, row_ids)
+                )
+                self.add_labeled_edges_from(
+                    (sheet, row_id, "HAS_ROW", {}) for row_id in row_ids
+                )
+                self.nodes[sheet]["number_of_rows"] = len(row_ids)
+        finally:
+            workbook.close()
+        for column, key in foreign_keys.items():
+            sheet, _, field = column.partition(".")
+            target_sheet, _, target_field = key.partition(".")
+            self.join(sheet, target_sheet, field, target_field, field)
 
-def excel_to_dic(path: str) -> dict:
-    workbook = load_workbook(path)
+    def _row_nodes(
+        self,
+        sheet: str,
+        columns: List[str],
+        rows: Iterator[Tuple],
+        row_ids: List,
+    ) -> Iterator[Tuple[Any, frozenset, str, dict]]:
+        """the (node id, labels, name, properties) of the rows, empty cells are left out"""
+        name_field = self.config.name_field
+        labels = frozenset({EXCELGraph.ROW_LABEL, sheet})
+        for index, row in enumerate(rows):
+            node_id = self.get_next_node_id()
+            row_ids.append(node_id)
+            properties = {
+                column: value
+                for column, value in zip(columns, row)
+                if value is not None
+            }
+            name = properties.pop(name_field, f"{sheet}!{index}")
+            yield node_id, labels, name, properties
+
+
+def workbook_metadata(workbook) -> dict:
     p = workbook.properties
-    sheetnames = workbook.sheetnames
-    dic = {
+    return {
         "creator": p.creator,
         "title": p.title,
         "description": p.description,
@@ -53,15 +127,39 @@ def excel_to_dic(path: str) -> dict:
         "revision": p.revision,
         "keywords": p.keywords,
     }
-    dic["sheets"] = []
 
-    for sheet in sheetnames:
-        try:
-            dataframe = pd.read_excel(path, sheet_name=sheet)
 
-            json = ast.literal_eval(pd.DataFrame.to_json(dataframe))
-            json = dict({"name": sheet}, **json)  # json["name"] = sheet
-            dic["sheets"].append(json)
-        except ValueError:
-            raise ValueError(f"Excel sheet with path {path} needs a tabular format")
+def read_rows(worksheet) -> Tuple[List[str], Iterator[Tuple]]:
+    """
+    the column names of the header row and a lazy iterator over the non empty
+    rows below it, formulas are read as their cached values
+
+    unnamed columns are called "Unnamed: <index>" and repeated names get a ".<n>" suffix
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, ())
+    columns, seen = [], {}
+    for index, value in enumerate(header):
+        column = f"Unnamed: {index}" if value is None else str(value)
+        count = seen.get(column, 0)
+        seen[column] = count + 1
+        columns.append(f"{column}.{count}" if count else column)
+    return columns, (row for row in rows if any(value is not None for value in row))
+
+
+def excel_to_dic(path: str) -> dict:
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        dic = workbook_metadata(workbook)
+        dic["sheets"] = []
+        for worksheet in workbook.worksheets:
+            columns, rows = read_rows(worksheet)
+            sheet = {column: {} for column in columns}
+            for index, row in enumerate(rows):
+                key = str(index)
+                for column, value in zip(columns, row):
+                    sheet[column][key] = value
+            dic["sheets"].append(dict({"name": worksheet.title}, **sheet))
+    finally:
+        workbook.close()
     return dic
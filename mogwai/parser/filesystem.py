@@ -1,10 +1,13 @@
 import os
+import pickle
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Tuple
 
 from mogwai.core.mogwaigraph import MogwaiGraph
 
 
-def get_file_stats(file) -> dict:
-    res = os.stat(file)
+def get_file_stats(file, stat: os.stat_result = None) -> dict:
+    res = stat or os.stat(file)
     stats = {
         "filesize": res.st_size,
         "full_path": os.path.abspath(file),
@@ -39,39 +42,216 @@ IGNORED_DIRECTORIES = [".git", "__pycache__"]
 FILETYPES_TO_UNFOLD = (".pdf", ".pptx", ".xlsx")
 
 
+@dataclass
+class ManifestEntry:
+    """
+    a crawled file or directory
+
+    Attributes:
+        size: the size of the file when it was crawled
+        mtime: the modification time of the file when it was crawled
+        node_ids: the nodes of the file, the first one is linked from its directory
+    """
+
+    size: int
+    mtime: float
+    node_ids: List[Hashable] = field(default_factory=list)
+
+
+@dataclass
+class CrawlStats:
+    """
+    the progress and result of a crawl
+
+    Attributes:
+        directories: the number of directories scanned
+        files: the number of files seen
+        unchanged: the number of files that were not changed since the last crawl
+        to_parse: the number of documents to unfold
+        parsed: the number of documents unfolded so far
+        removed: the number of vanished or changed files removed from the graph
+    """
+
+    directories: int = 0
+    files: int = 0
+    unchanged: int = 0
+    to_parse: int = 0
+    parsed: int = 0
+    removed: int = 0
+
+
 class FileSystemGraph(MogwaiGraph):
+    """
+    The directories and files below a root path, PDF, PowerPoint and Excel
+    documents are unfolded into their subgraphs.
+
+    The manifest maps every crawled path onto its size, modification time and nodes,
+    so that `crawl` can be called again (also after `save` and `load`) to re-parse
+    only the changed files and to remove the vanished ones.
+    """
 
-    def __init__(self, root_path):
+    def __init__(
+        self,
+        root_path: str,
+        workers: int = 1,
+        progress: Callable[[CrawlStats], None] = None,
+    ):
+        """
+        Args:
+            root_path: the directory to crawl
+            workers: the number of processes unfolding the documents
+            progress: called with the stats after the scan and after every unfolded document
+        """
         super().__init__()
         self.root_path = root_path
-        self.extract_graph(self.root_path)
-        # self._extract_graph_structure()
-
-    def extract_graph(self, current_path, parent_node=None):
-        if not os.path.exists(current_path):
-            raise ValueError(f"Path {current_path} does not exist.")
-        if os.path.isfile(current_path):
-            if current_path.endswith(FILETYPES_TO_UNFOLD):
-                if parent_node is None:
-                    raise ValueError("A filesystem graph can not be just one file")
-                subgraph = get_subgraph(current_path)
-                self.merge(subgraph, parent_node, subgraph.root, "HAS_FILE")
+        self.manifest: Dict[str, ManifestEntry] = {}
+        self.crawl(workers, progress)
+
+    def crawl(
+        self, workers: int = 1, progress: Callable[[CrawlStats], None] = None
+    ) -> CrawlStats:
+        """
+        crawl the root path, see __init__ for the arguments
+
+        Returns:
+            CrawlStats: the numbers of scanned, unchanged, parsed and removed files
+        """
+        if not os.path.exists(self.root_path):
+            raise ValueError(f"Path {self.root_path} does not exist.")
+        stats = CrawlStats()
+        seen = set()
+        files: List[Tuple[str, Hashable, os.stat_result]] = []
+        documents: List[Tuple[str, Hashable, os.stat_result]] = []
+        stack = []
+        if os.path.isdir(self.root_path):
+            stack.append((self.root_path, None, os.stat(self.root_path)))
+        elif self.root_path.endswith(FILETYPES_TO_UNFOLD):
+            raise ValueError("A filesystem graph can not be just one file")
+        else:
+            stat = os.stat(self.root_path)
+            seen.add(self.root_path)
+            stats.files += 1
+            if self._is_unchanged(self.root_path, stat):
+                stats.unchanged += 1
             else:
-                node = self.add_labeled_node(
-                    name=os.path.basename(current_path),
-                    **get_file_stats(current_path),
-                    label="File",
-                )
-                if parent_node is not None:
-                    self.add_labeled_edge(parent_node, node, "HAS_FILE")
+                stats.removed += self._remove_path(self.root_path)
+                files.append((self.root_path, None, stat))
+        while stack:
+            path, parent_node, stat = stack.pop()
+            seen.add(path)
+            stats.directories += 1
+            node = self._directory_node(path, parent_node, stat)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in IGNORED_DIRECTORIES:
+                        continue
+                    if entry.is_dir():
+                        stack.append((entry.path, node, entry.stat()))
+                    elif entry.is_file():
+                        stats.files += 1
+                        seen.add(entry.path)
+                        file_stat = entry.stat()
+                        if self._is_unchanged(entry.path, file_stat):
+                            stats.unchanged += 1
+                            continue
+                        stats.removed += self._remove_path(entry.path)
+                        if entry.name.endswith(FILETYPES_TO_UNFOLD):
+                            documents.append((entry.path, node, file_stat))
+                        else:
+                            files.append((entry.path, node, file_stat))
+        for path in [path for path in self.manifest if path not in seen]:
+            stats.removed += self._remove_path(path)
+        self._add_files(files)
+        stats.to_parse = len(documents)
+        if progress:
+            progress(stats)
+        self._unfold(documents, stats, workers, progress)
+        return stats
+
+    def _is_unchanged(self, path: str, stat: os.stat_result) -> bool:
+        entry = self.manifest.get(path)
+        return (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime == stat.st_mtime
+        )
+
+    def _directory_node(
+        self, path: str, parent_node: Hashable, stat: os.stat_result
+    ) -> Hashable:
+        entry = self.manifest.get(path)
+        if entry is not None:
+            return entry.node_ids[0]
+        node = self.add_labeled_node(name=os.path.basename(path), label="Directory")
+        if parent_node is not None:
+            self.add_labeled_edge(parent_node, node, "HAS_FOLDER")
+        self.manifest[path] = ManifestEntry(stat.st_size, stat.st_mtime, [node])
+        return node
 
-        elif os.path.isdir(current_path):
-            current_node = self.add_labeled_node(
-                name=os.path.basename(current_path), label="Directory"
-            )
+    def _add_files(self, files: List[Tuple[str, Hashable, os.stat_result]]):
+        """bulk insert of the (path, directory node, stat) files"""
+        nodes, edges = [], []
+        for path, parent_node, stat in files:
+            node = self.get_next_node_id()
+            name = os.path.basename(path)
+            nodes.append((node, "File", name, get_file_stats(path, stat)))
             if parent_node is not None:
-                self.add_labeled_edge(parent_node, current_node, "HAS_FOLDER")
-            for item in os.listdir(current_path):
-                if not item in IGNORED_DIRECTORIES:
-                    item_path = os.path.join(current_path, item)
-                    self.extract_graph(item_path, current_node)
+                edges.append((parent_node, node, "HAS_FILE", {}))
+            self.manifest[path] = ManifestEntry(stat.st_size, stat.st_mtime, [node])
+        self.add_labeled_nodes_from(nodes)
+        self.add_labeled_edges_from(edges)
+
+    def _remove_path(self, path: str) -> int:
+        """remove the nodes of a crawled path, the number of removed paths"""
+        entry = self.manifest.pop(path, None)
+        if entry is None:
+            return 0
+        self.remove_nodes_from(entry.node_ids)
+        return 1
+
+    def _unfold(
+        self,
+        documents: List[Tuple[str, Hashable, os.stat_result]],
+        stats: CrawlStats,
+        workers: int,
+        progress: Callable[[CrawlStats], None],
+    ):
+        """parse the documents, in a process pool for more than one worker, and merge their subgraphs"""
+        paths = [path for path, _, _ in documents]
+        if workers > 1 and len(documents) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(workers)
+            subgraphs = executor.map(get_subgraph, paths, chunksize=4)
+        else:
+            executor = None
+            subgraphs = map(get_subgraph, paths)
+        try:
+            for (path, parent_node, stat), subgraph in zip(documents, subgraphs):
+                root = subgraph.root
+                # the subgraphs are not used elsewhere, so their data is moved
+                mapping = self.merge(
+                    subgraph, parent_node, root, "HAS_FILE", copy=False
+                )
+                node_ids = [mapping[root]]
+                node_ids += [node for n, node in mapping.items() if n != root]
+                self.manifest[path] = ManifestEntry(
+                    stat.st_size, stat.st_mtime, node_ids
+                )
+                stats.parsed += 1
+                if progress:
+                    progress(stats)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def save(self, path: str):
+        """save the graph and its manifest, see load"""
+        with open(path, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "FileSystemGraph":
+        """load a saved graph, `crawl` updates it"""
+        with open(path, "rb") as file:
+            return pickle.load(file)
@@ -5,7 +5,7 @@ from typing import Callable
 import networkx as nx
 
 from mogwai.core.exceptions import MogwaiGraphError
-from mogwai.core.mogwaigraph import MogwaiGraph
+from mogwai.core.mogwaigraph import MogwaiGraph, MogwaiGraphConfig
 
 logger = logging.getLogger("Mogwai")
 
@@ -20,6 +20,7 @@ def graphml_to_mogwaigraph(
     default_node_name: str = "Na",
     include_id: bool | str = False,
     keep: bool = True,
+    config: MogwaiGraphConfig = None,
 ) -> MogwaiGraph:
     """
     Converts GraphML file to MogwaiGraph object.
@@ -49,6 +50,8 @@ def graphml_to_mogwaigraph(
         If a string, the node id is included in the data dictionary with the given key.
     keep : bool, optional
         If True, the labels and names are kept as properties in the node data dictionary. If False, they are removed.
+    config : MogwaiGraphConfig, optional
+        The configuration of the created graph, e.g. to use integer node ids.
 
     Returns
     -------
@@ -58,7 +61,7 @@ def graphml_to_mogwaigraph(
     gml = nx.read_graphml(file)
     if not gml.is_directed():
         raise MogwaiGraphError("Can not import undirected graphml graph")
-    g = MogwaiGraph()
+    g = MogwaiGraph(config=config)
     edge_label_key = edge_label_key or node_label_key
     if include_id == True:
         include_id = "id"  # use 'id' as the default key
@@ -0,0 +1,152 @@
+"""
+Created on 2026-10-19
+
+Page and slide nodes of documents whose content is extracted
+in a process pool or lazily on first read.
+"""
+
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from mogwai.core import MogwaiGraph
+
+# content(file, start, stop) -> the content properties of the pages start..stop-1
+PageContent = Callable[[str, int, int], List[dict]]
+
+
+class LazyProperties(dict):
+    """
+    Node data that calls `loader` when a property is read that is not set yet and
+    adds the properties the loader returns, e.g. the text of a page.
+
+    The loader must be picklable (a partial of a module level function),
+    pickling does not load the properties.
+    """
+
+    def __init__(self, data: dict, loader: Callable[[], dict]):
+        super().__init__(data)
+        self.loader = loader
+
+    @property
+    def loaded(self) -> bool:
+        return self.loader is None
+
+    def load(self):
+        loader, self.loader = self.loader, None
+        if loader is not None:
+            for key, value in loader().items():
+                self.setdefault(key, value)
+
+    def __missing__(self, key):
+        if self.loader is None:
+            raise KeyError(key)
+        self.load()
+        return self[key]
+
+    def get(self, key, default=None):
+        if self.loader is not None and not dict.__contains__(self, key):
+            self.load()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        if self.loader is not None and not dict.__contains__(self, key):
+            self.load()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.load()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self.load()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.load()
+        return dict.keys(self)
+
+    def values(self):
+        self.load()
+        return dict.values(self)
+
+    def items(self):
+        self.load()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self.load()
+        return dict.copy(self)
+
+    def __reduce_ex__(self, protocol):
+        return LazyProperties, (dict(dict.items(self)), self.loader)
+
+
+def _page(content: PageContent, file: str, index: int) -> dict:
+    return content(file, index, index + 1)[0]
+
+
+def _chunks(count: int, workers: int) -> List[Tuple[int, int]]:
+    size = max(1, -(-count // (workers * 4)))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def add_page_nodes(
+    graph: MogwaiGraph,
+    root: Hashable,
+    label: str,
+    edge_label: str,
+    pages: List[Tuple[str, Dict[str, Any]]],
+    content: PageContent,
+    file: str,
+    lazy: bool = False,
+    workers: int = 1,
+) -> List[Hashable]:
+    """
+    add a node per page, linked from the root node
+
+    Args:
+        graph: the document graph
+        root: the node of the document
+        label: the label of the page nodes
+        edge_label: the label of the edges from the root
+        pages: the (name, properties) of the pages that are cheap to get
+        content: extracts the expensive properties of the pages, must be module level
+        file: the document
+        lazy: extract the content of a page when its properties are first read
+        workers: extract the content in a process pool with this many processes
+
+    Returns:
+        List[Hashable]: the ids of the page nodes
+    """
+    node_ids = [graph.get_next_node_id() for _ in pages]
+    if lazy:
+        contents = [{} for _ in pages]
+    elif workers > 1 and len(pages) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = _chunks(len(pages), workers)
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(
+                content,
+                [file] * len(chunks),
+                [start for start, _ in chunks],
+                [stop for _, stop in chunks],
+            )
+            contents = [page for result in results for page in result]
+    else:
+        contents = content(file, 0, len(pages))
+    graph.add_labeled_nodes_from(
+        (node_id, label, name, {**properties, **page_content})
+        for node_id, (name, properties), page_content in zip(node_ids, pages, contents)
+    )
+    graph.add_labeled_edges_from(
+        (root, node_id, edge_label, {}) for node_id in node_ids
+    )
+    if lazy:
+        # the data dicts are replaced by equal ones, so the graph version is kept
+        nodes = graph._node
+        for index, node_id in enumerate(node_ids):
+            nodes[node_id] = LazyProperties(
+                nodes[node_id], partial(_page, content, file, index)
+            )
+    return node_ids
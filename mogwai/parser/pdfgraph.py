@@ -1,14 +1,53 @@
 import os
+from functools import lru_cache
+from typing import List, Optional
 
 from mogwai.core import MogwaiGraph
 
 from .filesystem import get_file_stats
+from .page_content import add_page_nodes
+
+
+@lru_cache(maxsize=4)
+def _reader(file: str, mtime: float):
+    from pypdf import PdfReader
+
+    return PdfReader(file)
+
+
+def pdf_reader(file: str):
+    """the reader of the file, shared while the file is not modified"""
+    return _reader(file, os.path.getmtime(file))
+
+
+def pdf_page_texts(file: str, start: int, stop: int) -> List[dict]:
+    """the text of the pages start..stop-1"""
+    pages = pdf_reader(file).pages
+    return [{"text": pages[index].extract_text()} for index in range(start, stop)]
 
 
 class PDFGraph(MogwaiGraph):
     LABEL = "PDFFile"
 
-    def __init__(self, file: str = None, name: str = None, **kwargs):
+    def __init__(
+        self,
+        file: str = None,
+        name: str = None,
+        pages: bool = False,
+        max_pages: Optional[int] = None,
+        lazy: bool = False,
+        workers: int = 1,
+        **kwargs,
+    ):
+        """
+        Args:
+            file: the PDF file
+            name: the name of the file node, the file name by default
+            pages: add a PDFPage node with the text of every page
+            max_pages: add at most this many page nodes
+            lazy: extract the text of a page when the properties of its node are first read
+            workers: extract the text of the pages in a process pool with this many processes
+        """
         super().__init__(**kwargs)
         if file is not None:
             if not os.path.exists(file):
@@ -19,11 +58,11 @@ class PDFGraph(MogwaiGraph):
                 label=PDFGraph.LABEL, name=name, **get_file_stats(self.file)
             )
             self.construct()
+            if pages:
+                self.construct_pages(max_pages, lazy, workers)
 
     def construct(self):
-        from pypdf import PdfReader
-
-        reader = PdfReader(self.file)
+        reader = pdf_reader(self.file)
         meta = reader.metadata
         meta_dict = {
             "producer": meta.producer,
@@ -34,20 +73,48 @@ class PDFGraph(MogwaiGraph):
         self.nodes[self.root].update(
             {"metadata": meta_dict, "number_of_pages": len(reader.pages)}
         )
+        # the page numbers by the object numbers of the pages, looking up
+        # every outline entry with reader.get_page_number is O(pages) in older pypdf
+        page_numbers = {
+            page.indirect_reference.idnum: number
+            for number, page in enumerate(reader.pages, 1)
+        }
         titles = []
-
-        def collect_titles(obj):
-            for child in obj:
-                if isinstance(child, dict):
-                    titles.append(
-                        (child["/Title"], reader.get_page_number(child["/Page"]) + 1)
-                    )
-                else:
-                    collect_titles(child)
-
-        collect_titles(reader.outline)
+        # walk the nested outline lists iteratively, in document order
+        stack = [iter(reader.outline)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            elif isinstance(child, dict):
+                page = child.raw_get("/Page")
+                idnum = page if isinstance(page, int) else getattr(page, "idnum", None)
+                titles.append((child["/Title"], page_numbers.get(idnum)))
+            else:
+                stack.append(iter(child))
         for title in titles:
             node = self.add_labeled_node(
                 label="PDFTitle", name=title[0], page_number=title[1]
             )
             self.add_labeled_edge(self.root, node, "HAS_CONTENT")
+
+    def construct_pages(
+        self, max_pages: Optional[int] = None, lazy: bool = False, workers: int = 1
+    ):
+        count = len(pdf_reader(self.file).pages)
+        if max_pages is not None:
+            count = min(count, max_pages)
+        pages = [
+            (f"page{number}", {"page_number": number}) for number in range(1, count + 1)
+        ]
+        add_page_nodes(
+            self,
+            self.root,
+            "PDFPage",
+            "HAS_PAGE",
+            pages,
+            pdf_page_texts,
+            self.file,
+            lazy=lazy,
+            workers=workers,
+        )
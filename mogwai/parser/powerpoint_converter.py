@@ -1,11 +1,14 @@
 import logging
 import os
+from functools import lru_cache
+from typing import List
 
 from slides.slidewalker import PPT
 
 from mogwai.core import MogwaiGraph
 
 from .filesystem import get_file_stats
+from .page_content import add_page_nodes
 
 logger = logging.getLogger("Mogwai")
 
@@ -22,10 +25,47 @@ def ppt_to_dic(filepath: str):
     return ppt_dic
 
 
+@lru_cache(maxsize=4)
+def _presentation(file: str, mtime: float) -> PPT:
+    ppt = PPT(file)
+    ppt.open()
+    if not ppt.error:
+        ppt.getSlides()
+    return ppt
+
+
+def presentation(file: str) -> PPT:
+    """the opened presentation with its slides, shared while the file is not modified"""
+    return _presentation(file, os.path.getmtime(file))
+
+
+def slide_contents(file: str, start: int, stop: int) -> List[dict]:
+    """the text, notes and notes info of the slides start..stop-1"""
+    contents = []
+    for slide in presentation(file).slides[start:stop]:
+        text, notes = slide.getText(), slide.getNotes()
+        contents.append({"text": text, "notes": notes, "notes_info": slide.notes_info})
+    return contents
+
+
 class PPGraph(MogwaiGraph):
     LABEL = "PPFile"
 
-    def __init__(self, file: str = None, name: str = None, **kwargs):
+    def __init__(
+        self,
+        file: str = None,
+        name: str = None,
+        lazy: bool = False,
+        workers: int = 1,
+        **kwargs,
+    ):
+        """
+        Args:
+            file: the PowerPoint file
+            name: the name of the file node, the file name by default
+            lazy: extract the text and notes of a slide when the properties of its node are first read
+            workers: extract the text and notes in a process pool with this many processes
+        """
         super().__init__(**kwargs)
         if file is not None:
             if not os.path.exists(file):
@@ -35,26 +75,38 @@ class PPGraph(MogwaiGraph):
             self.root = self.add_labeled_node(
                 label=PPGraph.LABEL, name=name, **get_file_stats(self.file)
             )
-            self.construct()
+            self.construct(lazy, workers)
 
-    def construct(self):
-        dic = ppt_to_dic(self.file)
+    def construct(self, lazy: bool = False, workers: int = 1):
+        ppt = presentation(self.file)
+        if ppt.error:
+            logger.error("ppt to json failed")
+            return
         meta_dict = {
-            "titel": dic["title"],
-            "author": dic["author"],
-            "created": dic["created"],
+            "titel": ppt.title,
+            "author": ppt.author,
+            "created": ppt.created,
         }
         self.nodes[self.root].update(
-            {"metadata": meta_dict, "number_of_slides": len(dic["slides"])}
+            {"metadata": meta_dict, "number_of_slides": len(ppt.slides)}
+        )
+        pages = []
+        for slide in ppt.slides:
+            name = slide.name or "page" + str(slide.page)
+            properties = {
+                "page": slide.page,
+                "pdf_page": slide.pdf_page,
+                "title": slide.title,
+            }
+            pages.append((name, properties))
+        add_page_nodes(
+            self,
+            self.root,
+            "PPPage",
+            "HAS_PAGE",
+            pages,
+            slide_contents,
+            self.file,
+            lazy=lazy,
+            workers=workers,
         )
-
-        for slide in dic["slides"]:
-            if "name" in slide:
-                name = slide["name"]
-                if len(name) == 0:
-                    name = "page" + str(slide["page"])
-                del slide["name"]
-            else:
-                name = "page" + str(slide["page"])
-            node = self.add_labeled_node(label="PPPage", name=name, **slide)
-            self.add_labeled_edge(self.root, node, "HAS_PAGE")
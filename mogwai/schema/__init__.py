@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+from mogwai.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .graph_schema import GraphSchema, NodeTypeConfig
+    from .nx_to_rdf import NetworkXToRDFConverter
+
+# imported on first access, the RDF conversion needs rdflib
+_LAZY_ATTRIBUTES = {
+    "GraphSchema": ".graph_schema",
+    "NodeTypeConfig": ".graph_schema",
+    "NetworkXToRDFConverter": ".nx_to_rdf",
+}
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+# `from package import *` imports the lazy attributes
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -0,0 +1,48 @@
+"""
+Created on 2026-10-19
+
+Lazy module attributes (PEP 562), so that importing a package does not
+import all of its modules and their dependencies.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_attributes(
+    module_globals: Dict[str, Any], attributes: Dict[str, Optional[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    the module level `__getattr__` and `__dir__` of a module whose attributes are
+    imported on first access.
+
+    Args:
+        module_globals: the globals of the module, loaded attributes are cached there
+        attributes: maps the attribute names to the modules (relative to the package
+            of the module) they are defined in, "module:name" imports an attribute with
+            a different name and None imports the submodule of the same name
+
+    Returns:
+        the `__getattr__` and `__dir__` functions of the module
+    """
+    module_name, package = module_globals["__name__"], module_globals["__package__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        if source is None:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            source, _, attribute = source.partition(":")
+            value = getattr(importlib.import_module(source, package), attribute or name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(attributes))
+
+    return __getattr__, __dir__
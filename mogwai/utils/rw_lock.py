@@ -0,0 +1,74 @@
+"""
+Created on 2026-10-19
+
+reader/writer lock for sharing a single in-memory graph between sessions
+"""
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    A writer-preferring reader/writer lock.
+
+    Any number of readers may hold the lock at the same time, a writer
+    gets exclusive access. Waiting writers block new readers so that a
+    steady stream of queries can not starve an update.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting > 0:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers > 0:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @property
+    def readers(self) -> int:
+        """the number of readers currently holding the lock"""
+        return self._readers
+
+    @contextmanager
+    def read_locked(self):
+        """context manager holding the lock for reading"""
+        self.acquire_read()
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """context manager holding the lock exclusively"""
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
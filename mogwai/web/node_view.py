@@ -245,10 +245,9 @@ class NodeTableView(BaseNodeView):
             list: A list of dictionaries containing the properties of the matching nodes, with 'id' included.
         """
         lod = []
-        for node_id, node in self.graph.nodes(data=True):
-            labels = node.get("labels", set())
-            if node_label in labels:
-                props = self.editable_properties(node)
-                props["node_id"] = node_id
-                lod.append(props)
+        # the label index avoids scanning all nodes
+        for node_id, node in self.graph.get_nodes(node_label, None):
+            props = self.editable_properties(node)
+            props["node_id"] = node_id
+            lod.append(props)
         return lod
@@ -12,7 +12,10 @@ from ngwidgets.webserver import WebserverConfig
 from mogwai.version import Version
 from nicegui import Client, ui, run
 from mogwai.web.node_view import  NodeTableView, NodeView, NodeViewConfig
+from mogwai.config import WEB_QUERY_MAX_TRAVERSERS, WEB_QUERY_TIMEOUT
 from mogwai.core import MogwaiGraph, Traversal
+from mogwai.core.budget import TraversalBudget
+from mogwai.core.exceptions import QueryError
 from mogwai.examples.schema import MogwaiExampleSchema
 from mogwai.schema.graph_schema import GraphSchema
 from mogwai.graphs import Graphs
@@ -118,6 +121,8 @@ class MogwaiSolution(InputWebSolution):
         self.log=Log()
         self.examples=webserver.examples
         self.graph = webserver.graph
+        # the lock protected handle if self.graph is shared between sessions
+        self.shared_graph = None
         self.schema = webserver.schema
         self.graph_label=None
         self.result_html=None
@@ -218,7 +223,9 @@ class MogwaiSolution(InputWebSolution):
     def update_graph(self,graph_name:str):
         try:
             self.graph_name=graph_name
-            self.graph = self.load_graph(name=graph_name)
+            # example graphs are loaded once and shared read-only by all sessions
+            self.shared_graph = self.examples.get_shared(graph_name)
+            self.graph = self.shared_graph.graph
             self.get_graph_label()
             if self.graph_label:
                 self.graph_label.update()
@@ -273,7 +280,6 @@ class MogwaiSolution(InputWebSolution):
                 graph=self.examples.get(name)
             else:
                 raise ValueError(f"invalid graph name {name}")
-            graph.name=name
         else:
             if file.name.endswith('.graphml'):
                 temp_path = os.path.join(tempfile.gettempdir(), file.name)
@@ -296,6 +302,8 @@ class MogwaiSolution(InputWebSolution):
         file = e.content
         try:
             self.graph=self.load_graph(file)
+            # uploads are private to this session
+            self.shared_graph=None
         except Exception as ex:
             ui.notify(f"Unsupported file: {file.name} {str(ex)}", type="negative")
             return
@@ -303,7 +311,7 @@ class MogwaiSolution(InputWebSolution):
         if self.graph:
             ui.notify("File parsed successfully", type="positive")
 
-    def on_run_query(self, query:str=None):
+    async def on_run_query(self, query:str=None):
         """Run a Gremlin query on the graph"""
         if not self.graph:
             ui.notify("No graph loaded. Please select a graph first.", type="warning")
@@ -311,17 +319,28 @@ class MogwaiSolution(InputWebSolution):
         try:
             if query is None:
                 query=self.query
-            query_result=self.run_query(query)
+            # run in a worker thread so that long queries don't block the event loop
+            # (and thereby the UI of all other users)
+            query_result=await run.io_bound(self.run_query,query)
             self.display_result(query_result)
         except Exception as e:
             ui.notify(f"Error executing query: {str(e)}", type="negative")
 
     def run_query(self,query)->QueryResult:
-        g = Trav.MogwaiGraphTraversalSource(self.graph)
+        # queries are typed in by users, so make sure a careless one can't pin the server
+        budget=TraversalBudget(timeout=WEB_QUERY_TIMEOUT,max_traversers=WEB_QUERY_MAX_TRAVERSERS)
+        g = Trav.MogwaiGraphTraversalSource(self.graph,budget=budget)
         traversal = eval(query, {'g': g})
         if not traversal.terminated:
             traversal=traversal.to_list()
-        result = traversal.run()
+        shared_graph=self.shared_graph
+        if shared_graph is not None and shared_graph.graph is self.graph:
+            # the example graphs are shared by all sessions and must not be changed by one of them
+            if traversal.has_side_effects():
+                raise QueryError("The example graphs are read-only, upload a copy to change it")
+            result = shared_graph.run(traversal)
+        else:
+            result = traversal.run()
         qr=QueryResult(traversal=traversal,result=result)
         return qr
 
@@ -0,0 +1,131 @@
+"""
+Created on 2026-10-19
+
+test the single pass numeric aggregations
+"""
+
+import math
+import random
+import statistics
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.exceptions import GraphTraversalError, QueryError
+from mogwai.core.steps.reducers import Percentile, Sum, Variance
+from mogwai.core.steps.statics import local, values
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class TestAggregation(BaseTest):
+    """
+    compare the aggregation steps with the statistics module
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+        self.ages = [29, 27, 32, 35]
+
+    def test_modern(self):
+        self.assertEqual(123, self.g.V().values("age").sum_().next().run())
+        self.assertEqual(30.75, self.g.V().values("age").mean().next().run())
+        self.assertEqual(35, self.g.V().values("age").max_().next().run())
+        self.assertEqual(27, self.g.V().values("age").min_().next().run())
+        self.assertEqual("vadas", self.g.V().values("name").max_().next().run())
+        self.assertAlmostEqual(
+            statistics.pvariance(self.ages),
+            self.g.V().values("age").variance().next().run(),
+        )
+        self.assertAlmostEqual(
+            statistics.stdev(self.ages),
+            self.g.V().values("age").stddev(sample=True).next().run(),
+        )
+        self.assertEqual(30.5, self.g.V().values("age").percentile(50).next().run())
+        self.assertAlmostEqual(
+            34.1, self.g.V().values("age").percentile(90).next().run()
+        )
+        # no numbers
+        self.assertEqual(
+            [], self.g.V().has("lang").values("age").mean().to_list().run()
+        )
+        self.assertEqual([0], self.g.V().values("weight").sum_().to_list().run())
+        self.assertEqual(
+            [], self.g.V().values("age").limit(1).variance(sample=True).to_list().run()
+        )
+        names = lambda: self.g.V().values("name")
+        for query in [
+            names().sum_(),
+            names().variance(),
+            names().stddev(),
+            names().percentile(50),
+        ]:
+            with self.assertRaises(GraphTraversalError):
+                query.next().run()
+        with self.assertRaises(QueryError):
+            self.g.V().values("age").percentile(101)
+
+    def test_local(self):
+        folded = lambda: self.g.V().values("age").fold()
+        self.assertEqual(27, folded().min_(local).next().run())
+        self.assertEqual(35, folded().max_(local).next().run())
+        self.assertEqual(123, folded().sum_(local).next().run())
+        self.assertEqual(28.5, folded().percentile(25, local).next().run())
+        self.assertEqual(
+            {"Person": statistics.pstdev(self.ages)},
+            self.g.V().group().by("labels").by(values("age").stddev()).next().run(),
+        )
+
+    def test_ties(self):
+        # a single traverser is emitted for tied extremes
+        self.assertEqual([1.0], self.g.E().values("weight").max_().to_list().run())
+        self.assertEqual(
+            [1.0], self.g.E().values("weight").fold().max_(local).to_list().run()
+        )
+
+    def test_reducers(self):
+        rng = random.Random(7)
+        xs = [rng.uniform(-1e10, 1e10) for _ in range(5000)] + [0.1] * 5000
+        rng.shuffle(xs)
+        one, batched = Sum(), Sum()
+        for x in xs:
+            one.add(x)
+        for i in range(0, len(xs), 333):
+            batched.update(xs[i : i + 333])
+        self.assertEqual(math.fsum(xs), one.result())
+        self.assertEqual(math.fsum(xs), batched.result())
+        one, batched = Variance(sample=True), Variance(sample=True)
+        for x in xs:
+            one.add(x)
+        for i in range(0, len(xs), 333):
+            batched.update(xs[i : i + 333])
+        self.assertAlmostEqual(1, one.result() / statistics.variance(xs), places=12)
+        self.assertAlmostEqual(1, batched.result() / statistics.variance(xs), places=12)
+        percentile = Percentile(37)
+        percentile.update(xs)
+        self.assertEqual(
+            statistics.quantiles(xs, n=100, method="inclusive")[36], percentile.result()
+        )
+
+    def test_batches(self):
+        graph = generate_graph(
+            2000,
+            10,
+            vertex_properties=[PropertySpec("x", "float", null_ratio=0.1)],
+            seed=2,
+        )
+        results = []
+        for batch_size in [None, 100]:
+            g = MogwaiGraphTraversalSource(graph, batch_size=batch_size)
+            results.append(
+                [
+                    getattr(g.V().values("x"), step)().next().run()
+                    for step in ["sum_", "mean", "max_", "min_", "variance", "stddev"]
+                ]
+            )
+        xs = [graph.nodes[v]["x"] for v in graph.nodes if "x" in graph.nodes[v]]
+        self.assertEqual(math.fsum(xs), results[0][0])
+        self.assertEqual(results[0][:4], results[1][:4])
+        for a, b in zip(results[0][4:], results[1][4:]):
+            self.assertAlmostEqual(a, b)
+        self.assertAlmostEqual(statistics.pvariance(xs), results[1][4])
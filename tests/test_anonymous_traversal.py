@@ -0,0 +1,56 @@
+"""
+Created on 2026-10-19
+
+test the step templates and compiled plans of anonymous traversals
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.exceptions import QueryError
+from mogwai.core.steps.statics import out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestAnonymousTraversal(BaseTest):
+    """
+    test AnonymousTraversal
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_step_templates(self):
+        anon = out("created").has_label("Software").elementMap()
+        self.assertEqual(2, len(anon._step_templates))
+        self.assertEqual(
+            "out(created) -> has_label(Software) -> element_map", str(anon)
+        )
+        with self.assertRaises(QueryError):
+            out().to_list()
+
+    def test_nested_step_methods(self):
+        """step methods calling other step methods keep their position in the traversal"""
+        uses_lop = out("created").name().is_("lop")
+        for _ in range(2):
+            res = self.g.V().filter_(uses_lop).name().order().to_list().run()
+            self.assertEqual(["josh", "marko", "peter"], res)
+        self.assertEqual(2, len(uses_lop._step_templates))
+
+    def test_reuse(self):
+        """a compiled anonymous traversal is reused by other queries and graphs"""
+        creators = out("created").dedup()
+        query = lambda g: g.V().union(creators).name().to_list()
+        res = sorted(query(self.g).run())
+        # the state of the steps (e.g. the traversers seen by dedup) is reset for every run
+        self.assertEqual(res, sorted(query(self.g).run()))
+        self.assertEqual(["lop", "lop", "lop", "ripple"], res)
+        compiled = creators.query_steps
+        query(self.g).run()
+        self.assertIs(compiled, creators.query_steps)
+        other = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+        self.assertEqual(res, sorted(query(other).run()))
+        self.assertIsNot(compiled, creators.query_steps)
+        # adding a step recompiles the traversal
+        creators.has_name("ripple")
+        self.assertEqual(["ripple"], query(other).run())
@@ -0,0 +1,90 @@
+"""
+Created on 2026-10-19
+
+test the asynchronous traversal API
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.budget import CancellationToken, TraversalBudget
+from mogwai.core.exceptions import TraversalCancelled
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import generate_graph
+from tests.basetest import BaseTest
+
+
+class TestAsync(BaseTest):
+    """
+    test run_async and iter_async
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_run_async(self):
+        async def main():
+            names = self.g.V().has_label("Person").values("name").to_list()
+            count = self.g.V().out().count().next()
+            with ThreadPoolExecutor(2) as executor:
+                return await asyncio.gather(
+                    names.run_async(),
+                    count.run_async(executor),
+                    self.g.V().out().values("name").run_async(),
+                )
+
+        names, count, lazy = asyncio.run(main())
+        self.assertEqual(["marko", "vadas", "josh", "peter"], names)
+        self.assertEqual(6, count)
+        self.assertEqual(6, len(lazy))
+
+    def test_iter_async(self):
+        async def collect(traversal, **kwargs):
+            return [item async for item in traversal.iter_async(**kwargs)]
+
+        query = lambda: self.g.V().has_label("Person").values("name").to_list()
+        expected = query().run()
+        for kwargs in [{}, {"chunk_size": 1}, {"offload": False, "chunk_size": 3}]:
+            self.assertEqual(expected, asyncio.run(collect(query(), **kwargs)))
+        self.assertEqual([6], asyncio.run(collect(self.g.V().out().count().next())))
+
+    def test_cancel(self):
+        graph = generate_graph(2000, 20000)
+        g = MogwaiGraphTraversalSource(graph)
+        slow = lambda: g.V().out().out().out().count().next()
+
+        async def main():
+            task = asyncio.create_task(slow().run_async())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            # leaving an async for early cancels the running traversal as well
+            async for _item in g.V().out().to_list().iter_async(chunk_size=10):
+                break
+
+        asyncio.run(main())
+
+        # the token of a budget still cancels async runs
+        async def cancel_by_token():
+            token = CancellationToken()
+            task = asyncio.create_task(slow().with_budget(token=token).run_async())
+            await asyncio.sleep(0.05)
+            token.cancel()
+            await task
+
+        with self.assertRaises(TraversalCancelled):
+            asyncio.run(cancel_by_token())
+        # the budget of the source is not modified
+        budget = TraversalBudget(max_traversers=10**6)
+        source = MogwaiGraphTraversalSource(graph, budget=budget)
+        asyncio.run(source.V().count().next().run_async())
+        self.assertIsNone(budget.token)
+
+    def test_graphs_get_async(self):
+        graph = asyncio.run(self.examples.get_async("modern"))
+        self.assertIs(graph, self.examples.get("modern"))
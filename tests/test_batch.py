@@ -0,0 +1,97 @@
+"""
+Created on 2026-10-19
+
+test the batch-at-a-time execution of traversals
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.exceptions import TraversalBudgetExceeded
+from mogwai.core.steps.statics import out, values
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.core.traverser import TraverserBatch
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class TestBatch(BaseTest):
+    """
+    compare batch mode with running one traverser at a time
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.modern = MogwaiGraph.modern()
+        self.generated = generate_graph(
+            300,
+            1200,
+            vertex_labels=["Person", "Software"],
+            vertex_properties=[PropertySpec("age", low=0, high=50)],
+        )
+
+    def check_same(self, graph: MogwaiGraph, query, batch_size: int = 3):
+        expected = query(MogwaiGraphTraversalSource(graph)).run()
+        result = query(MogwaiGraphTraversalSource(graph, batch_size=batch_size)).run()
+        if self.debug:
+            print(result)
+        self.assertEqual(expected, result)
+        return result
+
+    def test_same_results(self):
+        queries = [
+            lambda g: g.V().out().out().count().next(),
+            lambda g: g.V().has_label("Person").out().values("name").to_list(),
+            lambda g: g.V().in_().dedup().count().next(),
+            lambda g: g.V().outE().inV().values("name").dedup().to_list(),
+            lambda g: g.V()
+            .has_label("Person")
+            .has("age", lambda a: a > 28)
+            .values("age")
+            .to_list(),
+            lambda g: g.V().out().order(by="name", desc=True).values("name").to_list(),
+            lambda g: g.V().out().path(by="name").to_list(),
+            lambda g: g.V().as_("a").out().select("a", by="name").to_list(),
+            lambda g: g.V().filter_(out().values("age")).values("name").to_list(),
+            lambda g: g.E().has("weight").values("weight").max_().next(),
+        ]
+        for query in queries:
+            self.check_same(self.modern, query)
+        self.assertEqual(
+            ["vadas", "ripple", "peter", "marko", "lop"],
+            self.check_same(
+                self.modern,
+                lambda g: g.V()
+                .order(by="name", desc=True)
+                .limit(5)
+                .values("name")
+                .to_list(),
+            ),
+        )
+
+    def test_same_results_generated(self):
+        queries = [
+            lambda g: g.V().out().in_().count().next(),
+            lambda g: g.V().has_label("Person").out().dedup().count().next(),
+            lambda g: g.V().out().order(by="age").values("age").to_list(),
+            lambda g: g.V().out().out().dedup().values("name").to_list(),
+        ]
+        for query in queries:
+            for batch_size in [1, 17, 1024]:
+                self.check_same(self.generated, query, batch_size)
+
+    def test_traverser_batches(self):
+        g = MogwaiGraphTraversalSource(self.modern)
+        query = g.V().out().with_batch_size(2)
+        query._prepare()
+        batches = list(
+            query.query_steps[1].batches(query.query_steps[0].batches([], 2))
+        )
+        self.assertTrue(all(isinstance(batch, TraverserBatch) for batch in batches))
+        self.assertEqual(6, sum(len(batch) for batch in batches))
+        ids = sorted(t.get for t in g.V().out().with_batch_size(2).run())
+        self.assertEqual(sorted(t.get for t in g.V().out().run()), ids)
+        self.assertIn("Out [barrier, batch]", str(g.V().out().to_list().explain()))
+
+    def test_budget(self):
+        g = MogwaiGraphTraversalSource(self.generated, batch_size=64)
+        with self.assertRaises(TraversalBudgetExceeded):
+            g.V().out().out().to_list().with_budget(max_traversers=500).run()
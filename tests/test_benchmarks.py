@@ -0,0 +1,71 @@
+"""
+Created on 2026-10-19
+
+test the offline benchmark suite
+"""
+
+import json
+
+from benchmarks import memory
+from benchmarks.importtime import IMPORT_BUDGETS, check, measure
+from benchmarks.suite import BenchmarkRunner, compare
+from tests.basetest import BaseTest
+
+
+class TestBenchmarks(BaseTest):
+    """
+    run the benchmarks on tiny graphs
+    """
+
+    def test_benchmarks(self):
+        runner = BenchmarkRunner(graphs=["modern", "scale-free"], size=50, repeat=1)
+        report = runner.to_json(runner.run())
+        # the report must be serializable for tracking across commits
+        report = json.loads(json.dumps(report))
+        if self.debug:
+            print(json.dumps(report["meta"], indent=2))
+        results = {(r["graph"], r["name"]): r for r in report["results"]}
+        self.assertEqual(1, results[("modern", "scan_label")]["result_size"])
+        self.assertEqual(6, results[("modern", "order_limit")]["result_size"])
+        self.assertEqual(12, results[("modern", "load")]["result_size"])
+        self.assertIn(("scale-free", "two_hop"), results)
+        self.assertEqual(50, report["meta"]["size"])
+        self.assertEqual([], compare(report, report))
+
+    def test_select(self):
+        runner = BenchmarkRunner(graphs=["crew"], repeat=1, select="hop")
+        names = [r.name for r in runner.run()]
+        self.assertEqual(["two_hop", "three_hop"], names)
+
+    def test_importtime(self):
+        """the lazily imported modules are not imported, the time budgets are not checked here"""
+        for statement, (_budget, forbidden) in IMPORT_BUDGETS.items():
+            result = measure(statement, repeat=1)
+            if self.debug:
+                print(f"{statement}: {result.seconds * 1000:.1f} ms")
+            self.assertEqual([], check(result, float("inf"), forbidden))
+            self.assertGreater(result.seconds, 0)
+
+    def test_star_imports(self):
+        """star imports of the lazy packages give their exports"""
+        expected = {
+            "mogwai.core": {"MogwaiGraph", "Traversal", "Traverser"},
+            "mogwai.parser": {"FileSystemGraph", "PDFGraph", "graphml_to_mogwaigraph"},
+            "mogwai.schema": {"GraphSchema", "NodeTypeConfig"},
+        }
+        for package, names in expected.items():
+            namespace = {}
+            exec(f"from {package} import *", namespace)
+            self.assertTrue(names <= namespace.keys(), package)
+            self.assertNotIn("lazy_attributes", namespace)
+
+    def test_memory(self):
+        results = {
+            (r.graph, r.config): r
+            for r in memory.run(["air-routes-small", "scale-free"], size=50)
+        }
+        default = results[("air-routes-small", "default")]
+        interned = results[("air-routes-small", "interned")]
+        self.assertEqual(default.vertices, interned.vertices)
+        self.assertLess(interned.bytes_per_vertex, default.bytes_per_vertex)
+        self.assertGreater(results[("scale-free", "int-ids")].bytes_per_edge, 0)
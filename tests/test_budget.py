@@ -0,0 +1,83 @@
+"""
+Created on 2026-10-19
+
+tests for traversal budgets, timeouts and cancellation
+"""
+
+import time
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.budget import CancellationToken, TraversalBudget
+from mogwai.core.exceptions import (
+    TraversalBudgetExceeded,
+    TraversalCancelled,
+    TraversalTimeout,
+)
+from mogwai.core.steps.statics import both, out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestBudget(BaseTest):
+    """
+    test resource budgets for traversals
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_within_budget(self):
+        query = self.g.V().both().both().count().next()
+        query.with_budget(timeout=10, max_traversers=1000)
+        self.assertEqual(30, query.run())
+
+    def test_max_traversers(self):
+        query = self.g.V().both().both().both().path().to_list()
+        query.with_budget(max_traversers=20)
+        with self.assertRaises(TraversalBudgetExceeded) as ctx:
+            query.run()
+        stats = ctx.exception.stats
+        print(stats)
+        self.assertEqual(21, stats["traversers"])
+        self.assertIsNotNone(stats["step"])
+
+    def test_max_traversers_in_anonymous_traversal(self):
+        query = self.g.V().filter_(both().both().both()).to_list()
+        query.with_budget(max_traversers=30)
+        with self.assertRaises(TraversalBudgetExceeded):
+            query.run()
+
+    def test_max_path_length(self):
+        query = self.g.V().repeat(both(), times=4).path().to_list()
+        query.with_budget(max_path_length=3)
+        with self.assertRaises(TraversalBudgetExceeded) as ctx:
+            query.run()
+        self.assertEqual(4, ctx.exception.stats["longest_path"])
+
+    def test_timeout(self):
+        query = self.g.V().side_effect(lambda t: time.sleep(0.02)).out().to_list()
+        query.with_budget(timeout=0.05)
+        with self.assertRaises(TraversalTimeout) as ctx:
+            query.run()
+        self.assertGreater(ctx.exception.stats["elapsed"], 0.05)
+
+    def test_cancel(self):
+        token = CancellationToken()
+        token.cancel()
+        query = self.g.V().out().to_list().with_budget(token=token)
+        with self.assertRaises(TraversalCancelled):
+            query.run()
+
+    def test_source_budget(self):
+        g = MogwaiGraphTraversalSource(
+            self.g.connector, budget=TraversalBudget(max_traversers=5)
+        )
+        with self.assertRaises(TraversalBudgetExceeded):
+            g.V().to_list().run()
+        # eager traversals should report the budget error as well
+        g = MogwaiGraphTraversalSource(
+            self.g.connector, eager=True, budget=TraversalBudget(max_traversers=5)
+        )
+        with self.assertRaises(TraversalBudgetExceeded):
+            g.V().filter_(out()).to_list().run()
@@ -0,0 +1,126 @@
+"""
+Created on 2026-10-19
+
+test the vertex programs of the graph computer
+"""
+
+import networkx
+import numpy as np
+from networkx.algorithms.link_analysis.pagerank_alg import _pagerank_python
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.computer import VertexProgram
+from mogwai.core.exceptions import QueryError
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class MaxNeighborAge(VertexProgram):
+    """the highest age among a vertex and its in-neighbors"""
+
+    combiner = np.maximum
+    max_iterations = 1
+
+    def initial(self, graph):
+        return np.array([graph.graph.nodes[v].get("age", 0) for v in graph.ids])
+
+    def apply(self, graph, state, gathered, superstep):
+        return np.maximum(state, gathered)
+
+
+class TestComputer(BaseTest):
+    """
+    compare the vertex programs with networkx
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.graph = generate_graph(
+            500,
+            1500,
+            edge_labels=2,
+            edge_properties=[PropertySpec("dist", low=1, high=100)],
+            seed=5,
+        )
+        self.g = MogwaiGraphTraversalSource(self.graph)
+
+    def assertClose(self, expected: dict, result, places=9):
+        self.assertEqual(len(expected), len(result))
+        for v, value in expected.items():
+            self.assertAlmostEqual(value, result[v], places=places)
+
+    def test_page_rank(self):
+        result = self.g.compute().page_rank()
+        self.assertTrue(result.converged)
+        self.assertClose(_pagerank_python(self.graph), result)
+        weighted = self.g.compute().page_rank(weight="dist")
+        self.assertClose(_pagerank_python(self.graph, weight="dist"), weighted)
+        self.assertEqual(
+            [v for v, _ in result.top(5)],
+            sorted(self.graph.nodes, key=lambda v: -result[v])[:5],
+        )
+        # the supersteps split over a process pool give the same ranks
+        parallel = self.g.compute(workers=2).page_rank()
+        self.assertEqual(result.values.tolist(), parallel.values.tolist())
+
+    def test_components(self):
+        result = self.g.compute().connected_components()
+        components = list(networkx.weakly_connected_components(self.graph))
+        self.assertEqual(len(components), result.values.max() + 1)
+        for component in components:
+            self.assertEqual(1, len({result[v] for v in component}))
+        # only the edges with the given label
+        labelled = self.g.compute(label="edge0").connected_components()
+        view = networkx.subgraph_view(
+            self.graph,
+            filter_edge=lambda u, v: self.graph.edges[u, v]["labels"] == "edge0",
+        )
+        self.assertEqual(
+            networkx.number_weakly_connected_components(view),
+            labelled.values.max() + 1,
+        )
+
+    def test_label_propagation(self):
+        # two cliques joined by a single edge
+        graph = MogwaiGraph()
+        graph.add_nodes_from(range(10))
+        for clique in [range(0, 5), range(5, 10)]:
+            for u in clique:
+                for v in clique:
+                    if u < v:
+                        graph.add_edge(u, v, labels="link")
+        graph.add_edge(4, 5, labels="link")
+        result = MogwaiGraphTraversalSource(graph).compute().label_propagation()
+        self.assertTrue(result.converged)
+        self.assertEqual([0] * 5 + [1] * 5, [result[v] for v in range(10)])
+        parallel = MogwaiGraphTraversalSource(graph).compute(workers=2)
+        self.assertEqual(
+            result.values.tolist(), parallel.label_propagation().values.tolist()
+        )
+
+    def test_degree_centrality_and_write(self):
+        computer = self.g.compute()
+        self.assertClose(
+            networkx.degree_centrality(self.graph), computer.degree_centrality()
+        )
+        self.assertClose(
+            networkx.out_degree_centrality(self.graph),
+            computer.degree_centrality("out"),
+        )
+        version = self.graph.version
+        computer.page_rank(write="pagerank")
+        self.assertGreater(self.graph.version, version)
+        top = self.g.V().order(by="pagerank", desc=True).limit(3).id_().to_list().run()
+        self.assertEqual([v for v, _ in computer.page_rank().top(3)], top)
+        # the labels and names are not overwritten
+        for field in ["labels", "name"]:
+            with self.assertRaises(QueryError):
+                computer.page_rank(write=field)
+
+    def test_custom_program(self):
+        modern = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+        result = modern.compute().run(MaxNeighborAge())
+        self.assertEqual(
+            {"0": 29, "1": 29, "2": 35, "3": 32, "4": 32, "5": 35}, result.to_dict()
+        )
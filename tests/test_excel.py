@@ -1,4 +1,8 @@
 import os
+import tempfile
+from datetime import datetime
+
+from openpyxl import Workbook
 
 from mogwai.parser.excel_converter import EXCELGraph
 from tests.basetest import BaseTest
@@ -20,3 +24,46 @@ class TestExcel(BaseTest):
             "Wrong column element",
         )
         graph.draw(os.path.join(self.root_path, "tests", "excel_test.svg"), prog="dot")
+
+    def test_excel_rows(self):
+        """
+        test the rows mode with typed cells and a foreign key column
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shop.xlsx")
+            workbook = Workbook()
+            customers = workbook.active
+            customers.title = "customers"
+            customers.append(["id", "name", "since"])
+            customers.append([1, "Gimli", datetime(2024, 5, 15)])
+            customers.append([2, "Legolas", None])
+            orders = workbook.create_sheet("orders")
+            orders.append(["order", "customer", "total"])
+            for order, customer, total in [(10, 1, 9.5), (11, 2, 3), (12, 1, 7.25)]:
+                orders.append([order, customer, total])
+            orders.append([None, None, None])
+            workbook.save(path)
+            graph = EXCELGraph(
+                path, rows=True, foreign_keys={"orders.customer": "customers.id"}
+            )
+        ((gimli, data),) = graph.get_nodes("customers", "Gimli")
+        self.assertEqual(
+            {"id": 1, "since": datetime(2024, 5, 15)},
+            {k: data[k] for k in ("id", "since")},
+        )
+        self.assertNotIn("since", graph.get_nodes("customers", "Legolas")[0][1])
+        order_rows = graph.get_nodes("orders", None)
+        self.assertEqual([9.5, 3, 7.25], [data["total"] for _, data in order_rows])
+        self.assertEqual(3, len(graph.get_nodes("EXCELRow", None)) - 2)
+        ((sheet, sheet_data),) = graph.get_nodes("EXCELSheet", "orders")
+        self.assertEqual(["order", "customer", "total"], sheet_data["columns"])
+        self.assertEqual(3, sheet_data["number_of_rows"])
+        self.assertEqual(3, len(list(graph.successors(sheet))))
+        self.assertEqual(
+            ["orders!0", "orders!2"],
+            sorted(
+                graph.nodes[src]["name"]
+                for src, _, label in graph.in_edges(gimli, data="labels")
+                if label == "customer"
+            ),
+        )
@@ -0,0 +1,79 @@
+"""
+Created on 2026-10-19
+
+tests for explain() and the query optimizer
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.explain import TraversalExplanation
+from mogwai.core.steps.statics import both, out, simple_path, values
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestExplain(BaseTest):
+    """
+    test the plan output of traversals
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_explain(self):
+        plan = self.g.V().has_label("Person").out().values("name").to_list().explain()
+        print(plan)
+        self.assertIsInstance(plan, TraversalExplanation)
+        # has_label is answered by the label index of the graph
+        self.assertEqual(
+            ["V(all_of=['Person'])", "Out", "Values", "ToList"],
+            [s.name for s in plan.steps],
+        )
+        self.assertEqual([True, True, False, False], [s.barrier for s in plan.steps])
+        self.assertEqual(["labels"], plan.steps[0].indexes)
+        self.assertFalse(plan.needs_path)
+        self.assertEqual(["HasLabelToLabelScan"], plan.rewrites)
+
+    def test_explain_nested(self):
+        plan = (
+            self.g.V()
+            .repeat(both().simple_path(), times=2)
+            .filter_(out().values("age"))
+            .path()
+            .to_list()
+            .explain()
+        )
+        print(plan)
+        self.assertTrue(plan.needs_path)
+        repeat = plan.steps[1]
+        self.assertFalse(repeat.barrier)
+        self.assertTrue(repeat.needs_path)
+        self.assertEqual(["Both", "SimplePath"], [c.name for c in repeat.children])
+        self.assertTrue(repeat.children[1].needs_path)
+        depths = [depth for depth, _ in plan.flatten()]
+        self.assertEqual([0, 0, 1, 1, 0, 1, 1, 0, 0], depths)
+        self.assertIn("  SimplePath [streaming, needs path]", str(plan))
+        self.assertEqual(5, len(plan.to_dict()["steps"]))
+
+    def test_rewrites(self):
+        query = self.g.V().limit(4).limit(2).to_list()
+        plan = query.explain()
+        print(plan)
+        self.assertEqual(["MergeLimits"], plan.rewrites)
+        self.assertEqual("V -> Range -> Range -> ToList", plan.original)
+        self.assertEqual("V -> Range -> ToList", plan.optimized)
+        self.assertEqual(2, len(query.run()))
+
+        query = self.g.V().order(by="name").count().next()
+        plan = query.explain()
+        self.assertEqual(["RemoveOrderBeforeCount"], plan.rewrites)
+        self.assertEqual(6, query.run())
+
+        plan = self.g.V().filter_(out().limit(3).limit(1)).to_list().explain()
+        self.assertEqual(["MergeLimits"], plan.rewrites)
+
+    def test_no_optimization(self):
+        g = MogwaiGraphTraversalSource(self.g.connector, optimize=False)
+        plan = g.V().limit(4).limit(2).to_list().explain()
+        self.assertEqual([], plan.rewrites)
+        self.assertEqual(plan.original, plan.optimized)
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 
 from mogwai.parser.filesystem import FileSystemGraph as FSG
 
@@ -38,3 +40,52 @@ class TestFileSystem(BaseTest):
             self.file_system.draw(
                 os.path.join(self.root_path, "tests", "filesystem_test.svg"), prog="dot"
             )
+
+    def test_incremental_crawl(self):
+        """
+        test that a re-crawl only unfolds changed documents and removes vanished files
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            docs = os.path.join(tmp, "docs")
+            os.makedirs(os.path.join(docs, "slides"))
+            documents = os.path.join(self.root_path, "tests", "documents")
+            shutil.copy(os.path.join(documents, "lorem.pdf"), docs)
+            shutil.copy(os.path.join(documents, "test_excel.xlsx"), docs)
+            shutil.copy(
+                os.path.join(documents, "test_pp1.pptx"), os.path.join(docs, "slides")
+            )
+            notes = os.path.join(docs, "notes.txt")
+            with open(notes, "w") as file:
+                file.write("first")
+            reports = []
+            fs = FSG(docs, workers=2, progress=reports.append)
+            stats = reports[-1]
+            self.assertEqual(
+                (2, 4, 3, 3),
+                (stats.directories, stats.files, stats.to_parse, stats.parsed),
+            )
+            # the progress is reported after the scan and for every unfolded document
+            self.assertEqual(4, len(reports))
+            nodes = fs.number_of_nodes()
+            self.assertEqual(1, len(fs.get_nodes("PDFFile", "lorem.pdf")))
+            # nothing changed
+            stats = fs.crawl()
+            self.assertEqual((4, 0, 0), (stats.unchanged, stats.parsed, stats.removed))
+            self.assertEqual(nodes, fs.number_of_nodes())
+            # a changed and a vanished file survive saving and loading the graph
+            state = os.path.join(tmp, "fs.pickle")
+            fs.save(state)
+            fs = FSG.load(state)
+            with open(notes, "w") as file:
+                file.write("second version")
+            os.remove(os.path.join(docs, "test_excel.xlsx"))
+            stats = fs.crawl()
+            self.assertEqual((2, 0, 2), (stats.unchanged, stats.parsed, stats.removed))
+            self.assertEqual([], fs.get_nodes("EXCELFile", None))
+            self.assertEqual([], fs.get_nodes("EXCELSheet", None))
+            ((_, data),) = fs.get_nodes("File", "notes.txt")
+            self.assertEqual(len("second version"), data["filesize"])
+            self.assertEqual(
+                [".", "lorem.pdf", "notes.txt", "slides", "slides/test_pp1.pptx"],
+                sorted(os.path.relpath(path, docs) for path in fs.manifest),
+            )
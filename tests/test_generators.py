@@ -0,0 +1,135 @@
+"""
+Created on 2026-10-19
+
+test the synthetic graph generators
+"""
+
+import json
+import os
+import tempfile
+
+from mogwai.core import MogwaiGraphConfig
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import GraphGenerator, PropertySpec, generate_graph
+from mogwai.parser.graphml_converter import graphml_to_mogwaigraph
+from tests.basetest import BaseTest
+
+
+class TestGenerators(BaseTest):
+    """
+    test GraphGenerator
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.specs = [
+            PropertySpec("age", low=18, high=99),
+            PropertySpec("score", "float", distribution="normal"),
+            PropertySpec("city", "str", cardinality=5, null_ratio=0.5),
+            PropertySpec("active", "bool"),
+        ]
+
+    def test_counts_and_determinism(self):
+        generator = GraphGenerator(500, 2000, vertex_properties=self.specs, seed=7)
+        graph = generator.generate()
+        self.assertEqual(500, graph.number_of_nodes())
+        self.assertEqual(2000, graph.number_of_edges())
+        self.assertEqual(0, sum(1 for u, v in graph.edges if u == v))
+        same = GraphGenerator(500, 2000, vertex_properties=self.specs, seed=7)
+        self.assertEqual(list(generator.edges()), list(same.edges()))
+        self.assertEqual(list(generator.vertices()), list(same.vertices()))
+        other = GraphGenerator(500, 2000, seed=8)
+        self.assertNotEqual(list(generator.edges()), list(other.edges()))
+
+    def test_properties_and_labels(self):
+        graph = generate_graph(
+            1000,
+            1000,
+            vertex_labels=["Person", "Place"],
+            edge_labels=4,
+            vertex_properties=self.specs,
+        )
+        g = MogwaiGraphTraversalSource(graph)
+        self.assertEqual({"Person", "Place"}, set(g.V().label().to_list().run()))
+        self.assertEqual(4, len(set(g.E().label().to_list().run())))
+        ages = g.V().values("age").to_list().run()
+        self.assertEqual(1000, len(ages))
+        self.assertTrue(all(isinstance(a, int) and 18 <= a <= 99 for a in ages))
+        cities = set(g.V().values("city").to_list().run())
+        self.assertTrue(cities <= {f"city{i}" for i in range(5)})
+        with_city = len(g.V().values("city").to_list().run())
+        self.assertTrue(300 < with_city < 700, with_city)
+
+    def test_degree_distribution(self):
+        power_law = generate_graph(2000, 10000, degree_distribution="power-law")
+        uniform = generate_graph(2000, 10000, degree_distribution="uniform")
+        max_power = max(d for _, d in power_law.in_degree())
+        max_uniform = max(d for _, d in uniform.in_degree())
+        if self.debug:
+            print(f"max in degree power-law {max_power} uniform {max_uniform}")
+        self.assertGreater(max_power, 5 * max_uniform)
+        # a complete graph can be generated as well
+        self.assertEqual(20, generate_graph(5, 20).number_of_edges())
+        with self.assertRaises(ValueError):
+            generate_graph(5, 21)
+
+    def test_indexed_bulk_load(self):
+        graph = generate_graph(
+            50, 100, config=MogwaiGraphConfig(index_config="minimal")
+        )
+        lookup = graph.spog_index.get_lookup("P", "S")
+        self.assertEqual(100, graph.number_of_edges())
+        self.assertEqual(50, len(lookup["label"]))
+
+    def test_add_after_generate(self):
+        for config, first in [
+            (MogwaiGraphConfig(), "0"),
+            (MogwaiGraphConfig(int_ids=True), 0),
+        ]:
+            graph = GraphGenerator(10, 20, seed=1).generate(config)
+            self.assertEqual({type(first)}, {type(node) for node in graph.nodes})
+            data = dict(graph.nodes[first])
+            node = graph.add_labeled_node("New", "new")
+            self.assertEqual(11, graph.number_of_nodes())
+            self.assertNotIn(node, range(10) if config.int_ids else map(str, range(10)))
+            self.assertEqual(data, graph.nodes[first])
+
+    def test_streaming(self):
+        generator = GraphGenerator(
+            200,
+            600,
+            vertex_properties=self.specs,
+            edge_properties=[PropertySpec("weight", "float")],
+            edge_labels=["knows", "likes"],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graphml = os.path.join(tmpdir, "synthetic.graphml")
+            generator.write_graphml(graphml)
+            graph = graphml_to_mogwaigraph(
+                graphml,
+                node_label_key="labelV",
+                node_name_key="name",
+                edge_label_key="labelE",
+                keep=False,
+            )
+            self.assertEqual(200, graph.number_of_nodes())
+            self.assertEqual(600, graph.number_of_edges())
+            expected = generator.generate()
+            self.assertEqual(
+                expected.nodes["0"]["age"], graph.nodes[graph_id(graph, "v0")]["age"]
+            )
+            graphson = os.path.join(tmpdir, "synthetic.json")
+            generator.write_graphson(graphson)
+            with open(graphson) as f:
+                records = [json.loads(line) for line in f]
+            self.assertEqual(200, len(records))
+            out_edges = sum(
+                len(edges)
+                for record in records
+                for edges in record.get("outE", {}).values()
+            )
+            self.assertEqual(600, out_edges)
+
+
+def graph_id(graph, name: str):
+    return next(n for n, data in graph.nodes(data=True) if data["name"] == name)
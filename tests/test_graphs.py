@@ -0,0 +1,95 @@
+"""
+Created on 2026-10-19
+
+tests for sharing graphs between sessions
+"""
+
+import threading
+import time
+
+from mogwai.core.steps.statics import out
+from mogwai.graphs import Graphs
+from mogwai.utils.rw_lock import ReadWriteLock
+from tests.basetest import BaseTest
+
+
+class TestGraphs(BaseTest):
+    """
+    test concurrent access to the example graphs
+    """
+
+    def test_single_flight_load(self):
+        """
+        concurrent requests for the same uncached graph should load it only once
+        """
+        graphs = Graphs(lazy=True)
+        load = graphs._load
+        calls = []
+
+        def slow_load(name):
+            calls.append(name)
+            time.sleep(0.05)
+            return load(name)
+
+        graphs._load = slow_load
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(graphs.get("modern")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(["modern"], calls)
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(graph is results[0] for graph in results))
+        self.assertEqual("modern", results[0].name)
+
+    def test_shared_graph(self):
+        """
+        test querying a shared graph handle
+        """
+        graphs = Graphs(lazy=True)
+        shared = graphs.get_shared("modern")
+        self.assertIs(shared, graphs.get_shared("modern"))
+        g = shared.traversal_source()
+        res = shared.run(g.V().has_label("Person").count().next())
+        self.assertEqual(4, res)
+        shared.update(lambda graph: graph.add_labeled_node("Person", name="jane"))
+        res = shared.run(g.V().has_label("Person").count().next())
+        self.assertEqual(5, res)
+        # traversals that change the graph take the write lock
+        readers = []
+        query = (
+            g.V()
+            .has_label("Person")
+            .side_effect(lambda t: readers.append(shared.lock.readers))
+        )
+        self.assertFalse(g.V().has_label("Person").to_list().has_side_effects())
+        self.assertTrue(query.has_side_effects())
+        self.assertTrue(g.V().filter_(out().property("age", 1)).has_side_effects())
+        shared.run(query.to_list())
+        self.assertEqual([0] * 5, readers)
+
+    def test_read_write_lock(self):
+        """
+        readers share the lock, a writer waits for them
+        """
+        lock = ReadWriteLock()
+        events = []
+        with lock.read_locked():
+            with lock.read_locked():
+                self.assertEqual(2, lock.readers)
+
+                def write():
+                    with lock.write_locked():
+                        events.append("write")
+
+                writer = threading.Thread(target=write)
+                writer.start()
+                time.sleep(0.05)
+                events.append("read")
+        writer.join()
+        self.assertEqual(["read", "write"], events)
+        self.assertEqual(0, lock.readers)
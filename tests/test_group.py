@@ -0,0 +1,106 @@
+"""
+Created on 2026-10-19
+
+test the group and group_count steps
+"""
+
+from collections import Counter
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.exceptions import QueryError
+from mogwai.core.steps.statics import count, local, out, values
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class TestGroup(BaseTest):
+    """
+    test grouping traversers
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_group(self):
+        self.assertEqual(
+            {"Person": ["0", "1", "3", "5"], "Software": ["2", "4"]},
+            self.g.V().group().by("labels").next().run(),
+        )
+        self.assertEqual(
+            {
+                "Person": ["marko", "vadas", "josh", "peter"],
+                "Software": ["lop", "ripple"],
+            },
+            self.g.V().group().by("labels").by("name").next().run(),
+        )
+        self.assertEqual(
+            {"Person": 4, "Software": 2},
+            self.g.V().group().by("labels").by(count()).next().run(),
+        )
+        # groups without a result of the reducing traversal are left out
+        self.assertEqual(
+            {"Person": 30.75},
+            self.g.V().group().by("labels").by(values("age").mean()).next().run(),
+        )
+        self.assertEqual(
+            {3: ["marko"], 0: ["vadas", "lop", "ripple"], 2: ["josh"], 1: ["peter"]},
+            self.g.V().group().by(out().count()).by("name").next().run(),
+        )
+        self.assertEqual(
+            {"knows": [0.5, 1.0], "created": [0.4, 1.0, 0.4, 0.2]},
+            self.g.E().group().by("labels").by("weight").next().run(),
+        )
+        self.assertEqual(
+            {29: 1, 27: 1, 32: 1, 35: 1},
+            self.g.V().values("age").group_count().next().run(),
+        )
+        with self.assertRaises(QueryError):
+            self.g.V().group().by("labels").by("name").by("age").next().run()
+
+    def test_group_count(self):
+        self.assertEqual(
+            {"Person": 4, "Software": 2},
+            self.g.V().group_count().by("labels").next().run(),
+        )
+        # vertices without the property are not counted
+        self.assertEqual({"java": 2}, self.g.V().groupCount().by("lang").next().run())
+        self.assertEqual(
+            {"1": 1, "3": 1, "2": 3, "4": 1},
+            self.g.V().out().group_count().next().run(),
+        )
+        self.assertEqual(
+            {"vadas": 1, "josh": 1, "lop": 3, "ripple": 1},
+            self.g.V().out().values("name").fold().group_count(local).next().run(),
+        )
+        self.assertEqual(
+            [{"lop": 1, "vadas": 1, "josh": 1}, {}],
+            self.g.V()
+            .local(out().values("name").fold())
+            .group_count(local)
+            .to_list()
+            .run()[:2],
+        )
+
+    def test_batches(self):
+        graph = generate_graph(
+            300,
+            1200,
+            vertex_properties=[PropertySpec("country", "str", cardinality=10)],
+            seed=3,
+        )
+        expected = Counter(
+            graph.nodes[v]["country"]
+            for _, v in graph.edges
+            if "country" in graph.nodes[v]
+        )
+        for batch_size in [None, 64]:
+            g = MogwaiGraphTraversalSource(graph, batch_size=batch_size)
+            self.assertEqual(
+                dict(expected), g.V().out().group_count().by("country").next().run()
+            )
+            self.assertEqual(
+                dict(expected),
+                g.V().out().group().by("country").by(count()).next().run(),
+            )
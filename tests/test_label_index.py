@@ -0,0 +1,93 @@
+"""
+Created on 2026-10-19
+
+test the label index of MogwaiGraph
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.label_index import LabelIndex
+from mogwai.core.steps.statics import has_label
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestLabelIndex(BaseTest):
+    """
+    test LabelIndex and its use by MogwaiGraph and the has_label step
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.graph = MogwaiGraph()
+        for name, labels in [
+            ("Gimli", {"Character", "Dwarf"}),
+            ("Aragorn", {"Character", "Man"}),
+            ("Legolas", {"Character", "Elf"}),
+            ("Moria", "Place"),
+            ("Gloin", {"Character", "Dwarf"}),
+        ]:
+            self.graph.add_labeled_node(labels, name)
+
+    def names(self, node_ids):
+        return [self.graph.nodes[n]["name"] for n in node_ids]
+
+    def test_set_operations(self):
+        index = self.graph.label_index
+        self.assertEqual(["Gimli", "Gloin"], self.names(index.nodes(["Dwarf"])))
+        self.assertEqual(
+            ["Gimli", "Legolas", "Gloin"],
+            self.names(index.nodes(all_of=["Character"], any_of=["Dwarf", "Elf"])),
+        )
+        self.assertEqual(
+            ["Aragorn", "Moria"], self.names(index.nodes(none_of=["Dwarf", "Elf"]))
+        )
+        self.assertEqual([], index.nodes(all_of=["Dwarf", "Elf"]))
+        self.assertEqual([], index.nodes(all_of=["Hobbit"]))
+
+    def test_maintenance(self):
+        graph = self.graph
+        index = graph.label_index
+        frodo = graph.add_labeled_node({"Character", "Hobbit"}, "Frodo")
+        graph.remove_node("0")
+        graph.add_labeled_edge("1", frodo, "knows")
+        # the index was kept up to date instead of being rebuilt
+        self.assertIs(index, graph.label_index)
+        self.assertEqual(["Gloin"], self.names(index.nodes(["Dwarf"])))
+        self.assertEqual(["Frodo"], self.names(index.nodes(["Hobbit"])))
+        # changing a node directly makes the index rebuild
+        graph.nodes[frodo]["labels"] = {"Character", "Ringbearer"}
+        graph.bump_version()
+        self.assertEqual(["Frodo"], self.names(graph.label_index.nodes(["Ringbearer"])))
+        rebuilt = LabelIndex.of(graph.nodes(data=True), "labels")
+        for label in ["Character", "Dwarf", "Hobbit", "Place"]:
+            self.assertEqual(rebuilt.nodes([label]), graph.label_index.nodes([label]))
+        graph.clear()
+        self.assertEqual([], graph.label_index.nodes(["Character"]))
+
+    def test_get_nodes(self):
+        self.assertEqual(
+            ["Gimli"],
+            [data["name"] for _, data in self.graph.get_nodes("Dwarf", "Gimli")],
+        )
+        self.assertEqual(2, len(self.graph.get_nodes("Dwarf", None)))
+        self.assertEqual(
+            ["1"], [n for n, _ in self.graph._get_nodes_set({"Character", "Man"}, None)]
+        )
+
+    def test_has_label(self):
+        graph = MogwaiGraph.modern()
+        g = MogwaiGraphTraversalSource(graph)
+        unoptimized = MogwaiGraphTraversalSource(graph, optimize=False)
+        for query in [
+            lambda g: g.V().has_label("Person").values("name"),
+            lambda g: g.V().has_label("Person").has_label({"Person"}).values("name"),
+            lambda g: g.V().not_(has_label("Person")).values("name"),
+            lambda g: g.V().has_label("Software").out().values("name"),
+        ]:
+            traversal = query(g).to_list()
+            self.assertEqual(query(unoptimized).to_list().run(), traversal.run())
+            self.assertEqual(["HasLabelToLabelScan"], traversal.rewrites)
+        self.assertEqual(
+            ["lop", "ripple"],
+            g.V().not_(has_label("Person")).values("name").to_list().run(),
+        )
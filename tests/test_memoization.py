@@ -0,0 +1,89 @@
+"""
+Created on 2026-10-19
+
+test the memoization of pure anonymous traversals
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.steps.statics import has, has_label, out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.core.traverser import Traverser
+from tests.basetest import BaseTest
+
+
+class TestMemoization(BaseTest):
+    """
+    test memoizing the results of anonymous traversals per graph element
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.graph = MogwaiGraph.modern()
+        self.g = MogwaiGraphTraversalSource(self.graph)
+        self.calls = []
+
+    def counter(self, value) -> bool:
+        """a predicate counting its calls"""
+        self.calls.append(value)
+        return True
+
+    def test_is_pure(self):
+        cases = [
+            (out().has_label("Software"), True),
+            (out().out().count(), True),
+            (out().as_("x").select("x"), False),
+            (out().path(), False),
+            (out().simple_path(), False),
+            (out().side_effect(lambda t: None), False),
+            (out().filter_(out().path()), False),
+        ]
+        for anon, expected in cases:
+            traversal = self.g.V().filter_(anon).to_list()
+            traversal.explain()
+            self.assertEqual(expected, anon.is_pure, anon.print_query())
+
+    def test_memoized(self):
+        traversers = self.g.V().both().both().count().next().run()
+        result = (
+            self.g.V()
+            .both()
+            .both()
+            .filter_(has("name", self.counter))
+            .count()
+            .next()
+            .run()
+        )
+        self.assertEqual(traversers, result)
+        # the filter ran once per distinct element, not once per traverser
+        self.assertEqual(6, len(self.calls))
+        self.assertEqual(6, len(set(self.calls)))
+        branched = (
+            self.g.V().both().order().by(out().count()).values("name").to_list().run()
+        )
+        self.assertEqual(12, len(branched))
+        self.assertEqual("marko", branched[-1])
+        untils = (
+            self.g.V()
+            .has_name("marko")
+            .repeat(out())
+            .until(has_label("Software"))
+            .values("name")
+            .to_list()
+            .run()
+        )
+        self.assertEqual({"lop", "ripple"}, set(untils))
+
+    def test_invalidation(self):
+        anon = out().has("age", self.counter)
+        traversal = self.g.V().filter_(anon).to_list()
+        traversal.explain()
+        marko = Traverser("0")
+        self.assertIsNotNone(anon.first(marko))
+        self.assertIsNotNone(anon.first(marko))
+        self.assertEqual(1, len(self.calls))
+        # lop has no age, the predicate is called with a placeholder
+        self.assertEqual(3, len(anon.results(marko)))
+        self.assertEqual(4, len(self.calls))
+        self.graph.bump_version()
+        anon.first(marko)
+        self.assertEqual(5, len(self.calls))
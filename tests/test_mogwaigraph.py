@@ -55,6 +55,50 @@ class TestMogwaiGraph(BaseTest):
         self.G.merge(G2, "0", Frodo, "Guide")
         self.G.draw(os.path.join(self.root_path, "tests", "merge_test.svg"))
 
+    def test_merge_all(self):
+        """
+        test merging several graphs in one call without intermediate copies
+        """
+        g = MogwaiGraph(config=MogwaiGraphConfig(index_config="minimal"))
+        shire = g.add_labeled_node("Place", "Shire")
+        g.add_labeled_node("Place", "Bree", node_id="1")
+        self.assertEqual(["0", "1"], g.label_index.nodes(["Place"]))
+        hobbits = []
+        for names in [("Frodo", "Sam"), ("Merry", "Pippin")]:
+            hobbit = MogwaiGraph()
+            a, b = [hobbit.add_labeled_node({"Hobbit"}, name) for name in names]
+            hobbit.add_labeled_edge(a, b, "Companion", since=3018)
+            hobbits.append(hobbit)
+        frodo_data = hobbits[0].nodes["0"]
+        mappings = g.merge_all(
+            [(hobbits[0], shire, "0", "Home"), (hobbits[1], shire, "1", "Home")],
+            copy=False,
+        )
+        # the taken id "1" is skipped
+        self.assertEqual([{"0": "2", "1": "3"}, {"0": "4", "1": "5"}], mappings)
+        self.assertIs(frodo_data, g.nodes["2"])
+        self.assertEqual({"labels": "Companion", "since": 3018}, g.edges["4", "5"])
+        self.assertIs(g.succ["4"]["5"], g.pred["5"]["4"])
+        self.assertEqual({"2", "5"}, set(g.successors(shire)))
+        self.assertEqual(["2", "3", "4", "5"], g.label_index.nodes(["Hobbit"]))
+        self.assertTrue(g.index_is_current)
+        os_lookup = g.spog_index.get_lookup("O", "S")
+        self.assertEqual({"5"}, os_lookup["Pippin"])
+        self.assertEqual({"2", "4"}, os_lookup["Companion"])
+        # by default the data is copied, so the merged graph is not changed
+        other = MogwaiGraph.modern()
+        mapping = g.merge(other, node_id=lambda n: f"modern-{n}")
+        self.assertIsNot(other.nodes["0"], g.nodes[mapping["0"]])
+        self.assertEqual(other.nodes["0"], g.nodes["modern-0"])
+        g.nodes["modern-0"]["name"] = "changed"
+        g.edges["modern-0", "modern-1"]["weight"] = 0
+        self.assertEqual("marko", other.nodes["0"]["name"])
+        self.assertEqual(0.5, other.edges["0", "1"]["weight"])
+        with self.assertRaises(MogwaiGraphError):
+            g.merge(MogwaiGraph.modern(), node_id=lambda n: f"modern-{n}")
+        with self.assertRaises(MogwaiGraphError):
+            g.merge(MogwaiGraph.modern(), node_id=lambda n: "same")
+
     def test_missing_node(self):
         print("Testing for missing edge")
         gimli = self.G.add_labeled_node(
@@ -181,3 +225,37 @@ class TestMogwaiGraph(BaseTest):
         self.assertEqual(gp_lookup.get("edge-label"), {"label"})
         self.assertEqual(gp_lookup.get("edge-name"), {"name"})
         self.assertEqual(gp_lookup.get("edge-property"), {"weight"})
+
+    def test_int_ids_and_interning(self):
+        """
+        test the int_ids option and the interning of labels and property values
+        """
+        g = MogwaiGraph(config=MogwaiGraphConfig(int_ids=True))
+        ids = [
+            g.add_labeled_node(
+                {"Character", "Dwarf"},
+                name,
+                properties={"".join(["ra", "ce"]): "".join(["dw", "arf"])},
+            )
+            for name in ("Gimli", "Gloin")
+        ]
+        self.assertEqual([0, 1], ids)
+        gimli, gloin = g.nodes[0], g.nodes[1]
+        # the label sets and the strings built at runtime are shared
+        self.assertIs(gimli["labels"], gloin["labels"])
+        self.assertEqual(frozenset({"Character", "Dwarf"}), gimli["labels"])
+        self.assertIs(gimli["race"], gloin["race"])
+        g.add_labeled_edge(0, 1, "".join(["fa", "ther"]))
+        self.assertEqual("father", g.edges[0, 1]["labels"])
+        # ids inserted explicitly are not handed out again
+        g.add_labeled_nodes_from([(2, "Dwarf", "Oin", {}), (3, "Dwarf", "Gloin", {})])
+        self.assertEqual(4, g.add_labeled_node("Dwarf", "Balin"))
+        self.assertEqual("Oin", g.nodes[2]["name"])
+        # without interning every node keeps its own copies
+        g = MogwaiGraph(config=MogwaiGraphConfig(intern_strings=False))
+        for name in ("Gimli", "Gloin"):
+            g.add_labeled_node(
+                {"Dwarf"}, name, properties={"race": "".join(["dw", "arf"])}
+            )
+        self.assertIsNot(g.nodes["0"]["race"], g.nodes["1"]["race"])
+        self.assertEqual({"Dwarf"}, g.nodes["0"]["labels"])
@@ -0,0 +1,170 @@
+"""
+Created on 2026-10-19
+
+test the shortest_path and k_hop steps
+"""
+
+import networkx
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.exceptions import QueryError
+from mogwai.core.steps.statics import has, has_label, has_not, k_hop
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class TestPathSteps(BaseTest):
+    """
+    compare the path steps with the networkx algorithms
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.modern = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+        self.graph = generate_graph(
+            200,
+            600,
+            edge_labels=2,
+            edge_properties=[PropertySpec("dist", low=1, high=100)],
+            seed=7,
+        )
+        self.g = MogwaiGraphTraversalSource(self.graph)
+
+    def weight(self, route) -> int:
+        return sum(self.graph.edges[u, v]["dist"] for u, v in zip(route, route[1:]))
+
+    def test_shortest_path(self):
+        self.assertEqual(
+            [["marko", "josh", "ripple"]],
+            self.modern.V("0").shortest_path("4", by="name").to_list().run(),
+        )
+        self.assertEqual(
+            [["0", "3", "4"]],
+            self.modern.V("0")
+            .shortest_path(has_label("Software").has("lang", "java").has_name("ripple"))
+            .to_list()
+            .run(),
+        )
+        # peter has no path to marko along outgoing edges
+        self.assertEqual([], self.modern.V("5").shortest_path("0").to_list().run())
+        self.assertEqual(
+            [["5", "2", "0"]],
+            self.modern.V("5").shortest_path("0", direction="both").to_list().run(),
+        )
+        with self.assertRaises(QueryError):
+            self.modern.V().shortest_path("0", direction="up")
+
+    def test_compare_networkx(self):
+        nodes = list(self.graph.nodes)
+        for source, target in zip(nodes[::7], nodes[::-5]):
+            try:
+                hops = networkx.shortest_path_length(self.graph, source, target)
+                dist = networkx.dijkstra_path_length(
+                    self.graph, source, target, weight="dist"
+                )
+            except networkx.NetworkXNoPath:
+                hops, dist = None, None
+            routes = self.g.V(source).shortest_path(target).to_list().run()
+            self.assertEqual(hops, len(routes[0]) - 1 if routes else None)
+            for route in [
+                self.g.V(source)
+                .shortest_path(target, by_weight="dist")
+                .to_list()
+                .run(),
+                self.g.V(source)
+                .shortest_path([target], by_weight="dist", max_hops=1000)
+                .to_list()
+                .run(),
+            ]:
+                self.assertEqual(dist, self.weight(route[0]) if route else None)
+            if hops is not None and hops > 1:
+                self.assertEqual(
+                    [],
+                    self.g.V(source)
+                    .shortest_path(target, max_hops=hops - 1)
+                    .to_list()
+                    .run(),
+                )
+                limited = (
+                    self.g.V(source)
+                    .shortest_path(target, by_weight="dist", max_hops=hops)
+                    .to_list()
+                    .run()
+                )
+                self.assertEqual(hops, len(limited[0]) - 1)
+
+    def test_filters(self):
+        label = "edge0"
+        view = networkx.subgraph_view(
+            self.graph,
+            filter_edge=lambda u, v: self.graph.edges[u, v]["labels"] == label,
+        )
+        nodes = list(self.graph.nodes)
+        for source in nodes[:20]:
+            expected = networkx.single_source_shortest_path_length(view, source)
+            for target in nodes[::11]:
+                routes = (
+                    self.g.V(source).shortest_path(target, label=label).to_list().run()
+                )
+                self.assertEqual(
+                    expected.get(target), len(routes[0]) - 1 if routes else None
+                )
+                filtered = (
+                    self.g.V(source)
+                    .shortest_path(target, edge_filter=has("labels", label))
+                    .to_list()
+                    .run()
+                )
+                self.assertEqual(routes, filtered)
+        # vertices failing the filter are not visited, the start vertex is exempt
+        routes = (
+            self.modern.V("1")
+            .shortest_path("3", direction="both", vertex_filter=has("age"))
+            .to_list()
+            .run()
+        )
+        self.assertEqual([["1", "0", "3"]], routes)
+        self.assertEqual(
+            [],
+            self.modern.V("5")
+            .shortest_path("3", direction="both", vertex_filter=has_not("lang"))
+            .to_list()
+            .run(),
+        )
+
+    def test_k_hop(self):
+        nodes = list(self.graph.nodes)
+        for source in nodes[:20]:
+            for k in [0, 1, 2, 3]:
+                expected = set(
+                    networkx.single_source_shortest_path_length(
+                        self.graph, source, cutoff=k
+                    )
+                ) - {source}
+                result = self.g.V(source).k_hop(k).id_().to_list().run()
+                self.assertEqual(len(expected), len(result))
+                self.assertEqual(expected, set(result))
+        self.assertEqual(
+            ["vadas", "josh"],
+            self.modern.V("0").k_hop(2, label="knows").values("name").to_list().run(),
+        )
+        self.assertEqual(
+            {"marko", "lop", "ripple"},
+            set(
+                self.modern.V("3")
+                .k_hop(1, direction="both")
+                .values("name")
+                .to_list()
+                .run()
+            ),
+        )
+        self.assertEqual(
+            ["lop", "ripple"],
+            self.modern.V("0")
+            .local(k_hop(2).has_label("Software"))
+            .dedup()
+            .values("name")
+            .to_list()
+            .run(),
+        )
@@ -1,4 +1,5 @@
 import os
+import pickle
 
 from mogwai.parser import PDFGraph
 from tests.basetest import BaseTest
@@ -23,3 +24,27 @@ class TestPDF(BaseTest):
             "Discussion at wrong place",
         )
         graph.draw(os.path.join(self.root_path, "tests", "pdf_test.svg"), prog="dot")
+
+    def test_pages(self):
+        """
+        test the page nodes extracted eagerly, in a process pool and lazily
+        """
+        eager = PDFGraph(self.filename, pages=True)
+        texts = [data["text"] for _, data in eager.get_nodes("PDFPage", None)]
+        self.assertEqual(5, len(texts))
+        self.assertIn("discussion", texts[2].lower())
+        parallel = PDFGraph(self.filename, pages=True, workers=2)
+        self.assertEqual(
+            texts, [data["text"] for _, data in parallel.get_nodes("PDFPage", None)]
+        )
+        lazy = PDFGraph(self.filename, pages=True, max_pages=2, lazy=True)
+        pages = lazy.get_nodes("PDFPage", None)
+        self.assertEqual(["page1", "page2"], [data["name"] for _, data in pages])
+        page = pages[1][1]
+        self.assertFalse(page.loaded)
+        # pickling keeps the text unloaded
+        copy = pickle.loads(pickle.dumps(lazy))
+        self.assertFalse(copy.nodes[pages[1][0]].loaded)
+        self.assertEqual(texts[1], page["text"])
+        self.assertTrue(page.loaded)
+        self.assertEqual(texts[1], copy.nodes[pages[1][0]].get("text"))
@@ -26,3 +26,15 @@ class TestPowerPoint(BaseTest):
         graph.draw(os.path.join(self.root_path, "tests", "pp_test.svg"), "dot")
         g = PPGraph(self.midterm)
         g.draw(os.path.join(self.root_path, "tests", "midterm.svg"), "dot")
+
+    def test_pp_lazy(self):
+        """
+        test that lazily extracted slides have the same properties
+        """
+        eager = PPGraph(self.midterm)
+        lazy = PPGraph(self.midterm, lazy=True)
+        slides = eager.get_nodes("PPPage", None)
+        self.assertGreater(len(slides), 1)
+        for node_id, data in slides:
+            self.assertFalse(lazy.nodes[node_id].loaded)
+            self.assertEqual(data, dict(lazy.nodes[node_id]))
@@ -0,0 +1,68 @@
+"""
+Created on 2026-10-19
+
+tests for the profile() step
+"""
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.profiling import TraversalMetrics
+from mogwai.core.steps.statics import both, has_label, out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestProfile(BaseTest):
+    """
+    test per-step profiling
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_profile(self):
+        # unoptimized, so that has_label is not folded into a label scan of V
+        g = MogwaiGraphTraversalSource(MogwaiGraph.modern(), optimize=False)
+        metrics = g.V().has_label("Person").out().dedup().profile().run()
+        print(metrics)
+        self.assertIsInstance(metrics, TraversalMetrics)
+        names = [step.name for step in metrics.steps]
+        self.assertEqual(["V", "Contains", "Out", "Dedup"], names)
+        v, contains, out_step, dedup = metrics.steps
+        self.assertEqual(6, v.traversers_out)
+        self.assertEqual(6, contains.traversers_in)
+        self.assertEqual(4, contains.traversers_out)
+        self.assertEqual(6, out_step.traversers_out)
+        self.assertEqual(4, dedup.traversers_out)
+        self.assertAlmostEqual(100, sum(step.percent for step in metrics.steps), 5)
+        self.assertGreater(metrics.duration, 0)
+        self.assertIn("Dedup", str(metrics))
+
+    def test_profile_anonymous_traversals(self):
+        metrics = (
+            self.g.V()
+            .filter_(out("created").has_label("Software"))
+            .repeat(both(), times=2)
+            .profile()
+            .run()
+        )
+        print(metrics)
+        filter_step = metrics.steps[1]
+        self.assertEqual(["Out", "Contains"], [c.name for c in filter_step.children])
+        # the filter body is invoked once per traverser
+        self.assertEqual(6, filter_step.children[0].calls)
+        self.assertEqual(3, filter_step.traversers_out)
+        repeat_step = metrics.steps[2]
+        self.assertEqual(["Both"], [c.name for c in repeat_step.children])
+        self.assertEqual(2, repeat_step.children[0].calls)
+        self.assertGreaterEqual(repeat_step.time, repeat_step.children[0].time)
+        as_dict = metrics.to_dict()
+        self.assertEqual(3, len(as_dict["steps"]))
+        depths = [depth for depth, _ in metrics.flatten()]
+        self.assertEqual([0, 0, 1, 1, 0, 1], depths)
+
+    def test_profile_not_anonymous(self):
+        from mogwai.core.exceptions import QueryError
+
+        with self.assertRaises(QueryError):
+            has_label("Person").profile()
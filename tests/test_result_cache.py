@@ -0,0 +1,132 @@
+"""
+Created on 2026-10-19
+
+test the graph version and the result cache of traversal sources
+"""
+
+import gc
+import time
+import weakref
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.result_cache import ResultCache
+from mogwai.core.steps.statics import out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestResultCache(BaseTest):
+    """
+    test caching traversal results
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.graph = MogwaiGraph.modern()
+        self.g = MogwaiGraphTraversalSource(self.graph).with_result_cache()
+
+    def test_graph_version(self):
+        graph = MogwaiGraph()
+        versions = [graph.version]
+        a = graph.add_labeled_node("Person", "a")
+        b = graph.add_labeled_node("Person", "b")
+        versions.append(graph.version)
+        graph.add_labeled_edge(a, b, "knows")
+        versions.append(graph.version)
+        graph.add_labeled_nodes_from([("c", "Person", "c", {})])
+        versions.append(graph.version)
+        graph.merge(MogwaiGraph.modern(), a, "1", "likes")
+        versions.append(graph.version)
+        graph.remove_edge(a, b)
+        versions.append(graph.version)
+        graph.remove_node("c")
+        versions.append(graph.version)
+        graph.bump_version()
+        versions.append(graph.version)
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_hits(self):
+        query = lambda: self.g.V().has_label("Person").out("knows")
+        first = query().values("name").to_list().run()
+        second = query().values("name").to_list().run()
+        self.assertEqual(first, second)
+        # the cached result is copied
+        second.append("nobody")
+        self.assertEqual(first, query().values("name").to_list().run())
+        self.assertEqual(2, self.g.result_cache.hits)
+        self.assertEqual(1, self.g.result_cache.misses)
+        # different arguments and anonymous traversals are different keys
+        self.assertEqual(
+            ["josh"], query().has("age", 32).values("name").to_list().run()
+        )
+        self.assertEqual(
+            ["marko", "josh", "peter"],
+            self.g.V()
+            .filter_(out().has_label("Software"))
+            .values("name")
+            .to_list()
+            .run(),
+        )
+        self.assertEqual(
+            ["marko"],
+            self.g.V()
+            .filter_(out().has_label("Person"))
+            .values("name")
+            .to_list()
+            .run(),
+        )
+        self.assertEqual(4, len(self.g.result_cache))
+
+    def test_invalidation(self):
+        count = lambda: self.g.V().has_label("Person").count().next().run()
+        self.assertEqual(4, count())
+        self.g.addV("Person", "ann").next().run()
+        self.assertEqual(5, count())
+        ages = lambda: self.g.V().has_label("Person").values("age").to_list().run()
+        self.assertEqual([29, 27, 32, 35], ages())
+        self.g.V().has_label("Person").property("age", 1).iterate().run()
+        self.assertEqual([1, 1, 1, 1, 1], ages())
+        self.assertEqual(0, self.g.result_cache.hits)
+
+    def test_uncacheable(self):
+        result = self.g.V().values("name").iter().run()
+        self.assertEqual(6, len(list(result)))
+        self.g.V().side_effect(lambda t: None).iterate().run()
+        self.g.V().values("name").run()
+        self.assertEqual(0, len(self.g.result_cache))
+
+    def test_eviction(self):
+        cache = ResultCache(max_size=2, ttl=0.05)
+        g = MogwaiGraphTraversalSource(self.graph, result_cache=cache)
+        for name in ["marko", "vadas", "josh", "marko"]:
+            g.V().has_name(name).count().next().run()
+        self.assertEqual(
+            {"hits": 0, "misses": 4, "evictions": 2, "size": 2}, cache.stats()
+        )
+        g.V().has_name("marko").count().next().run()
+        self.assertEqual(1, cache.hits)
+        time.sleep(0.06)
+        g.V().has_name("marko").count().next().run()
+        self.assertEqual(1, cache.hits)
+        with self.assertRaises(ValueError):
+            ResultCache(max_size=0)
+
+    def test_shared_cache(self):
+        cache = ResultCache()
+
+        def count(names):
+            graph = MogwaiGraph()
+            graph.add_labeled_nodes_from((name, "Person", name, {}) for name in names)
+            g = MogwaiGraphTraversalSource(graph, result_cache=cache)
+            query = g.V().count().next()
+            key = query._cache_key()
+            self.assertIs(graph, key[0]())
+            return query.run(), weakref.ref(graph)
+
+        # graphs at the same version do not share results
+        self.assertEqual((1, 2), (count(["a"])[0], count(["a", "b"])[0]))
+        # the cache does not keep the graphs alive
+        _, graph = count(["a", "b", "c"])
+        gc.collect()
+        self.assertIsNone(graph())
+        self.assertEqual(3, len(cache))
@@ -0,0 +1,112 @@
+"""
+Created on 2026-10-19
+
+test rewriting filter_ and not_ into semi joins and anti joins
+"""
+
+from mogwai.core import MogwaiGraph, MogwaiGraphConfig
+from mogwai.core.steps.filter_steps import Filter, SemiJoin
+from mogwai.core.steps.statics import both, has, has_label, in_, out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from mogwai.examples.generators import PropertySpec, generate_graph
+from tests.basetest import BaseTest
+
+
+class TestSemiJoin(BaseTest):
+    """
+    compare semi joins with evaluating the predicates per traverser
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.queries = [
+            lambda g: g.V().out().filter_(out().has("code", "code3")).count().next(),
+            lambda g: g.V()
+            .filter_(has_label("A").out("edge1").has_label("B"))
+            .id_()
+            .to_list(),
+            lambda g: g.V()
+            .both()
+            .not_(in_().out().has("code", "code1"))
+            .count()
+            .next(),
+            lambda g: g.V().filter_(both().has_label("A")).not_(out()).count().next(),
+            lambda g: g.V()
+            .out()
+            .dedup()
+            .filter_(out().has("code", "code2").out())
+            .id_()
+            .to_list(),
+        ]
+
+    def graph(self, index_config: str = "off") -> MogwaiGraph:
+        return generate_graph(
+            300,
+            1500,
+            vertex_labels=["A", "B"],
+            edge_labels=2,
+            vertex_properties=[PropertySpec("code", "str", cardinality=10)],
+            config=MogwaiGraphConfig(index_config=index_config),
+        )
+
+    def check_same(self, graph: MogwaiGraph):
+        joined = 0
+        for query in self.queries:
+            expected = query(MogwaiGraphTraversalSource(graph, optimize=False)).run()
+            traversal = query(MogwaiGraphTraversalSource(graph))
+            result = traversal.run()
+            if self.debug:
+                print(traversal.print_query(), result)
+            self.assertEqual(expected, result)
+            joins = [s for s in traversal.query_steps if isinstance(s, SemiJoin)]
+            self.assertTrue(joins)
+            self.assertFalse(any(isinstance(s, Filter) for s in traversal.query_steps))
+            joined += any(join.members is not None for join in joins)
+        # the predicates are evaluated as a set for large frontiers
+        self.assertGreaterEqual(joined, 3)
+
+    def test_same_results(self):
+        self.check_same(self.graph())
+
+    def test_index(self):
+        graph = self.graph("minimal")
+        g = MogwaiGraphTraversalSource(graph)
+        explanation = g.V().filter_(out().has("code", "code3")).to_list().explain()
+        self.assertIn("index: OS", str(explanation))
+        self.check_same(graph)
+        # the index does not know about changed properties
+        g.V().has("code", "code4").property("code", "code3").iterate().run()
+        self.assertFalse(graph.index_is_current)
+        self.assertNotIn(
+            "index: OS", str(g.V().filter_(out().has("code", "code3")).explain())
+        )
+        self.check_same(graph)
+
+    def test_not_rewritten(self):
+        g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+        for query in [
+            g.V().filter_(out().values("name")),
+            g.V().filter_(out().simple_path()),
+            g.V().filter_(has("age")),
+        ]:
+            query.explain()
+            self.assertNotIn("FilterToSemiJoin", query.rewrites)
+        query = g.V().filter_(out().has_label("Software")).values("name").to_list()
+        self.assertEqual(["marko", "josh", "peter"], query.run())
+        self.assertEqual(["FilterToSemiJoin"], query.rewrites)
+
+    def test_nested_key(self):
+        graph = MogwaiGraph(config=MogwaiGraphConfig(index_config="all"))
+        target = graph.add_labeled_node("Target", "target", info={"x": 5})
+        graph.add_labeled_nodes_from(
+            (node, "Source", f"source{node}", {}) for node in range(1, 301)
+        )
+        graph.add_labeled_edges_from((node, target, "to", {}) for node in range(1, 301))
+        g = MogwaiGraphTraversalSource(graph)
+        # the nested property has no quad in the OS index
+        self.assertEqual(
+            300, g.V().filter_(out("to").has(["info", "x"], 5)).count().next().run()
+        )
+        self.assertEqual(
+            1, g.V().not_(out("to").has(["info", "x"], 5)).count().next().run()
+        )
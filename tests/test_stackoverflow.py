@@ -41,6 +41,39 @@ class TestSpogJoin(BaseTest):
         if self.debug:
             self.show_indices(graph.spog_index)
 
+    def test_hash_join(self):
+        """Test the hash join with several matches per node on either side"""
+        for customers, orders in [(2, 5), (5, 2)]:
+            graph = MogwaiGraph(config=MogwaiGraphConfig(index_config="minimal"))
+            for i in range(customers):
+                graph.add_labeled_node("Customer", f"c{i}", {"cid": i % 2})
+            for i in range(orders):
+                graph.add_labeled_node("Order", f"o{i}", {"customer": i % 3})
+            # orders without the join field are skipped
+            graph.add_labeled_node("Order", "unassigned")
+            created = graph.join(
+                "Order", "Customer", "customer", "cid", "placed_by", {"source": "join"}
+            )
+            expected = {
+                (f"o{o}", f"c{c}")
+                for o in range(orders)
+                for c in range(customers)
+                if o % 3 == c % 2
+            }
+            names = lambda n: graph.nodes[n]["name"]
+            edges = {(names(s), names(d)) for s, d in graph.edges}
+            self.assertEqual(expected, edges)
+            self.assertEqual(len(expected), created)
+            self.assertEqual(
+                {"labels": "placed_by", "source": "join"},
+                next(iter(graph.edges.values())),
+            )
+            # the edges are in the SPOG index
+            self.assertEqual(
+                {s for s, _ in graph.edges},
+                graph.spog_index.get_lookup("P", "S")["placed_by"],
+            )
+
     def show_indices(self, spog_index, limit=3):
         """Show SPOG index contents"""
         for index_name in spog_index.config.active_indices:
@@ -0,0 +1,80 @@
+"""
+Created on 2026-10-19
+
+test the structured tracing of traversals
+"""
+
+import logging
+
+from mogwai.core import MogwaiGraph
+from mogwai.core.steps.statics import out
+from mogwai.core.traversal import MogwaiGraphTraversalSource
+from tests.basetest import BaseTest
+
+
+class TestTracing(BaseTest):
+    """
+    test Traversal.with_trace
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.g = MogwaiGraphTraversalSource(MogwaiGraph.modern())
+
+    def test_trace(self):
+        query = (
+            lambda: self.g.V()
+            .has_label("Person")
+            .order()
+            .by(out().count())
+            .values("name")
+        )
+        traversal = query().to_list().with_trace()
+        self.assertEqual(query().to_list().run(), traversal.run())
+        events = list(traversal.tracer.events)
+        steps = {event.step for event in events if event.depth == 0}
+        self.assertIn("Values", steps)
+        # the anonymous traversal is invoked once per person
+        nested = [
+            e for e in events if e.depth == 1 and e.kind == "exit" and e.step == "Count"
+        ]
+        self.assertEqual(4, len(nested))
+        self.assertEqual(
+            len([e for e in events if e.kind == "enter"]),
+            len([e for e in events if e.kind == "exit"]),
+        )
+        values = [e for e in events if e.step == "Values" and e.kind == "exit"][0]
+        self.assertEqual(4, values.traversers)
+        slowest = traversal.tracer.slowest(3)
+        self.assertEqual(3, len(slowest))
+        self.assertGreaterEqual(slowest[0].duration, slowest[-1].duration)
+        if self.debug:
+            print(traversal.tracer)
+
+    def test_ring_buffer(self):
+        traversal = self.g.V().filter_(out().out()).to_list().with_trace(capacity=5)
+        self.assertEqual(["0"], traversal.run())
+        self.assertEqual(5, len(traversal.tracer.events))
+        self.assertGreater(traversal.tracer.dropped, 0)
+        self.assertIn("earlier events dropped", traversal.tracer.format())
+        # without with_trace nothing is recorded
+        traversal = self.g.V().filter_(out().out()).to_list()
+        traversal.run()
+        self.assertIsNone(traversal.tracer)
+
+    def test_batches(self):
+        g = MogwaiGraphTraversalSource(MogwaiGraph.modern(), batch_size=2)
+        traversal = g.V().out().values("name").to_list().with_trace()
+        self.assertEqual(6, len(traversal.run()))
+        exits = {
+            e.step: e.traversers for e in traversal.tracer.events if e.kind == "exit"
+        }
+        # the number of batches produced by each step
+        self.assertEqual({"V": 3, "Out": 3, "Values": 3}, exits)
+
+    def test_debug_logging(self):
+        with self.assertLogs("Mogwai", level=logging.DEBUG) as logs:
+            self.g.V().filter_(out()).count().next().run()
+        self.assertTrue(
+            any("Running step in anonymous traversal" in line for line in logs.output)
+        )